@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks of the trajectory analysis functions
+"""
+
+import kineticsPy as kpy
+from . import fixtures
+
+
+class TimeEquilibriumState:
+	"""
+	Equilibrium state of single trajectories and of trajectory batches
+	"""
+
+	params = [[100, 10000], [10, 100]]
+	param_names = ['time_steps', 'n_species']
+
+	def setup(self, time_steps, n_species):
+		self.trajectories = [fixtures.synthetic_trajectory(100000, n_species, seed=i) for i in range(20)]
+
+	def time_equilibrium_state(self, time_steps, n_species):
+		kpy.equilibrium_state(self.trajectories[0], time_steps=time_steps, reltol=1.0)
+
+	def time_equilibrium_states_batch(self, time_steps, n_species):
+		kpy.equilibrium_states(self.trajectories, time_steps=time_steps)
+
+	def time_equilibrium_state_composition(self, time_steps, n_species):
+		kpy.equilibrium_state_composition(self.trajectories[0], time_steps=time_steps, reltol=1.0)
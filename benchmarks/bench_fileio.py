@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks of trajectory file input and output: IDSimF RS result files and binary trajectory stores
+
+The RS result files are generated once per size in a temporary directory.
+"""
+
+import os
+import tempfile
+import numpy as np
+import kineticsPy as kpy
+from . import fixtures
+
+
+class TimeReadIdsimfRsResult:
+	"""
+	Reading of complete and selected IDSimF RS result files
+	"""
+
+	params = [[10000, 200000], [10, 50]]
+	param_names = ['n_timesteps', 'n_species']
+
+	def setup(self, n_timesteps, n_species):
+		self.rs_file = fixtures.rs_result_file(n_timesteps, n_species)
+
+	def time_read_full(self, n_timesteps, n_species):
+		kpy.read_idsimf_rs_result(self.rs_file)
+
+	def time_read_species_subset(self, n_timesteps, n_species):
+		kpy.read_idsimf_rs_result(self.rs_file, species=['Cl_1', 'Cl_2'])
+
+	def time_read_time_range(self, n_timesteps, n_species):
+		# the first tenth of the fixture time span (0 to 1e-3 s), reading stops at the end of the range:
+		kpy.read_idsimf_rs_result(self.rs_file, time_range=(0.0, 1e-4))
+
+
+class TimeTrajectoryStore:
+	"""
+	Writing and (memory mapped) reading of binary trajectory stores
+	"""
+
+	params = [100000, 1000000]
+	param_names = ['n_timesteps']
+
+	def setup(self, n_timesteps):
+		self.trajectory = fixtures.synthetic_trajectory(n_timesteps, 20)
+		self.tmp_dir = tempfile.TemporaryDirectory()
+		self.store_path = os.path.join(self.tmp_dir.name, 'store')
+		kpy.write_trajectory_store(self.trajectory, self.store_path)
+
+	def teardown(self, n_timesteps):
+		self.tmp_dir.cleanup()
+
+	def time_write_store(self, n_timesteps):
+		kpy.write_trajectory_store(self.trajectory, os.path.join(self.tmp_dir.name, 'written_store'))
+
+	def time_read_store_memory_mapped(self, n_timesteps):
+		tra = kpy.read_trajectory_store(self.store_path)
+		np.max(tra.loc['S_1'])
+
+	def time_read_store_in_memory(self, n_timesteps):
+		kpy.read_trajectory_store(self.store_path, memory_mapped=False)
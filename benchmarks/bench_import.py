@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks of the package import
+
+The benchmarks are written in the style of airspeed velocity (asv): Methods starting with ``time_`` are timed
+(see :py:mod:`benchmarks.run` for running the benchmarks without asv).
+"""
+
+import sys
+import subprocess
+
+
+def _run_import(statements):
+	"""
+	Runs import statements in a fresh interpreter, the measured time includes the start of the interpreter
+	"""
+	subprocess.run([sys.executable, '-c', statements], check=True)
+
+
+class TimeImport:
+	"""
+	Import of the base package (without the lazily loaded plotting and Cantera subpackages) vs. the import with
+	plotting and Cantera subpackages
+	"""
+
+	def time_import_base(self):
+		_run_import('import kineticsPy')
+
+	def time_import_full(self):
+		_run_import('import kineticsPy\nkineticsPy.plot\nkineticsPy.cantera.simulate_isobar_adiabatic')
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks of the concentration / time profile plots, including rendering into an image
+
+The plots are rendered with the Agg backend.
+"""
+
+import io
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import kineticsPy as kpy
+from . import fixtures
+
+
+class TimePlot:
+	"""
+	Concentration / time profile plots with and without decimation of the plotted samples
+	"""
+
+	params = [[10000, 1000000], [True, False]]
+	param_names = ['n_timesteps', 'decimate']
+
+	def setup(self, n_timesteps, decimate):
+		self.trajectory = fixtures.synthetic_trajectory(n_timesteps, 10)
+
+	def teardown(self, n_timesteps, decimate):
+		plt.close('all')
+
+	def time_plot(self, n_timesteps, decimate):
+		fig = kpy.plot(self.trajectory, decimate=decimate)
+		fig.savefig(io.BytesIO(), format='png')
+		plt.close(fig)
+
+	def time_plot_normalized_log(self, n_timesteps, decimate):
+		fig = kpy.plot(self.trajectory, normalized='species', log='time', decimate=decimate)
+		fig.savefig(io.BytesIO(), format='png')
+		plt.close(fig)
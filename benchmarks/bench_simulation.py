@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks of the Cantera simulation interface
+
+The benchmarks are written in the style of airspeed velocity (asv): Methods starting with ``time_`` are timed,
+``setup`` prepares the benchmark (see :py:mod:`benchmarks.run` for running the benchmarks without asv).
+"""
+
+import numpy as np
+import kineticsPy.cantera.simulation as sim
+from kineticsPy.cantera.mechanism import load_mechanism
+from kineticsPy.cantera.batch import simulate_isobar_adiabatic_batch
+from kineticsPy.cantera.massaction import simulate_mass_action, simulate_mass_action_batch
+from .fixtures import water_cluster_input, initial_mole_fractions
+
+
+class TimeStepModes:
+	"""
+	Fixed step simulation (one solver call per time step) vs. solver controlled internal time steps
+	"""
+
+	params = [10000, 100000]
+	param_names = ['n_steps']
+
+	def setup(self, n_steps):
+		# parse the input file once, the benchmark should measure the integration only:
+		sim.simulate_isobar_adiabatic(water_cluster_input, initial_mole_fractions, 10, 2e-9, 1e5)
+
+	def time_fixed_steps(self, n_steps):
+		sim.simulate_isobar_adiabatic(water_cluster_input, initial_mole_fractions, n_steps, 2e-9, 1e5)
+
+	def time_integrator_steps(self, n_steps):
+		sim.simulate_isobar_adiabatic(
+			water_cluster_input, initial_mole_fractions, n_steps, 2e-9, 1e5, integrator_steps=True)
+
+
+class TimeConcentrationRecording:
+	"""
+	Per step cost of reading the species concentrations of a reactor into the recording buffer: Lookup of a species
+	subset view by name (the former recording path) vs. direct write of all concentrations into the buffer row
+	"""
+
+	params = [10000]
+	param_names = ['n_reads']
+
+	def setup(self, n_reads):
+		mechanism = load_mechanism(water_cluster_input)
+		self.sim, self.reac = sim._setup_simulation(mechanism, initial_mole_fractions, 1e5, None)
+		self.sim.advance(1e-6)
+		self.species_names = mechanism.species_names
+		self.data = np.zeros((n_reads, len(self.species_names)))
+
+	def time_species_subset_lookup(self, n_reads):
+		for i in range(n_reads):
+			self.data[i, :] = self.reac.phase[self.species_names].concentrations * 6.022E20
+
+	def time_direct_buffer_write(self, n_reads):
+		thermo = self.reac.phase
+		for i in range(n_reads):
+			np.multiply(thermo.concentrations, 6.022E20, out=self.data[i])
+
+
+class TimeBatchedSimulation:
+	"""
+	A set of simulations with different initial compositions: N serial simulation runs vs. batches of reactors
+	integrated together in one reactor network
+	"""
+
+	params = [[1, 10, 50], [10000]]
+	param_names = ['n_cases', 'n_steps']
+
+	def setup(self, n_cases, n_steps):
+		self.mole_fractions = ['H2O:{:e}, N2:2.54e+17, H3O+:1e+10'.format(2.5e14 * (1.0 + i / n_cases))
+		                       for i in range(n_cases)]
+		sim.simulate_isobar_adiabatic(water_cluster_input, initial_mole_fractions, 10, 2e-9, 1e5)
+
+	def time_serial(self, n_cases, n_steps):
+		for mole_fractions in self.mole_fractions:
+			sim.simulate_isobar_adiabatic(water_cluster_input, mole_fractions, n_steps, 2e-9, 1e5)
+
+	def time_batched(self, n_cases, n_steps):
+		simulate_isobar_adiabatic_batch(water_cluster_input, self.mole_fractions, n_steps, 2e-9, 1e5)
+
+
+class TimeReactorModes:
+	"""
+	Simulations in the different reactor modes (with and without energy equation and pressure control)
+	"""
+
+	params = [list(sim.REACTOR_MODES), [10000]]
+	param_names = ['reactor_mode', 'n_steps']
+
+	def setup(self, reactor_mode, n_steps):
+		self.mechanism = load_mechanism(water_cluster_input)
+
+	def time_simulation(self, reactor_mode, n_steps):
+		sim._run_simulation(self.mechanism, initial_mole_fractions, n_steps, 2e-9, None, 1e5,
+		                    reactor_mode=reactor_mode)
+
+
+class TimeMassActionKinetics:
+	"""
+	Isochoric, isothermal simulation with a Cantera reactor network vs. the built-in mass action kinetics engine
+	"""
+
+	params = [10000, 100000]
+	param_names = ['n_steps']
+
+	def setup(self, n_steps):
+		sim.simulate_isochoric_isothermal(water_cluster_input, initial_mole_fractions, 10, 2e-9, 1e5)
+
+	def time_cantera(self, n_steps):
+		sim.simulate_isochoric_isothermal(water_cluster_input, initial_mole_fractions, n_steps, 2e-9, 1e5)
+
+	def time_mass_action(self, n_steps):
+		simulate_mass_action(water_cluster_input, initial_mole_fractions, n_steps, 2e-9, 1e5)
+
+
+class TimeMassActionBatch:
+	"""
+	A set of parameter sets (rate multipliers of the first reaction) with the mass action kinetics engine: N serial
+	simulation runs vs. all cases integrated together in one solver run
+	"""
+
+	params = [[10, 100], [10000]]
+	param_names = ['n_cases', 'n_steps']
+
+	def setup(self, n_cases, n_steps):
+		self.multipliers = np.ones((n_cases, 8))
+		self.multipliers[:, 0] = np.linspace(0.5, 2.0, n_cases)
+		simulate_mass_action(water_cluster_input, initial_mole_fractions, 10, 2e-9, 1e5)
+
+	def time_serial(self, n_cases, n_steps):
+		for multipliers in self.multipliers:
+			simulate_mass_action(water_cluster_input, initial_mole_fractions, n_steps, 2e-9, 1e5,
+			                     rate_multipliers=multipliers)
+
+	def time_batched(self, n_cases, n_steps):
+		simulate_mass_action_batch(water_cluster_input, initial_mole_fractions, n_steps, 2e-9, 1e5,
+		                           rate_multipliers=self.multipliers)
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks of the kinetic trajectory class: Construction and data access
+"""
+
+import kineticsPy as kpy
+from . import fixtures
+
+
+class TimeTrajectory:
+	"""
+	Construction of trajectories from arrays and species / time step access with ``loc``
+	"""
+
+	params = [[10000, 1000000], [10, 100]]
+	param_names = ['n_timesteps', 'n_species']
+
+	def setup(self, n_timesteps, n_species):
+		self.times, self.data = fixtures.synthetic_data(n_timesteps, n_species)
+		self.species_names = ['S_' + str(i) for i in range(n_species)]
+		self.trajectory = kpy.Trajectory(self.species_names, self.times, self.data)
+		self.chunks = [kpy.Trajectory(self.species_names, self.times[i:i + n_timesteps // 10],
+		                              self.data[i:i + n_timesteps // 10])
+		               for i in range(0, n_timesteps, n_timesteps // 10)]
+
+	def time_construction(self, n_timesteps, n_species):
+		kpy.Trajectory(self.species_names, self.times, self.data)
+
+	def time_loc_single_species(self, n_timesteps, n_species):
+		self.trajectory.loc['S_1']
+
+	def time_loc_species_list_time_range(self, n_timesteps, n_species):
+		self.trajectory.loc[['S_1', 'S_2', 'S_3'], n_timesteps // 4:n_timesteps // 2]
+
+	def time_loc_single_time_step(self, n_timesteps, n_species):
+		self.trajectory.loc[self.species_names, n_timesteps // 2]
+
+	def time_concatenate(self, n_timesteps, n_species):
+		kpy.concatenate_trajectories(self.chunks)
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark fixtures: Synthetic trajectories and generated input files of different sizes
+"""
+
+import os
+import tempfile
+import numpy as np
+import kineticsPy as kpy
+
+water_cluster_input = os.path.join(
+	os.path.dirname(__file__), '..', 'test', 'test_inputs', 'WaterCluster_RoomTemp.cti')
+initial_mole_fractions = 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10'
+
+_fixture_dir = os.path.join(tempfile.gettempdir(), 'kineticsPy_benchmark_fixtures')
+
+
+def synthetic_trajectory(n_timesteps, n_species, seed=0):
+	"""
+	Generates a synthetic trajectory with exponentially relaxing, noisy species concentrations
+	"""
+	times, data = synthetic_data(n_timesteps, n_species, seed)
+	species_names = ['S_' + str(i) for i in range(n_species)]
+	return kpy.Trajectory(species_names, times, data)
+
+
+def synthetic_data(n_timesteps, n_species, seed=0):
+	"""
+	Generates the times and concentrations of a synthetic trajectory
+	"""
+	rng = np.random.default_rng(seed)
+	times = np.linspace(0, 1e-3, n_timesteps)
+	rates = np.geomspace(1e3, 1e5, n_species)
+	data = 1e10 * (1.0 - np.exp(-np.outer(times, rates)))
+	data *= 1.0 + 1e-3 * rng.standard_normal(data.shape)
+	return times, data
+
+
+def rs_result_file(n_timesteps, n_species):
+	"""
+	Returns the path of a generated IDSimF RS result file, the file is generated on first use
+	"""
+	os.makedirs(_fixture_dir, exist_ok=True)
+	file_path = os.path.join(_fixture_dir, 'rs_{}_{}.txt'.format(n_timesteps, n_species))
+	if os.path.isfile(file_path):
+		return file_path
+
+	times, data = synthetic_data(n_timesteps, n_species)
+	table = np.column_stack((np.arange(n_timesteps) * 200, times, np.round(data / 1e6)))
+	header = ' ; '.join(['Timestep', 'Time'] + ['Cl_' + str(i + 1) for i in range(n_species)]) + ' ;'
+
+	tmp_path = file_path + '.tmp'
+	with open(tmp_path, 'w') as f:
+		f.write('RS C++ result\n' + header + '\n')
+		np.savetxt(f, table, fmt=['%d', '%g'] + ['%d'] * n_species, delimiter=' ; ', newline=' ;\n')
+	os.replace(tmp_path, file_path)
+
+	return file_path
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+"""
+Runner of the benchmark suite without airspeed velocity (asv)
+
+Runs the asv style benchmarks of all benchmark modules (``bench_*.py``), prints the best wall times and stores the
+results as json file in ``benchmarks/results/<machine>/<commit>.json``. Stored results of an earlier version
+can be compared with the current results to detect performance regressions:
+
+.. code-block:: shell
+
+	python -m benchmarks.run --save
+	python -m benchmarks.run --save --compare benchmarks/results/<machine>/<earlier commit>.json
+	python -m benchmarks.run -b TimeTrajectory -b TimePlot
+
+The suite can also be run with asv (see ``asv.conf.json`` in the repository root).
+"""
+
+import os
+import sys
+import json
+import time
+import timeit
+import socket
+import argparse
+import platform
+import itertools
+import importlib
+import subprocess
+
+_benchmark_dir = os.path.dirname(os.path.abspath(__file__))
+_benchmark_modules = ['bench_simulation', 'bench_fileio', 'bench_trajectory', 'bench_analysis', 'bench_plotting',
+                      'bench_import']
+
+
+def benchmark_classes(patterns=None):
+	"""
+	Collects the benchmark classes of all benchmark modules, optionally filtered by name patterns
+	"""
+	classes = []
+	for module_name in _benchmark_modules:
+		module = importlib.import_module('benchmarks.' + module_name)
+		for name in sorted(dir(module)):
+			obj = getattr(module, name)
+			if name.startswith('Time') and isinstance(obj, type):
+				if patterns is None or any(p in module_name + '.' + name for p in patterns):
+					classes.append(obj)
+	return classes
+
+
+def run_benchmark_class(benchmark_class, repeat=3):
+	"""
+	Runs all timing methods of an asv style benchmark class for all parameter combinations and returns the best
+	wall times (a dict with benchmark names as keys)
+	"""
+	params = getattr(benchmark_class, 'params', [None])
+	if params and isinstance(params[0], list):
+		param_sets = list(itertools.product(*params))
+	else:
+		param_sets = [(p,) for p in params]
+
+	results = {}
+	benchmark = benchmark_class()
+	timing_methods = sorted(m for m in dir(benchmark) if m.startswith('time_'))
+	for param_set in param_sets:
+		args = () if param_set == (None,) else param_set
+		if hasattr(benchmark, 'setup'):
+			benchmark.setup(*args)
+		try:
+			for method in timing_methods:
+				bench_fct = getattr(benchmark, method)
+				wall_time = min(timeit.repeat(lambda: bench_fct(*args), number=1, repeat=repeat))
+				name = '{}.{}({})'.format(benchmark_class.__name__, method, ', '.join(str(a) for a in args))
+				results[name] = wall_time
+				print('{:<80} {:>12.4f} s'.format(name, wall_time))
+		finally:
+			if hasattr(benchmark, 'teardown'):
+				benchmark.teardown(*args)
+
+	return results
+
+
+def compare_results(reference, current, threshold=1.2):
+	"""
+	Compares two sets of benchmark results and returns the benchmarks which are slower than the reference by more
+	than ``threshold`` (a list of tuples of benchmark name, reference time and current time)
+	"""
+	regressions = []
+	for name, current_time in current.items():
+		reference_time = reference.get(name)
+		if reference_time is not None and current_time > threshold * reference_time:
+			regressions.append((name, reference_time, current_time))
+	return regressions
+
+
+def _git_commit():
+	"""
+	Returns the current git commit of the repository (or 'unknown' outside of a git repository)
+	"""
+	try:
+		return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=_benchmark_dir, capture_output=True,
+		                      text=True, check=True).stdout.strip()
+	except (OSError, subprocess.CalledProcessError):
+		return 'unknown'
+
+
+def _environment():
+	"""
+	Describes the benchmark environment (machine and versions of the main dependencies)
+	"""
+	import numpy
+	import pandas
+	import matplotlib
+	env = {
+		'machine': socket.gethostname(),
+		'platform': platform.platform(),
+		'python': platform.python_version(),
+		'numpy': numpy.__version__,
+		'pandas': pandas.__version__,
+		'matplotlib': matplotlib.__version__}
+	try:
+		import cantera
+		env['cantera'] = cantera.__version__
+	except ImportError:
+		env['cantera'] = None
+	return env
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description='Runs the kineticsPy benchmark suite')
+	parser.add_argument('-b', '--bench', action='append', help='Run only benchmarks matching this name pattern')
+	parser.add_argument('--repeat', type=int, default=3, help='Number of repetitions of every benchmark')
+	parser.add_argument('--save', action='store_true', help='Store the results in benchmarks/results')
+	parser.add_argument('--compare', help='Results file of an earlier run to compare with')
+	parser.add_argument('--threshold', type=float, default=1.2,
+	                    help='Slowdown factor which is reported as regression')
+	args = parser.parse_args(argv)
+
+	results = {}
+	for benchmark_class in benchmark_classes(args.bench):
+		results.update(run_benchmark_class(benchmark_class, repeat=args.repeat))
+
+	env = _environment()
+	if args.save:
+		commit = _git_commit()
+		result_dir = os.path.join(_benchmark_dir, 'results', env['machine'])
+		os.makedirs(result_dir, exist_ok=True)
+		result_file = os.path.join(result_dir, commit + '.json')
+		with open(result_file, 'w') as f:
+			json.dump({'commit': commit, 'date': time.strftime('%Y-%m-%dT%H:%M:%S'), 'environment': env,
+			           'results': results}, f, indent=1, sort_keys=True)
+		print('results stored in ' + result_file)
+
+	if args.compare:
+		with open(args.compare, 'r') as f:
+			reference = json.load(f)['results']
+		regressions = compare_results(reference, results, args.threshold)
+		for name, reference_time, current_time in regressions:
+			print('REGRESSION {:<69} {:>10.4f} s -> {:>10.4f} s'.format(name, reference_time, current_time))
+		if regressions:
+			return 1
+
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
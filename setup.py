@@ -21,5 +21,5 @@ setuptools.setup(
         "Operating System :: OS Independent",
     ],
     python_requires='>=3.6',
-    install_requires=['numpy', 'matplotlib', 'pandas', 'cantera']
+    install_requires=['numpy', 'scipy', 'matplotlib', 'pandas', 'cantera']
 )
@@ -2,13 +2,31 @@
 
 """
 Analysis, visualization, automation and helper modules for chemical kinetics simulations
+
+The plotting functions (which require matplotlib) and the cantera package (which requires Cantera) are imported
+lazily on first access, thus importing kineticsPy in processes which only read or analyze trajectories stays cheap.
 """
 
+import importlib
+
 from . import base
 from . import analysis
-from . import cantera
 
 from .base import *
-from .analysis import *
+# the analysis functions are imported from the analysis module directly, a star import of the analysis package
+# would import the lazily loaded plotting functions:
+from .analysis.analysis import *
 
 __all__ = ['base', 'cantera', 'analysis']
+
+
+def __getattr__(name):
+	if name == 'cantera':
+		return importlib.import_module('.cantera', __name__)
+	if name in analysis.VISUALIZATION_ATTRIBUTES:
+		return getattr(analysis, name)
+	raise AttributeError('module ' + repr(__name__) + ' has no attribute ' + repr(name))
+
+
+def __dir__():
+	return sorted(set(globals()) | {'cantera'} | set(analysis.VISUALIZATION_ATTRIBUTES))
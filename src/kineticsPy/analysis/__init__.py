@@ -2,7 +2,31 @@
 
 """
 Simulation analysis / visualization
+
+The visualization module (and thereby matplotlib) is imported lazily on first access of a plotting function.
 """
 
-from .visualization import *
+import importlib
+
+from . import analysis
 from .analysis import *
+
+#: Attributes of the package which are provided by the lazily imported visualization module
+VISUALIZATION_ATTRIBUTES = ('visualization', 'plot', 'plot_batch', 'plot_average_concentrations',
+                            'plot_average_concentrations_batch', 'plot_equilibrium_state',
+                            'plot_equilibrium_state_batch', 'LivePlot')
+
+# the plotting functions are part of the star import, which thereby imports the visualization module
+# (a plain import of the package stays lazy):
+__all__ = list(analysis.__all__) + [name for name in VISUALIZATION_ATTRIBUTES if name != 'visualization']
+
+
+def __getattr__(name):
+	if name in VISUALIZATION_ATTRIBUTES:
+		visualization = importlib.import_module('.visualization', __name__)
+		return visualization if name == 'visualization' else getattr(visualization, name)
+	raise AttributeError('module ' + repr(__name__) + ' has no attribute ' + repr(name))
+
+
+def __dir__():
+	return sorted(set(globals()) | set(VISUALIZATION_ATTRIBUTES))
@@ -4,6 +4,12 @@
 Simulation result analysis
 """
 
+import numpy as np
+import pandas as pd
+
+__all__ = ['equilibrium_state', 'equilibrium_states', 'equilibrium_state_composition',
+           'equilibrium_state_concentration_string']
+
 
 def equilibrium_state(trajectory, time_steps=100, reltol=0.01):
 	"""
@@ -24,32 +30,149 @@ def equilibrium_state(trajectory, time_steps=100, reltol=0.01):
 	:rtype: Pandas.DataFrame
 	"""
 
-	if time_steps>=trajectory.number_of_timesteps:
+	_check_averaged_time_steps(time_steps, trajectory.number_of_timesteps)
+
+	averages, maxima, minima = _segment_statistics(trajectory.values[np.newaxis, -time_steps:-1, :])
+	rel_diff = _relative_spread(averages, maxima, minima)[0]
+
+	for i, sp in enumerate(trajectory.species_names):
+		if rel_diff[i] > reltol:
+			raise ValueError('Maximum relative difference '+ str(rel_diff[i]) + 'of species '+ sp+
+		                     ' is larger than allowed tolerance '+ str(reltol))
+
+	return pd.Series(averages[0], index=trajectory.species_names)
+
+
+def equilibrium_states(trajectories, time_steps=100, reltol=0.01, species_names=None):
+	"""
+	Calculates the final equilibrium states of a batch of kinetic trajectories in one vectorized pass
+	(see :py:func:`equilibrium_state` for the definition of the equilibrium state).
+
+	In contrast to :py:func:`equilibrium_state`, not converged species do not raise an error but are flagged in
+	the result. The result is a tidy table with one row per trajectory and chemical species and the columns
+
+		+ ``trajectory``: index of the trajectory in the batch
+		+ ``species``: name of the chemical species
+		+ ``mean``, ``min``, ``max``: average, minimum and maximum concentration in the analyzed time segment
+		+ ``relative_spread``: relative fluctuation ``(max - min) / mean`` in the analyzed time segment
+		+ ``converged``: True if the relative fluctuation is not larger than ``reltol``
+
+	:param trajectories: The kinetic trajectories to analyze, a list of trajectories with the same chemical species
+		or a three dimensional array with the shape ``[number of trajectories, number of time steps,
+		number of species]``
+	:type trajectories: list of kineticsPy.base.Trajectory or numpy.ndarray
+	:param time_steps: The number of final time steps at the end of the kinetic trajetories to be considered for the
+		averaging
+	:type time_steps: int
+	:param reltol: A relative tolerance for the convergence check
+	:type reltol: float
+	:param species_names: Names of the chemical species if the trajectories are given as array (species are named
+		by their index if None)
+	:type species_names: list of str
+	:returns: A Pandas DataFrame with the equilibrium concentrations and convergence flags
+	:rtype: Pandas.DataFrame
+	"""
+	if isinstance(trajectories, np.ndarray):
+		if trajectories.ndim != 3:
+			raise ValueError('Stacked trajectory data has to be a three dimensional array')
+		n_timesteps = trajectories.shape[1]
+		_check_averaged_time_steps(time_steps, n_timesteps)
+		if species_names is None:
+			species_names = list(range(trajectories.shape[2]))
+		segments = trajectories[:, -time_steps:-1, :]
+	else:
+		trajectories = list(trajectories)
+		if not trajectories:
+			raise ValueError('No trajectories to analyze')
+		species_names = list(trajectories[0].species_names)
+		for tra in trajectories[1:]:
+			if list(tra.species_names) != species_names:
+				raise ValueError('Trajectories with different chemical species can not be analyzed in one batch')
+		n_timesteps = min(tra.number_of_timesteps for tra in trajectories)
+		_check_averaged_time_steps(time_steps, n_timesteps)
+		segments = np.stack([tra.values[-time_steps:-1, :] for tra in trajectories])
+
+	averages, maxima, minima = _segment_statistics(segments)
+	rel_diff = _relative_spread(averages, maxima, minima)
+
+	n_trajectories, n_species = averages.shape
+	return pd.DataFrame({
+		'trajectory': np.repeat(np.arange(n_trajectories), n_species),
+		'species': np.tile(np.asarray(species_names, dtype=object), n_trajectories),
+		'mean': averages.ravel(),
+		'min': minima.ravel(),
+		'max': maxima.ravel(),
+		'relative_spread': rel_diff.ravel(),
+		'converged': ~(rel_diff > reltol).ravel()
+	})
+
+
+def _check_averaged_time_steps(time_steps, n_timesteps):
+	"""
+	Checks that the number of averaged time steps is smaller than the number of time steps of the trajectories
+	"""
+	if time_steps >= n_timesteps:
 		raise ValueError('Number of time steps to average ('+str(time_steps)+') is larger than number '
-		                 'of time steps in trajectory '+str(trajectory.number_of_timesteps))
+		                 'of time steps in trajectory '+str(n_timesteps))
+
 
-	dat_segment = trajectory[-time_steps:-1, :]
+def _segment_statistics(segments):
+	"""
+	Calculates the averages, maxima and minima of a stack of trajectory segments
+	(shape ``[trajectories, time steps, species]``) along the time axis
+	"""
+	return segments.mean(axis=1), segments.max(axis=1), segments.min(axis=1)
 
-	averages = dat_segment.mean(axis=0)
 
-	# calculate relative differences for estimating if the trajectory has converged:
-	max = dat_segment.max(axis=0)
-	min = dat_segment.min(axis=0)
-	rel_diff = ((max-min) / averages).abs()
-	for sp in trajectory.species_names:
-		if rel_diff[sp] > reltol:
-			raise ValueError('Maximum relative difference '+ str(rel_diff[sp]) + 'of species '+ sp+
-		                     ' is larger than allowed tolerance '+ str(reltol))
+def _relative_spread(averages, maxima, minima):
+	"""
+	Calculates the relative fluctuation of trajectory segments from their averages, maxima and minima
+	"""
+	with np.errstate(divide='ignore', invalid='ignore'):
+		return np.abs((maxima - minima) / averages)
+
+
+def equilibrium_state_composition(trajectory, time_steps=100, reltol=0.01, as_array=False):
+	"""
+	Calculates the equilibrium state of a kinetic trajectory (see :py:func:`equilibrium_state`) as composition which
+	can be passed directly as initial mole fractions (``initial_mole_fractions``) into another Cantera simulation,
+	e.g. :py:func:`kineticsPy.cantera.simulation.simulate_isobar_adiabatic`:
 
+	.. code-block:: python
+
+		eq_composition = equilibrium_state_composition(sim_result)
+		sim_result_2 = simulate_isobar_adiabatic(input_file, eq_composition, 10000, 2e-9, 1e5)
+
+	In contrast to :py:func:`equilibrium_state_concentration_string`, the concentrations are passed with full
+	floating point precision and without formatting and parsing of strings.
+
+	:param trajectory: The kinetic trajectory to analyze
+	:type trajectory: kineticsPy.base.Trajectory
+	:param time_steps: The number of final time steps at the end of the kinetic trajectory to be considered for the
+		averaging
+	:type time_steps: int
+	:param reltol: A relative tolerance (see :py:func:`equilibrium_state`)
+	:type reltol: float
+	:param as_array: If True, the concentrations are returned as array in the order of the chemical species of the
+		trajectory, which is only a valid initialization if the other simulation has the same chemical species in
+		the same order. If False, a dict with the species names as keys is returned.
+	:type as_array: bool
+	:returns: The equilibrium concentrations
+	:rtype: dict or numpy.ndarray
+	"""
+	eq_conc = equilibrium_state(trajectory, time_steps=time_steps, reltol=reltol)
+	if as_array:
+		return eq_conc.to_numpy()
 
-	return averages
+	return dict(zip(eq_conc.index, eq_conc.to_numpy().tolist()))
 
 
 def equilibrium_state_concentration_string(trajectory, time_steps=100, rel_tol=0.01):
 	"""
 	Generates a string for an concentrations input of a kinetic trajectory for another cantera simulation.
 	It uses the equilibrium_state function to get the result concentrations of an initial cantera simulation.
-	After splitting and inserting certain characters, a string with the result concentrations is generated, which can be used for another cantera simulation.
+	The concentrations are formatted in exponential notation with seven significant digits (e.g. ``2.426859e+19``),
+	use :py:func:`equilibrium_state_composition` to pass the full precision concentrations to another simulation.
 
 	:param trajectory: The kinetic trajectory to analyze
 	:type trajectory: kineticsPy.base.Trajectory
@@ -63,18 +186,5 @@ def equilibrium_state_concentration_string(trajectory, time_steps=100, rel_tol=0
 	:returns: A string with result concentrations
 	:rtype: string
 	"""
-	eq_conc = equilibrium_state(trajectory, time_steps=time_steps, reltol=rel_tol)
-
-	string_eq = eq_conc.to_string()  # convert dataframe to string
-	split_eq = string_eq.split()  # split the string (gets also rid of the blank spaces)
-	# insert ":" delimiter after each chemical species key
-	for i in range(len(split_eq), 0, -1):
-		if i % 2 != 0:
-			split_eq.insert(i, ':')
-	# insert "," delimiter after each number concentration to separate individual species entries
-	for j in range(len(split_eq)-1, 1, -1):
-		if j % 3 == 0:
-			split_eq.insert(j, ',')
-	# merge everything to one string
-	final_conc_str = ''.join(split_eq)
-	return final_conc_str
\ No newline at end of file
+	eq_composition = equilibrium_state_composition(trajectory, time_steps=time_steps, reltol=rel_tol)
+	return ','.join('{}:{:e}'.format(sp, conc) for sp, conc in eq_composition.items())
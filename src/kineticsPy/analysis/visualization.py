@@ -4,18 +4,39 @@
 Kinetic simulation result plotting / visualization
 """
 
+import os
+import functools
+from time import monotonic
+import concurrent.futures
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from kineticsPy.base.trajectory import Trajectory
 from . import analysis
 
-__all__ = ['plot', 'plot_average_concentrations', 'plot_equilibrium_state']
+__all__ = ['plot', 'plot_batch', 'plot_average_concentrations', 'plot_average_concentrations_batch',
+           'plot_equilibrium_state', 'plot_equilibrium_state_batch', 'LivePlot']
 
-plt.style.use('ggplot')
+#: Matplotlib style of the plots, applied only while the plots are created (the global style is not changed)
+PLOT_STYLE = 'ggplot'
 
 
+def _styled(plot_function):
+	"""
+	Decorator which creates the figures of a plot function with the kineticsPy plot style
+	"""
+	@functools.wraps(plot_function)
+	def styled_plot_function(*args, **kwargs):
+		with plt.style.context(PLOT_STYLE):
+			return plot_function(*args, **kwargs)
+
+	return styled_plot_function
+
+
+@_styled
 def plot(trajectory: Trajectory, species_conf=None, time_steps=None,
-         normalized=False, log='none', figsize=None, legend='best'):
+         normalized=False, log='none', figsize=None, legend='best', decimate=True):
 	"""
 	Generates a concentration / time profile plot for a trajectory.
 
@@ -60,14 +81,31 @@ def plot(trajectory: Trajectory, species_conf=None, time_steps=None,
 		plot(trajectory, time_steps=150)  # will plot time steps up to 150
 		plot(trajectory, time_steps=(100, 200) )  # will plot time steps between 100 and 200
 
+	**Decimation of long trajectories**
+
+	Long trajectories have far more samples than the plot has pixels. By default (``decimate=True``), the plotted
+	time range is divided into one bucket per horizontal pixel of the plot and only the first, last, minimal and
+	maximal sample of a species in every bucket is plotted. The rendered plot looks the same as a plot of all
+	samples, since all extrema are preserved, but rendering is much faster and saved vector graphics stay small.
+	The buckets are logarithmically spaced in time if the time axis is logarithmic. An integer passed to
+	``decimate`` defines the number of buckets explicitly, ``decimate=False`` plots all samples.
+
+	**Normalization**
+
+	With ``normalized=True``, all concentrations are divided by the maximum concentration of all plotted species in
+	the plotted time range, which keeps the ratios between the species. With ``normalized='species'``, every
+	species is normalized to its own maximum in the plotted time range, which allows to compare the time profiles of
+	species with very different concentrations.
+
 
 	:param trajectory: The kinetic trajectory to plot
 	:param species_conf: Selection of chemical species with optional line style configuration (see above for details)
 	:type species_conf: list of str or list of species / line style definitions
 	:param time_steps: Time step range selection (see above for details)
 	:type time_steps: int or tuple of two int
-	:param normalized: If true concentrations are normalized to [0, 1] for plotting
-	:type normalized: bool
+	:param normalized: If true concentrations are normalized to [0, 1] for plotting, if 'species' every species is
+		normalized individually (see above)
+	:type normalized: bool or str
 	:param log: Logarithmic plot mode.
 		If "none" both axes are linear, if "concentration" the concentration axis is log plotted,
 		if "time" the time axis is log plotted, if "both" both axes are log plotted
@@ -77,92 +115,83 @@ def plot(trajectory: Trajectory, species_conf=None, time_steps=None,
 	:param legend: Legend configuration / location. 'off' deactivates the legend. Matplotlib legend location string
 		fixes the legend on the specfied location (see matplotlb documentation for details)
 	:type legend: str
+	:param decimate: Decimation of the plotted samples: If True, the samples are decimated to the pixel width of
+		the plot, if an integer is given, the samples are decimated to this number of time buckets (see above)
+	:type decimate: bool or int
 	:returns: A matplotlib figure with the plot
 	"""
 	species_names = trajectory.species_names
-	times_s = trajectory.times * trajectory.time_scaling_factor
-
-	style_conf_present = False  # flag if a complex species / line style configuration is present
-	if isinstance(species_conf, str):  # single string means: single species name
-		species_conf = [species_conf]
-
-	if species_conf is None:
-		species_to_plot = species_names
-	elif isinstance(species_conf, (list, tuple)):
-		#  check which types are in the elements of the given list or tuple:
-		#  if all elements are string: We have a pure species identifier list
-		#  if all elements are themselves lists or tuples: we have comples species / linestyle configuration
-
-		only_strings = True
-		only_lists = True
-		for sp in species_conf:
-			if not isinstance(sp, str):
-				only_strings = False
-			if not isinstance(sp, (list, tuple)):
-				only_lists = False
-
-		if only_strings:  # we have a pure species id list
-			species_to_plot = species_conf
-		elif only_lists:  # we have a species / line style configuration
-			if not all(len(sp) == 3 for sp in species_conf):
-				raise ValueError('Species / line style configurations have to have three elements '
-				                 '(Species, line style, color)')
-
-			style_conf_present = True
-			species_to_plot = [sp[0] for sp in species_conf]
-	else:
-		raise ValueError('Illegal type for species_conf')
 
+	species_to_plot, line_styles = _parse_species_conf(species_conf, species_names)
 	time_steps_to_plot = _time_steps_to_plot(time_steps, trajectory)
 
-	if normalized:
-		max_vals = [np.max(trajectory.loc[species, time_steps_to_plot]) for species in species_to_plot]
-		norm_factor = 1.0/np.max(max_vals)
-	else:
-		norm_factor = 1.0
-
 	if log not in ('none', 'concentration', 'time', 'both'):
 		raise ValueError('Illegal option passed for log')
+	if normalized not in (True, False, 'species'):
+		raise ValueError('Illegal option passed for normalized')
 
 	fig, ax = plt.subplots(figsize=figsize)
+	_set_log_scales(ax, log)
 
-	if log == 'none':
-		plot_fct = ax.plot
-	elif log == 'concentration':
-		plot_fct = ax.semilogy
-	elif log == 'time':
-		plot_fct = ax.semilogx
-	elif log == 'both':
-		plot_fct = ax.loglog
+	line_data = _profile_line_data(
+		trajectory, species_to_plot, time_steps_to_plot, normalized, _number_of_buckets(decimate, ax), log)
+	for (times_s, values), species, style in zip(line_data, species_to_plot, line_styles):
+		ax.plot(times_s, values, *style[0], label=species, **style[1])
 
+	_label_profile_plot(ax, legend, normalized, trajectory.concentration_unit)
 
-	if style_conf_present:
-		for sp in species_conf:
-			plot_fct(
-				times_s.iloc[time_steps_to_plot],
-				trajectory.loc[sp[0], time_steps_to_plot] * norm_factor,
-				sp[1],
-				color=sp[2],
-				label=sp[0])
-	else:
-		for species in species_to_plot:
-			plot_fct(
-				times_s.iloc[time_steps_to_plot],
-				trajectory.loc[species, time_steps_to_plot] * norm_factor,
-				label=species)
+	return fig
 
-	if legend is not None and legend != 'off':
-		ax.legend(loc=legend)
 
-	ax.set_xlabel('time (s)')
-	if normalized:
-		ax.set_ylabel('normalized concentration')
-	else:
-		ax.set_ylabel('concentration (' + trajectory.concentration_unit + ')')
+def plot_batch(trajectories, file_names, species_conf=None, time_steps=None, normalized=False, log='none',
+               figsize=None, legend='best', decimate=True, titles=None, dpi=None, max_workers=1):
+	"""
+	Renders concentration / time profile plots (see :py:func:`plot`) of a batch of trajectories into image files,
+	e.g. for the reports of large parameter sweeps:
 
-	return fig
+	.. code-block:: python
 
+		plot_batch(sweep_result.trajectories, ['run_{:03d}.png'.format(i) for i in range(len(sweep_result))],
+		           ['H3O+', 'H3O+(H2O)', 'H3O+(H2O)2'], log='time', max_workers=4)
+
+	The plot parameters are validated once for the whole batch. Instead of creating a new figure for every
+	trajectory, one figure is created and the data of its plot lines is replaced for every trajectory. The figure
+	is rendered with the Agg backend without using pyplot, therefore no interactive windows are opened and the
+	figures are not registered in pyplot. The axis labels and the legend are taken from the first trajectory.
+
+	Large batches can be split into sub batches, which are rendered in parallel by ``max_workers``
+	worker processes.
+
+	:param trajectories: The kinetic trajectories to plot
+	:type trajectories: list of Trajectory
+	:param file_names: The paths of the image files, one for every trajectory. The image format is determined by
+		the file extension (e.g. ``.png``).
+	:type file_names: list of str
+	:param titles: Optional titles of the plots, one for every trajectory
+	:type titles: list of str
+	:param dpi: Resolution of the image files in dots per inch (the matplotlib default is used if None)
+	:type dpi: float
+	:param max_workers: Number of worker processes. If 1, all plots are rendered in the calling process, if None,
+		the number of processors of the machine is used.
+	:type max_workers: int
+
+	See :py:func:`plot` for the other parameters.
+	"""
+	trajectories, file_names = _check_batch(trajectories, file_names, titles)
+	if log not in ('none', 'concentration', 'time', 'both'):
+		raise ValueError('Illegal option passed for log')
+	if normalized not in (True, False, 'species'):
+		raise ValueError('Illegal option passed for normalized')
+	if not trajectories:
+		return
 
+	plot_args = dict(species_conf=species_conf, time_steps=time_steps, normalized=normalized, log=log,
+	                 figsize=figsize, legend=legend, decimate=decimate, dpi=dpi)
+
+	_render_batch(_render_profile_batch, trajectories, file_names, titles, max_workers, plot_args)
+
+
+@_styled
 def plot_average_concentrations(trajectory: Trajectory,
                                 time_steps=None,
                                 species=None,
@@ -213,16 +242,36 @@ def plot_average_concentrations(trajectory: Trajectory,
 	else:
 		species_to_plot = list(species)
 
+	average_data = _average_concentrations(trajectory, species_to_plot, time_steps)
+	return _concentration_box_plot(average_data, species_to_plot, figsize, legend, log, trajectory.concentration_unit)
 
-	if isinstance(time_steps, int): # we need slightly different behavior for time step selection
-		average_data = trajectory.loc[species_to_plot, time_steps]
-	else:
-		time_steps_to_plot = _time_steps_to_plot(time_steps, trajectory)
-		average_data = trajectory.loc[species_to_plot, time_steps_to_plot].mean(axis=0)
 
-	return _concentration_box_plot(average_data, species_to_plot, figsize, legend, log, trajectory.concentration_unit)
+def plot_average_concentrations_batch(trajectories, file_names, time_steps=None, species=None, figsize=None,
+                                      legend='best', log=False, titles=None, dpi=None, max_workers=1):
+	"""
+	Renders box plots of the averaged concentrations (see :py:func:`plot_average_concentrations`) of a batch of
+	trajectories into image files. As in :py:func:`plot_batch`, one figure is rendered with the Agg backend and reused
+	for all trajectories: The heights of the bars are replaced for every trajectory. The species and the axis labels
+	are taken from the first trajectory.
+
+	:param trajectories: The kinetic trajectories to plot
+	:type trajectories: list of Trajectory
+	:param file_names: The paths of the image files, one for every trajectory
+	:type file_names: list of str
+
+	See :py:func:`plot_batch` for ``titles``, ``dpi`` and ``max_workers`` and
+	:py:func:`plot_average_concentrations` for the other parameters.
+	"""
+	trajectories, file_names = _check_batch(trajectories, file_names, titles)
+	if not trajectories:
+		return
 
+	plot_args = dict(average_time_steps=time_steps, species=species, figsize=figsize, legend=legend, log=log,
+	                 dpi=dpi)
+	_render_batch(_render_average_concentrations_batch, trajectories, file_names, titles, max_workers, plot_args)
 
+
+@_styled
 def plot_equilibrium_state(trajectory: Trajectory,
                            time_steps=100,
                            reltol=0.01,
@@ -256,6 +305,235 @@ def plot_equilibrium_state(trajectory: Trajectory,
 	return _concentration_box_plot(equilibrium_data, species, figsize, legend, log, trajectory.concentration_unit)
 
 
+def plot_equilibrium_state_batch(trajectories, file_names, time_steps=100, reltol=0.01, figsize=None,
+                                 legend='best', log=False, titles=None, dpi=None, max_workers=1):
+	"""
+	Renders plots of the final equilibrium states (see :py:func:`plot_equilibrium_state`) of a batch of trajectories
+	into image files with one reused figure (see :py:func:`plot_average_concentrations_batch`). As in
+	:py:func:`plot_equilibrium_state`, a trajectory which is not converged raises a ValueError.
+
+	:param trajectories: The kinetic trajectories to plot
+	:type trajectories: list of Trajectory
+	:param file_names: The paths of the image files, one for every trajectory
+	:type file_names: list of str
+
+	See :py:func:`plot_batch` for ``titles``, ``dpi`` and ``max_workers`` and
+	:py:func:`plot_equilibrium_state` for the other parameters.
+	"""
+	trajectories, file_names = _check_batch(trajectories, file_names, titles)
+	if not trajectories:
+		return
+
+	plot_args = dict(equilibrium_time_steps=time_steps, reltol=reltol, figsize=figsize, legend=legend, log=log,
+	                 dpi=dpi)
+	_render_batch(_render_equilibrium_state_batch, trajectories, file_names, titles, max_workers, plot_args)
+
+
+class LivePlot:
+	"""
+	Live concentration / time profile plot of a running simulation or a growing trajectory file.
+
+	New samples are appended to the plot lines of one persistent figure, the figure is redrawn at most
+	``max_frame_rate`` times per second. A live plot follows a sequence of trajectory chunks, e.g. the chunks of a
+	running chunked simulation (:py:func:`kineticsPy.cantera.simulation.simulate_isobar_adiabatic_chunked`) or of
+	a growing IDSimF RS result file (:py:func:`kineticsPy.base.fileio.follow_idsimf_rs_result`):
+
+	.. code-block:: python
+
+		live_plot = LivePlot(['H3O+', 'H3O+(H2O)', 'H3O+(H2O)2'], log='time')
+		chunks = simulate_isobar_adiabatic_chunked(input_file, initial_mole_fractions, 100000000, 2e-9, 1e5,
+		                                           chunk_size=10000)
+		for chunk in live_plot.follow(chunks):
+			pass  # chunks can be processed further
+
+	Samples can also be appended directly with :py:meth:`append` or :py:meth:`append_trajectory`.
+	"""
+
+	def __init__(self, species_conf=None, log='none', figsize=None, legend='best', max_frame_rate=2.0,
+	             decimate=True):
+		"""
+		Constructs a new live plot with an empty figure
+
+		:param species_conf: Selection of chemical species with optional line style configuration (see
+			:py:func:`plot`). If None, all species of the first appended trajectory are plotted.
+		:type species_conf: list of str or list of species / line style definitions
+		:param log: Logarithmic plot mode (see :py:func:`plot`)
+		:type log: str
+		:param figsize: Size of the plot figure, a tuple with (width, height)
+		:type figsize: tuple of two floats
+		:param legend: Legend configuration / location (see :py:func:`plot`)
+		:type legend: str
+		:param max_frame_rate: Maximum number of redraws of the figure per second
+		:type max_frame_rate: float
+		:param decimate: Decimation of the plotted samples (see :py:func:`plot`)
+		:type decimate: bool or int
+		"""
+		if log not in ('none', 'concentration', 'time', 'both'):
+			raise ValueError('Illegal option passed for log')
+		if max_frame_rate <= 0:
+			raise ValueError('Maximum frame rate has to be positive')
+
+		self._species_conf = species_conf
+		self._log = log
+		self._legend = legend
+		self._min_frame_interval = 1.0 / max_frame_rate
+
+		with plt.style.context(PLOT_STYLE):
+			self._fig, self._ax = plt.subplots(figsize=figsize)
+		_set_log_scales(self._ax, log)
+		self._n_buckets = _number_of_buckets(decimate, self._ax)
+
+		self._species_to_plot = None
+		self._lines = None
+		self._times = None
+		self._data = None
+		self._n_samples = 0
+		self._n_frames = 0
+		self._last_frame_time = -np.inf
+
+	@property
+	def figure(self):
+		"""
+		Returns the matplotlib figure of the live plot
+		"""
+		return self._fig
+
+	@property
+	def number_of_samples(self):
+		"""
+		Returns the number of appended samples
+		"""
+		return self._n_samples
+
+	@property
+	def number_of_frames(self):
+		"""
+		Returns the number of redraws of the figure
+		"""
+		return self._n_frames
+
+	def append(self, times, concentrations, species_names):
+		"""
+		Appends samples to the live plot and redraws the figure if the frame interval has passed
+
+		:param times: Times of the samples (in seconds)
+		:type times: numpy.ndarray
+		:param concentrations: Concentrations of the samples with the shape ``[number of samples, number of species]``
+		:type concentrations: numpy.ndarray
+		:param species_names: Names of the chemical species (columns) in ``concentrations``
+		:type species_names: list of str
+		"""
+		species_names = list(species_names)
+		if self._lines is None:
+			self._setup_lines(species_names)
+
+		n_new = len(times)
+		self._reserve(self._n_samples + n_new)
+		self._times[self._n_samples:self._n_samples + n_new] = times
+		self._data[self._n_samples:self._n_samples + n_new] = np.asarray(concentrations)[
+			:, [species_names.index(species) for species in self._species_to_plot]]
+		self._n_samples += n_new
+
+		if monotonic() - self._last_frame_time >= self._min_frame_interval:
+			self.redraw()
+
+	def append_trajectory(self, trajectory):
+		"""
+		Appends all samples of a kinetic trajectory (e.g. a chunk of a running simulation) to the live plot
+
+		:param trajectory: The trajectory to append
+		:type trajectory: Trajectory
+		"""
+		if self._lines is None:
+			self._setup_lines(trajectory.species_names, trajectory.concentration_unit)
+		self.append(trajectory.time_values * trajectory.time_scaling_factor, trajectory.values,
+		            trajectory.species_names)
+
+	def follow(self, trajectory_chunks):
+		"""
+		Appends a sequence of trajectory chunks to the live plot while they are generated. The chunks are passed
+		through, thus this generator can be used as drop in replacement of the original chunk sequence. The figure
+		is redrawn when the sequence is exhausted.
+
+		:param trajectory_chunks: Sequence of trajectory chunks
+		:type trajectory_chunks: iterable of Trajectory
+		:return: Generator of the trajectory chunks
+		"""
+		for chunk in trajectory_chunks:
+			self.append_trajectory(chunk)
+			yield chunk
+
+		self.redraw()
+
+	def redraw(self):
+		"""
+		Updates the plot lines with all appended samples and redraws the figure
+		"""
+		if self._lines is None:
+			return
+
+		n = self._n_samples
+		times = self._times[:n]
+		if self._n_buckets is not None and n > 4 * self._n_buckets:
+			buckets = _time_buckets(times, self._n_buckets, log_time=self._log in ('time', 'both'))
+		else:
+			buckets = None
+
+		for i, line in enumerate(self._lines):
+			if buckets is None:
+				line.set_data(times, self._data[:n, i])
+			else:
+				indices = _min_max_indices(self._data[:n, i], buckets)
+				line.set_data(times[indices], self._data[indices, i])
+
+		self._ax.relim()
+		self._ax.autoscale_view()
+		self._fig.canvas.draw_idle()
+		self._fig.canvas.flush_events()
+
+		self._n_frames += 1
+		self._last_frame_time = monotonic()
+
+	def _setup_lines(self, species_names, concentration_unit=None):
+		"""
+		Creates the (empty) plot lines for the selected species
+		"""
+		self._species_to_plot, line_styles = _parse_species_conf(self._species_conf, list(species_names))
+		with plt.style.context(PLOT_STYLE):
+			self._lines = [self._ax.plot([], [], *style[0], label=species, **style[1])[0]
+			               for species, style in zip(self._species_to_plot, line_styles)]
+			_label_profile_plot(self._ax, self._legend, False, '' if concentration_unit is None else concentration_unit)
+		if concentration_unit is None:
+			self._ax.set_ylabel('concentration')
+
+	def _reserve(self, n_samples):
+		"""
+		Grows the sample buffers (by doubling their size) to hold at least ``n_samples`` samples
+		"""
+		capacity = 0 if self._times is None else len(self._times)
+		if n_samples <= capacity:
+			return
+
+		new_capacity = max(n_samples, 2 * capacity, 1024)
+		times = np.empty(new_capacity)
+		data = np.empty((new_capacity, len(self._species_to_plot)))
+		if self._times is not None:
+			times[:self._n_samples] = self._times[:self._n_samples]
+			data[:self._n_samples] = self._data[:self._n_samples]
+		self._times, self._data = times, data
+
+
+def _average_concentrations(trajectory, species_to_plot, time_steps):
+	"""
+	Returns the concentrations of a trajectory averaged over the selected time steps
+	(see :py:func:`plot_average_concentrations`)
+	"""
+	if isinstance(time_steps, int):  # we need slightly different behavior for time step selection
+		return trajectory.loc[species_to_plot, time_steps]
+	time_steps_to_plot = _time_steps_to_plot(time_steps, trajectory)
+	return trajectory.loc[species_to_plot, time_steps_to_plot].mean(axis=0)
+
+
 def _time_steps_to_plot(time_steps, trajectory):
 	"""
 	Defines which time steps should be plotted from a user provided time_steps parameter and a trajectory
@@ -284,14 +562,304 @@ def _time_steps_to_plot(time_steps, trajectory):
 	return time_steps_to_plot
 
 
+def _check_batch(trajectories, file_names, titles):
+	"""
+	Checks the file names and titles of a batch plot and returns the trajectories and file names as lists
+	"""
+	trajectories = list(trajectories)
+	file_names = list(file_names)
+	if len(file_names) != len(trajectories):
+		raise ValueError('Number of file names does not match the number of trajectories')
+	if titles is not None and len(titles) != len(trajectories):
+		raise ValueError('Number of titles does not match the number of trajectories')
+	return trajectories, file_names
+
+
+def _render_batch(render_function, trajectories, file_names, titles, max_workers, plot_args):
+	"""
+	Renders a batch of plots with a batch render function, in the calling process or split into sub batches which
+	are rendered in parallel by worker processes
+	"""
+	n_workers = os.cpu_count() if max_workers is None else max_workers
+	if n_workers <= 1 or len(trajectories) == 1:
+		render_function(trajectories, file_names, titles, **plot_args)
+		return
+
+	# every worker renders a contiguous sub batch with its own figure:
+	sub_batches = np.array_split(np.arange(len(trajectories)), min(n_workers, len(trajectories)))
+	with concurrent.futures.ProcessPoolExecutor(max_workers=len(sub_batches)) as executor:
+		futures = [
+			executor.submit(
+				render_function,
+				[trajectories[i] for i in sub_batch],
+				[file_names[i] for i in sub_batch],
+				None if titles is None else [titles[i] for i in sub_batch],
+				**plot_args)
+			for sub_batch in sub_batches]
+		for future in futures:
+			future.result()
+
+
+@_styled
+def _render_profile_batch(trajectories, file_names, titles, species_conf, time_steps, normalized, log,
+                          figsize, legend, decimate, dpi):
+	"""
+	Renders concentration / time profile plots of a batch of trajectories with one reused figure
+	"""
+	fig = Figure(figsize=figsize)
+	FigureCanvasAgg(fig)
+	ax = fig.add_subplot()
+	_set_log_scales(ax, log)
+
+	species_to_plot, line_styles = _parse_species_conf(species_conf, trajectories[0].species_names)
+	n_buckets = _number_of_buckets(decimate, ax)
+
+	lines = None
+	for i, trajectory in enumerate(trajectories):
+		time_steps_to_plot = _time_steps_to_plot(time_steps, trajectory)
+		line_data = _profile_line_data(
+			trajectory, species_to_plot, time_steps_to_plot, normalized, n_buckets, log)
+
+		if lines is None:
+			lines = [ax.plot(times_s, values, *style[0], label=species, **style[1])[0]
+			         for (times_s, values), species, style in zip(line_data, species_to_plot, line_styles)]
+			_label_profile_plot(ax, legend, normalized, trajectory.concentration_unit)
+		else:
+			for line, (times_s, values) in zip(lines, line_data):
+				line.set_data(times_s, values)
+			ax.relim()
+			ax.autoscale_view()
+
+		if titles is not None:
+			ax.set_title(titles[i])
+		fig.savefig(file_names[i], dpi=dpi)
+
+
+def _render_average_concentrations_batch(trajectories, file_names, titles, average_time_steps, species, figsize,
+                                         legend, log, dpi):
+	"""
+	Renders box plots of the averaged concentrations of a batch of trajectories with one reused figure
+	"""
+	species_to_plot = list(trajectories[0].species_names) if species is None else list(species)
+	_render_bar_batch(
+		trajectories, lambda trajectory: _average_concentrations(trajectory, species_to_plot, average_time_steps),
+		species_to_plot, file_names, titles, figsize, legend, log, dpi)
+
+
+def _render_equilibrium_state_batch(trajectories, file_names, titles, equilibrium_time_steps, reltol, figsize,
+                                    legend, log, dpi):
+	"""
+	Renders the equilibrium state plots of a batch of trajectories with one reused figure
+	"""
+	_render_bar_batch(
+		trajectories, lambda trajectory: analysis.equilibrium_state(
+			trajectory, time_steps=equilibrium_time_steps, reltol=reltol),
+		list(trajectories[0].species_names), file_names, titles, figsize, legend, log, dpi)
+
+
+@_styled
+def _render_bar_batch(trajectories, bar_concentrations, labels, file_names, titles, figsize, legend, log, dpi):
+	"""
+	Renders concentration box plots of a batch of trajectories with one reused figure, the plotted concentrations of
+	a trajectory are calculated by ``bar_concentrations(trajectory)``
+	"""
+	fig = Figure(figsize=figsize)
+	FigureCanvasAgg(fig)
+	ax = fig.add_subplot()
+
+	bars = None
+	for i, trajectory in enumerate(trajectories):
+		concs = bar_concentrations(trajectory)
+		if titles is not None:
+			ax.set_title(titles[i])
+
+		if bars is None:
+			bars = _draw_concentration_bars(ax, concs, labels, legend, log, trajectory.concentration_unit)
+			# the layout is fixed by the labels, it is calculated once for all plots:
+			fig.tight_layout()
+		else:
+			for bar, label in zip(bars, labels):
+				bar.set_height(concs[label])
+			ax.relim()
+			ax.autoscale_view()
+
+		fig.savefig(file_names[i], dpi=dpi)
+
+
+def _parse_species_conf(species_conf, species_names):
+	"""
+	Parses a chemical species selection with optional line style configuration (see :py:func:`plot`) and returns
+	the species to plot and the line style arguments (positional and keyword arguments) of the plot lines
+	"""
+	style_conf_present = False  # flag if a complex species / line style configuration is present
+	if isinstance(species_conf, str):  # single string means: single species name
+		species_conf = [species_conf]
+
+	if species_conf is None:
+		species_to_plot = list(species_names)
+	elif isinstance(species_conf, (list, tuple)):
+		#  check which types are in the elements of the given list or tuple:
+		#  if all elements are string: We have a pure species identifier list
+		#  if all elements are themselves lists or tuples: we have comples species / linestyle configuration
+
+		only_strings = True
+		only_lists = True
+		for sp in species_conf:
+			if not isinstance(sp, str):
+				only_strings = False
+			if not isinstance(sp, (list, tuple)):
+				only_lists = False
+
+		if only_strings:  # we have a pure species id list
+			species_to_plot = list(species_conf)
+		elif only_lists:  # we have a species / line style configuration
+			if not all(len(sp) == 3 for sp in species_conf):
+				raise ValueError('Species / line style configurations have to have three elements '
+				                 '(Species, line style, color)')
+
+			style_conf_present = True
+			species_to_plot = [sp[0] for sp in species_conf]
+		else:
+			raise ValueError('Illegal type for species_conf')
+	else:
+		raise ValueError('Illegal type for species_conf')
+
+	for species in species_to_plot:
+		if species not in species_names:
+			raise ValueError('Species ' + str(species) + ' is not in the trajectory')
+
+	if style_conf_present:
+		line_styles = [((sp[1],), {'color': sp[2]}) for sp in species_conf]
+	else:
+		line_styles = [((), {})] * len(species_to_plot)
+
+	return species_to_plot, line_styles
+
+
+def _set_log_scales(ax, log):
+	"""
+	Sets the logarithmic axes of a concentration / time profile plot
+	"""
+	if log in ('time', 'both'):
+		ax.set_xscale('log')
+	if log in ('concentration', 'both'):
+		ax.set_yscale('log')
+
+
+def _number_of_buckets(decimate, ax):
+	"""
+	Determines the number of time buckets for the decimation of the plotted samples (None if not decimated)
+	"""
+	if decimate is True:
+		return int(ax.get_window_extent().width)
+	elif decimate:
+		return int(decimate)
+	else:
+		return None
+
+
+def _profile_line_data(trajectory, species_to_plot, time_steps_to_plot, normalized, n_buckets, log):
+	"""
+	Prepares the (possibly decimated) times and concentrations of the lines of a concentration / time profile plot
+	"""
+	times_s = trajectory.time_values[time_steps_to_plot] * trajectory.time_scaling_factor
+
+	# one selection of the plotted species / time block, used for normalization and plotting:
+	species_indices = [trajectory.species_index(species) for species in species_to_plot]
+	values = trajectory.values[time_steps_to_plot][:, species_indices]
+
+	if normalized == 'species':
+		max_vals = values.max(axis=0)
+		norm_factors = 1.0 / np.where(max_vals != 0, max_vals, 1.0)
+	elif normalized:
+		norm_factors = np.full(len(species_indices), 1.0 / np.max(values))
+	else:
+		norm_factors = np.ones(len(species_indices))
+
+	if n_buckets is not None and len(times_s) > 4 * n_buckets:
+		buckets = _time_buckets(times_s, n_buckets, log_time=log in ('time', 'both'))
+	else:
+		buckets = None
+
+	line_data = []
+	for i in range(len(species_indices)):
+		if buckets is None:
+			line_data.append((times_s, values[:, i] * norm_factors[i]))
+		else:
+			indices = _min_max_indices(values[:, i], buckets)
+			line_data.append((times_s[indices], values[indices, i] * norm_factors[i]))
+
+	return line_data
+
+
+def _label_profile_plot(ax, legend, normalized, concentration_unit):
+	"""
+	Sets the legend and the axis labels of a concentration / time profile plot
+	"""
+	if legend is not None and legend != 'off':
+		ax.legend(loc=legend)
+
+	ax.set_xlabel('time (s)')
+	if normalized:
+		ax.set_ylabel('normalized concentration')
+	else:
+		ax.set_ylabel('concentration (' + concentration_unit + ')')
+
+
+def _time_buckets(times, n_buckets, log_time=False):
+	"""
+	Divides a sorted time vector into ``n_buckets`` buckets of equal length on a linear or logarithmic time axis.
+	Returns the indices of the first samples of the non empty buckets.
+	"""
+	if log_time:
+		# non positive times are not shown on a logarithmic axis, they form a bucket of their own:
+		first_positive = np.searchsorted(times, 0.0, side='right')
+		if first_positive >= len(times):
+			return np.zeros(1, dtype=np.int64)
+		edges = np.geomspace(times[first_positive], times[-1], n_buckets + 1)[:-1]
+		starts = np.concatenate(([0], np.searchsorted(times, edges)))
+	else:
+		edges = np.linspace(times[0], times[-1], n_buckets + 1)[:-1]
+		starts = np.searchsorted(times, edges)
+
+	return np.unique(starts)
+
+
+def _min_max_indices(values, bucket_starts):
+	"""
+	Selects the indices of the first, last, minimal and maximal sample in every bucket of a signal
+	"""
+	n = len(values)
+	counts = np.diff(np.append(bucket_starts, n))
+	positions = np.arange(n)
+
+	# index of the first sample with the minimum / maximum value of the bucket:
+	minima = np.repeat(np.minimum.reduceat(values, bucket_starts), counts)
+	maxima = np.repeat(np.maximum.reduceat(values, bucket_starts), counts)
+	argmin = np.minimum.reduceat(np.where(values == minima, positions, n - 1), bucket_starts)
+	argmax = np.minimum.reduceat(np.where(values == maxima, positions, n - 1), bucket_starts)
+
+	return np.unique(np.concatenate((bucket_starts, bucket_starts + counts - 1, argmin, argmax)))
+
+
 def _concentration_box_plot(concs, labels, figsize, legend, log, concentration_unit):
 
 	fig, ax = plt.subplots(figsize=figsize)
+	_draw_concentration_bars(ax, concs, labels, legend, log, concentration_unit)
+	fig.tight_layout()
+
+	return fig
 
+
+def _draw_concentration_bars(ax, concs, labels, legend, log, concentration_unit):
+	"""
+	Draws the bars of a concentration box plot into an axes and returns the bars (one per label)
+	"""
 	x = np.arange(len(labels))
 
+	bars = []
 	for i in range(len(labels)):
-		ax.bar(x[i], concs[labels[i]], label=labels[i])
+		bars.append(ax.bar(x[i], concs[labels[i]], label=labels[i])[0])
 
 	if log:
 		ax.set_yscale('log')
@@ -300,9 +868,7 @@ def _concentration_box_plot(concs, labels, figsize, legend, log, concentration_u
 	ax.set_xticklabels(labels)
 	ax.tick_params(axis="x", rotation=90)
 	ax.set_ylabel('concentration (' + concentration_unit + ')')
-	if legend is not None and legend is not 'off':
+	if legend is not None and legend != 'off':
 		ax.legend(loc=legend)
 
-	fig.tight_layout()
-
-	return fig
\ No newline at end of file
+	return bars
\ No newline at end of file
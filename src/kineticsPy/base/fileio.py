@@ -4,25 +4,295 @@
 File input and output of kinetic results and kinetic trajectories
 """
 
+import io
 import os
+import json
+import time
+import numpy as np
 import pandas as pd
 from kineticsPy.base.trajectory import Trajectory
 
+# version of the binary trajectory store format:
+TRAJECTORY_STORE_VERSION = 1
 
-def read_idsimf_rs_result(rs_file_path):
+
+def read_idsimf_rs_result(rs_file_path, species=None, time_range=None, dtype=np.float64, chunk_size=100000):
 	"""
 	Reads an IDSimF reaction simulatio (RS) result from an RS result file
 
+	The file is read in chunks of ``chunk_size`` lines, only the selected chemical species are parsed. If the whole
+	file is read, the chunks are written into an array preallocated from the number of lines of the file (which
+	costs an additional fast pass over the file), thus the peak memory consumption is the size of the resulting
+	trajectory plus one chunk. If a ``time_range`` is given, the file is not counted: The chunks in the time range
+	are collected and concatenated, which temporarily requires about twice the size of the result.
+
 	:param rs_file_path: The path to the IDSimF-RS result file
 	:type rs_file_path: path
+	:param species: Names of the chemical species to read (all species are read if None)
+	:type species: list of str
+	:param time_range: Optional time range (lower and upper time, inclusive) to read
+	:type time_range: tuple of two floats
+	:param dtype: Data type of the concentration data (e.g. ``numpy.float32`` to halve the memory consumption)
+	:type dtype: numpy.dtype
+	:param chunk_size: Number of lines parsed at once
+	:type chunk_size: int
 	:return: A kinetic trajectory with the results
 	:rtype: Trajectory
 	"""
+	names, _ = _idsimf_rs_columns(rs_file_path, species)
+	chunks = _read_idsimf_rs_chunks(rs_file_path, species, time_range, dtype, chunk_size)
+
+	if time_range is not None:
+		# only a part of the file is read, the size of the result is not known in advance:
+		chunks = list(chunks)
+		if chunks:
+			times = np.concatenate([chunk_times for chunk_times, _ in chunks])
+			data = np.concatenate([chunk_data for _, chunk_data in chunks])
+		else:
+			times = np.empty(0)
+			data = np.empty((0, len(names)), dtype=dtype)
+		return Trajectory(names, times, data, concentration_unit='simulated particles')
+
+	# the number of lines in the file is an upper bound for the number of time steps to read:
+	n_max_timesteps = _count_lines(rs_file_path) - 2
+	times = np.empty(n_max_timesteps)
+	data = np.empty((n_max_timesteps, len(names)), dtype=dtype)
+
+	n_read = 0
+	for chunk_times, chunk_data in chunks:
+		n_chunk = len(chunk_times)
+		times[n_read:n_read + n_chunk] = chunk_times
+		data[n_read:n_read + n_chunk] = chunk_data
+		n_read += n_chunk
+
+	if n_read < n_max_timesteps:
+		# the trimmed data is copied, the trajectory should not keep the oversized buffers alive:
+		times = times[:n_read].copy()
+		data = data[:n_read].copy()
+
+	return Trajectory(names, times, data, concentration_unit='simulated particles')
+
+
+def read_idsimf_rs_result_chunked(rs_file_path, chunk_size=100000, species=None, time_range=None,
+                                  dtype=np.float64):
+	"""
+	Reads an IDSimF reaction simulatio (RS) result file in chunks: A generator of kinetic trajectories with at most
+	``chunk_size`` time steps is returned. Thus, RS result files which do not fit into memory can be processed
+	chunk by chunk.
+
+	See :py:func:`read_idsimf_rs_result` for the parameters.
+
+	:return: Generator of kinetic trajectory chunks
+	"""
+	names, _ = _idsimf_rs_columns(rs_file_path, species)
+	return (
+		Trajectory(names, chunk_times, chunk_data, concentration_unit='simulated particles')
+		for chunk_times, chunk_data in _read_idsimf_rs_chunks(rs_file_path, species, time_range, dtype, chunk_size))
+
+
+def follow_idsimf_rs_result(rs_file_path, species=None, poll_interval=1.0, timeout=None, dtype=np.float64):
+	"""
+	Follows a growing IDSimF reaction simulation (RS) result file, which is written by a running simulation:
+	A generator of kinetic trajectories is returned, every trajectory contains the time steps appended to the file
+	since the previous one. Only complete lines are read, the file is polled every ``poll_interval`` seconds for
+	new data.
+
+	.. code-block:: python
+
+		for chunk in follow_idsimf_rs_result('running_simulation_concentrations.txt', timeout=600):
+			print(chunk.times.iloc[-1])
+
+	:param rs_file_path: The path to the IDSimF-RS result file
+	:type rs_file_path: path
+	:param species: Names of the chemical species to read (all species are read if None)
+	:type species: list of str
+	:param poll_interval: Time in seconds between two checks of the file for new data
+	:type poll_interval: float
+	:param timeout: The generator stops if the file has not grown for ``timeout`` seconds. If None, the file is
+		followed until the generator is closed.
+	:type timeout: float
+	:param dtype: Data type of the concentration data
+	:type dtype: numpy.dtype
+	:return: Generator of kinetic trajectory chunks
+	"""
+	names = None
+	offset = 0
+	pending = b''
+	last_growth = time.monotonic()
+	while True:
+		with open(rs_file_path, 'rb') as rs_file:
+			rs_file.seek(offset)
+			new_data = rs_file.read()
+
+		if new_data:
+			offset += len(new_data)
+			last_growth = time.monotonic()
+			pending += new_data
+
+			if names is None and pending.count(b'\n') >= 2:
+				names, columns = _idsimf_rs_columns(rs_file_path, species)
+				pending = pending.split(b'\n', 2)[2]
+
+			if names is not None and b'\n' in pending:
+				complete_lines, _, pending = pending.rpartition(b'\n')
+				chunk = np.loadtxt(io.StringIO(complete_lines.decode()), delimiter=';', usecols=[1] + columns,
+				                   dtype=np.float64, ndmin=2)
+				if len(chunk) > 0:
+					yield Trajectory(names, chunk[:, 0], chunk[:, 1:].astype(dtype, copy=False),
+					                 concentration_unit='simulated particles')
+				continue
+
+		if timeout is not None and time.monotonic() - last_growth > timeout:
+			return
+		time.sleep(poll_interval)
+
+
+def _idsimf_rs_columns(rs_file_path, species):
+	"""
+	Parses the header of an RS result file and returns the names and the column indices of the selected species
+	"""
+	with open(rs_file_path, 'r') as rs_file:
+		rs_file.readline()  # skip result type line
+		header = [col.strip() for col in rs_file.readline().split(';')]
+
+	all_names = header[2:]
+	if all_names and all_names[-1] == '':  # lines are terminated with a delimiter
+		all_names = all_names[:-1]
+
+	if species is None:
+		names = all_names
+	else:
+		names = list(species)
+		for sp in names:
+			if sp not in all_names:
+				raise ValueError('Species ' + str(sp) + ' not found in RS result file')
+
+	columns = [all_names.index(sp) + 2 for sp in names]
+	return names, columns
+
+
+def _read_idsimf_rs_chunks(rs_file_path, species, time_range, dtype, chunk_size):
+	"""
+	Generator which reads the selected species and time range from an RS result file in chunks of
+	times and concentrations
+	"""
+	names, columns = _idsimf_rs_columns(rs_file_path, species)
+	col_dtypes = {1: np.float64}
+	col_dtypes.update({col: dtype for col in columns})
+
+	reader = pd.read_csv(rs_file_path, skiprows=2, header=None, delimiter=';',
+	                     usecols=[1] + columns, dtype=col_dtypes, chunksize=chunk_size)
+	for chunk in reader:
+		chunk_times = chunk[1].to_numpy()
+		chunk_data = chunk[columns].to_numpy(dtype=dtype)
+
+		if time_range is not None:
+			selected = (chunk_times >= time_range[0]) & (chunk_times <= time_range[1])
+			chunk_times, chunk_data = chunk_times[selected], chunk_data[selected]
+
+		if len(chunk_times) > 0:
+			yield chunk_times, chunk_data
+
+		# time is monotonically increasing in RS results:
+		if time_range is not None and chunk[1].iloc[-1] > time_range[1]:
+			break
+
+
+def _count_lines(file_path, block_size=1 << 20):
+	"""
+	Counts the lines in a file
+	"""
+	n_lines = 0
+	last_block = b''
+	with open(file_path, 'rb') as f:
+		block = f.read(block_size)
+		while block:
+			n_lines += block.count(b'\n')
+			last_block = block
+			block = f.read(block_size)
+
+	if last_block and not last_block.endswith(b'\n'):
+		n_lines += 1
+	return n_lines
+
+
+def write_trajectory_store(trajectory, store_path):
+	"""
+	Writes a kinetic trajectory to a binary trajectory store. A trajectory store is a directory with
+	the trajectory meta data (species names, attributes, units) in a json file (``trajectory.json``),
+	the times (``times.npy``) and the concentration data (``data.npy``) as numpy arrays.
+
+	The concentration data is stored column wise (the time series of a chemical species is contiguous on disk),
+	thus individual chemical species can be read from a memory mapped trajectory store efficiently
+	(see :py:func:`read_trajectory_store`).
+
+	:param trajectory: The kinetic trajectory to write
+	:type trajectory: Trajectory
+	:param store_path: The path of the trajectory store directory (created if not existing)
+	:type store_path: path
+	"""
+	os.makedirs(store_path, exist_ok=True)
+	meta_path = os.path.join(store_path, 'trajectory.json')
+	if os.path.exists(meta_path):
+		os.remove(meta_path)
+
+	meta_data = {
+		'format_version': TRAJECTORY_STORE_VERSION,
+		'species_names': list(trajectory.species_names),
+		'number_of_timesteps': trajectory.number_of_timesteps,
+		'attributes': trajectory.attributes,
+		'time_scaling_factor': trajectory.time_scaling_factor,
+		'concentration_unit': trajectory.concentration_unit
+	}
+
+	np.save(os.path.join(store_path, 'times.npy'), np.asarray(trajectory.time_values, dtype=float))
+	np.save(os.path.join(store_path, 'data.npy'), np.asfortranarray(trajectory.values))
+
+	# the meta data is written last, a store without meta data is incomplete:
+	with open(meta_path, 'w') as meta_file:
+		json.dump(meta_data, meta_file, default=_json_default)
+
+
+def read_trajectory_store(store_path, memory_mapped=True):
+	"""
+	Reads a kinetic trajectory from a binary trajectory store (see :py:func:`write_trajectory_store`).
+
+	By default, the concentration data is memory mapped and not read into memory: Opening a trajectory
+	store is fast, independently of the size of the trajectory, and only accessed data is read from disk. For
+	example ``trajectory.loc['H3O+']`` reads only the time series of ``H3O+``.
+
+	:param store_path: The path of the trajectory store directory
+	:type store_path: path
+	:param memory_mapped: If True, the concentration data is memory mapped (read only), otherwise the data is read
+		into memory
+	:type memory_mapped: bool
+	:return: A kinetic trajectory with the stored data
+	:rtype: Trajectory
+	"""
+	meta_path = os.path.join(store_path, 'trajectory.json')
+	if not os.path.isfile(meta_path):
+		raise ValueError('The given path ' + str(store_path) + ' is not a trajectory store')
+
+	with open(meta_path, 'r') as meta_file:
+		meta_data = json.load(meta_file)
+
+	if meta_data['format_version'] > TRAJECTORY_STORE_VERSION:
+		raise ValueError('Trajectory store format version ' + str(meta_data['format_version']) +
+		                 ' is not supported')
 
-	df = pd.read_csv(rs_file_path, skiprows=1, delimiter=';').iloc[:, :-1].rename(columns=lambda x: x.strip())
-	names = df.columns.tolist()[2:]
-	times = df['Time'].tolist()
-	data = df[names].values
+	mmap_mode = 'r' if memory_mapped else None
+	times = np.load(os.path.join(store_path, 'times.npy'))
+	data = np.load(os.path.join(store_path, 'data.npy'), mmap_mode=mmap_mode)
 
-	trajectory = Trajectory(names, times, data, concentration_unit='simulated particles')
-	return trajectory
+	return Trajectory(meta_data['species_names'], times, data, meta_data['attributes'],
+	                  time_scaling_factor=meta_data['time_scaling_factor'],
+	                  concentration_unit=meta_data['concentration_unit'])
+
+
+def _json_default(obj):
+	"""
+	Converts numpy objects in trajectory attributes to json serializable objects
+	"""
+	if isinstance(obj, (np.generic, np.ndarray)):
+		return obj.tolist()
+	raise TypeError('Object of type ' + type(obj).__name__ + ' is not json serializable')
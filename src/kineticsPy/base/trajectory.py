@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 
+import numpy as np
 import pandas as pd
 
-__all__ = ["Trajectory"]
+__all__ = ["Trajectory", "concatenate_trajectories"]
 
 
 class TrajectoryIndexer:
@@ -15,18 +16,50 @@ class TrajectoryIndexer:
 		self._tajectory = parent_trajectory
 
 	def __getitem__(self, arg):
-		try:
-			if len(arg) == 1:
-				return self._tajectory.data[arg[0]]
-			elif len(arg) == 2:
-				if type(arg[0]) == str and type(arg[1]) == str:  # two species names given
-					return self._tajectory.data[arg]
-				else:
-					return self._tajectory.data[arg[0]].iloc[arg[1]]
+		tra = self._tajectory
+		if isinstance(arg, tuple) and len(arg) == 2 and isinstance(arg[0], str) and isinstance(arg[1], str):
+			# two species names given
+			species, time_steps = list(arg), None
+		elif isinstance(arg, tuple) and len(arg) == 2:
+			species, time_steps = arg
+		elif isinstance(arg, tuple) and len(arg) == 1:
+			species, time_steps = arg[0], None
+		else:
+			species, time_steps = arg, None
+
+		if isinstance(species, str):
+			# single species: time series is a view on the concentration data column
+			col = tra.species_index(species)
+			if time_steps is None:
+				return pd.Series(tra.values[:, col], index=tra.time_index, name=species, copy=False)
+			elif _is_time_step(time_steps):
+				return tra.values[time_steps, col]
 			else:
-				return self._tajectory.data[arg]
-		except KeyError as ke:
-			raise ValueError('Species ' + str(ke) + ' not found in trajectory')
+				# slices, lists of time steps and boolean masks select a time series:
+				return pd.Series(tra.values[time_steps, col], index=tra.time_index[time_steps], name=species,
+				                 copy=False)
+		else:
+			species = list(species)
+			cols = [tra.species_index(sp) for sp in species]
+			if time_steps is None:
+				return pd.DataFrame(tra.values[:, cols], index=tra.time_index, columns=species, copy=False)
+			elif _is_time_step(time_steps):
+				return pd.Series(tra.values[time_steps, cols], index=species, name=tra.time_index[time_steps],
+				                 copy=False)
+			elif isinstance(time_steps, slice):
+				return pd.DataFrame(tra.values[time_steps][:, cols], index=tra.time_index[time_steps],
+				                    columns=species, copy=False)
+			else:
+				rows = np.arange(tra.number_of_timesteps)[time_steps]
+				return pd.DataFrame(tra.values[np.ix_(rows, cols)], index=tra.time_index[time_steps],
+				                    columns=species, copy=False)
+
+
+def _is_time_step(time_steps):
+	"""
+	Checks if a time step selection is a single time step index
+	"""
+	return isinstance(time_steps, (int, np.integer)) and not isinstance(time_steps, bool)
 
 
 class Trajectory:
@@ -35,11 +68,12 @@ class Trajectory:
 	A kinetic trajectory is an abstracted kinetic simulation result, consisting of a time series of concentrations,
 	simulation run meta data and convenient data access methods.
 
-	The trajectory class is based on numpy and pandas.
+	The trajectory class is based on numpy and pandas: The concentration data is stored in a two dimensional
+	numpy array (time steps x species), Pandas objects are created on demand as views on this array.
 	"""
 
 	def __init__(self, species_names, times, data, attributes=None,
-	             time_scaling_factor=1.0, concentration_unit='molecules/cm^3'):
+	             time_scaling_factor=1.0, concentration_unit='molecules/cm^3', copy=False):
 		"""
 		Constructs a new kinetic trajectory
 
@@ -49,7 +83,8 @@ class Trajectory:
 		:type times: array_like with shape ``[n timesteps]``
 		:param data: Concentration time series, essentially a two dimensional matrix of concentration
 		 values for every time step and every time
-		:type data: array_like with shape ``[number of time steps, number of species]``
+		:type data: array_like with shape ``[number of time steps, number of species]`` (or
+			``[number of time steps]`` for a single species)
 		:param attributes: Optional trajectory attributes / meta data describing the trajectory (e.g. temperatures, pressures)
 		:type attributes: dict
 		:param time_scaling_factor: scaling factor for the time dimension of the trajectory relative to seconds
@@ -58,13 +93,29 @@ class Trajectory:
 		:param concentration_unit: Identifier string for the concentration unit used in the trajectory
 			(mostly for plotting / visualization purposes)
 		:type concentration_unit: str
+		:param copy: If True, the time and concentration data is copied. Otherwise, numpy arrays passed as
+			time and concentration data are taken over by the trajectory without copying (e.g. to wrap memory mapped
+			data without reading it completely into memory). Thus, they should not be modified afterwards.
+		:type copy: bool
 		"""
+		times = np.array(times, copy=True) if copy else np.asarray(times)
+		data = np.array(data, copy=True) if copy else np.asarray(data)
+		if data.ndim == 1 and len(species_names) == 1:
+			# one dimensional time series of a single species:
+			data = data.reshape(-1, 1)
+
+		if data.ndim != 2 or data.shape != (len(times), len(species_names)):
+			raise ValueError('Shape of concentration data ' + str(data.shape) + ' does not match the number of '
+			                 'time steps (' + str(len(times)) + ') and species (' + str(len(species_names)) + ')')
 
 		self._species_names = species_names
-		self._times = pd.Series(times)
+		self._species_index = {sp: i for i, sp in enumerate(species_names)}
+		self._time_values = times
+		self._values = data
 		self._n_timesteps = len(times)
-		self._data = pd.DataFrame(data=data, columns=species_names, index=times)
-		self._data.index.name = "Time"
+		self._times = None
+		self._time_index = None
+		self._data = None
 		self._indexer = TrajectoryIndexer(self)
 		self._attributes = attributes
 		self._time_scaling_factor = time_scaling_factor
@@ -82,9 +133,27 @@ class Trajectory:
 		"""
 		Returns the times of the simulated time steps
 		"""
-
+		if self._times is None:
+			self._times = pd.Series(self._time_values, copy=False)
 		return self._times
 
+	@property
+	def time_values(self):
+		"""
+		Returns the times of the simulated time steps as numpy array
+		"""
+		return self._time_values
+
+	@property
+	def time_index(self):
+		"""
+		Returns the times of the simulated time steps as Pandas Index (the index of the Pandas objects returned
+		by the trajectory)
+		"""
+		if self._time_index is None:
+			self._time_index = pd.Index(self._time_values, name='Time', copy=False)
+		return self._time_index
+
 	@property
 	def species_names(self):
 		"""
@@ -92,11 +161,33 @@ class Trajectory:
 		"""
 		return self._species_names
 
+	def species_index(self, species):
+		"""
+		Returns the column index of a chemical species in the concentration data
+
+		:param species: Name of the chemical species
+		:type species: str
+		"""
+		try:
+			return self._species_index[species]
+		except KeyError as ke:
+			raise ValueError('Species ' + str(ke) + ' not found in trajectory')
+
+	@property
+	def values(self):
+		"""
+		Returns the concentration data as two dimensional numpy array (time steps x species)
+		"""
+		return self._values
+
 	@property
 	def data(self):
 		"""
-		Returns the underlying low level data object (currently a Pandas DataFrame)
+		Returns the concentration data as Pandas DataFrame (a view on the concentration data)
 		"""
+		if self._data is None:
+			self._data = pd.DataFrame(
+				data=self._values, columns=self._species_names, index=self.time_index, copy=False)
 		return self._data
 
 	@property
@@ -145,5 +236,33 @@ class Trajectory:
 		return self._n_timesteps
 
 	def __getitem__(self, arg):
-		buf = self._data.iloc[arg]
-		return buf
\ No newline at end of file
+		buf = self.data.iloc[arg]
+		return buf
+
+
+def concatenate_trajectories(trajectories):
+	"""
+	Concatenates a sequence of kinetic trajectories with the same chemical species (e.g. the chunks generated by
+	a chunked simulation) to one trajectory. The attributes, time scaling factor and concentration unit of the first
+	trajectory are used for the resulting trajectory.
+
+	:param trajectories: The trajectories to concatenate
+	:type trajectories: iterable of Trajectory
+	:returns: The concatenated trajectory
+	:rtype: Trajectory
+	"""
+	trajectories = list(trajectories)
+	if not trajectories:
+		raise ValueError('No trajectories to concatenate')
+
+	first = trajectories[0]
+	for tra in trajectories[1:]:
+		if list(tra.species_names) != list(first.species_names):
+			raise ValueError('Trajectories with different chemical species can not be concatenated')
+
+	times = np.concatenate([tra.time_values for tra in trajectories])
+	data = np.concatenate([tra.values for tra in trajectories])
+
+	return Trajectory(first.species_names, times, data, first.attributes,
+	                  time_scaling_factor=first.time_scaling_factor,
+	                  concentration_unit=first.concentration_unit)
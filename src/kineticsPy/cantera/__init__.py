@@ -4,6 +4,16 @@
 Interface module for cantera simulations
 """
 
+from .mechanism import *
+from .recording import *
+from .convergence import *
+from .instrumentation import *
+from .sensitivity import *
 from .simulation import *
+from .pipeline import *
+from .batch import *
+from .massaction import *
+from .result_cache import *
+from .sweep import *
 
 #__all__ = ["simulation"]
\ No newline at end of file
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+"""
+Batched simulations: Multiple independent reactors integrated together in one Cantera reactor network
+"""
+import os
+import numpy as np
+import cantera as ct
+from kineticsPy.base.trajectory import Trajectory
+from kineticsPy.cantera import simulation
+from kineticsPy.cantera.mechanism import load_mechanism
+
+__all__ = ["simulate_isobar_adiabatic_batch"]
+
+
+def simulate_isobar_adiabatic_batch(input_file, initial_mole_fractions, *args, record_period=1, rtol=None,
+                                    mechanism_cache=True, batch_size=16):
+	"""
+	Runs isobar, adiabatic simulations (see :py:func:`kineticsPy.cantera.simulation.simulate_isobar_adiabatic`) for
+	a set of initial compositions at the same pressure and time steps. Instead of running the cases one by one,
+	a batch of independent reactors is integrated together in one Cantera reactor network. Thus, the per-run setup
+	and the number of Python calls of the solver are reduced by the number of reactors in a batch:
+
+	.. code-block:: python
+
+		results = simulate_isobar_adiabatic_batch(
+			'WaterCluster_RoomTemp.cti',
+			['H2O:1e+14, N2:2.54e+17, H3O+:1e+10', 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10'],
+			10000, 2e-9, 1e5)
+
+	The concentrations of all reactors of a batch are taken from the combined state vector of the reactor network in
+	one vectorized operation.
+
+	The solver of a reactor network uses a dense Jacobian of the combined system of all reactors and common
+	time steps for all reactors, which become inefficient for very large batches. Therefore, the cases are split
+	into batches of at most ``batch_size`` reactors. Since the time steps of the solver are chosen for all
+	reactors of a batch together, the results can differ from individual simulation runs within the solver
+	tolerances.
+
+	Call signatures:
+
+	.. code-block:: python
+
+		simulate_isobar_adiabatic_batch(input_file, initial_mole_fractions, n_steps, dt, pressure, record_period=1, ...)
+		simulate_isobar_adiabatic_batch(input_file, initial_mole_fractions, custom_steps, pressure, record_period=1, ...)
+
+	:param input_file: Path to a configuration (.cti) file
+	:type input_file: path
+	:param initial_mole_fractions: Inital mole fraction configurations of the simulated cases, a single
+		configuration is simulated as one case
+	:type initial_mole_fractions: list of str or dict or numpy.ndarray, or str or dict
+	:param batch_size: Maximum number of reactors integrated together in one reactor network
+	:type batch_size: int
+	:return: The resulting trajectories in the order of the initial mole fraction configurations
+	:rtype: list of :class:`kineticsPy.base.trajectory.Trajectory`
+
+	See :py:func:`kineticsPy.cantera.simulation.simulate_isobar_adiabatic` for the other parameters.
+	"""
+	if not os.path.isfile(input_file):
+		raise ValueError('The given cantea file input file is not existing')
+	if batch_size < 1:
+		raise ValueError('Batch size has to be at least 1')
+	if record_period < 1:
+		raise ValueError('Recording period has to be at least 1')
+
+	n_steps, dt, custom_steps, pressure = simulation._parse_time_step_arguments(args)
+	mechanism = load_mechanism(input_file, cache=mechanism_cache)
+
+	if isinstance(initial_mole_fractions, (str, dict)):
+		initial_mole_fractions = [initial_mole_fractions]
+	results = []
+	for i in range(0, len(initial_mole_fractions), batch_size):
+		results.extend(_run_batch(mechanism, initial_mole_fractions[i:i + batch_size], n_steps, dt, custom_steps,
+		                          pressure, record_period, rtol))
+	return results
+
+
+def _run_batch(mechanism, initial_mole_fractions, n_steps, dt, custom_steps, pressure, record_period, rtol):
+	"""
+	Integrates a batch of reactors in one reactor network and returns the trajectories of the reactors
+	"""
+	species_names = mechanism.species_names
+	n_species = len(species_names)
+
+	# every reactor needs its own phase, the phases are cloned from the parsed mechanism.
+	# The pressure holding wall of the single simulations has zero area, thus no walls are required:
+	reactors = []
+	for mole_fractions in initial_mole_fractions:
+		sol = mechanism.clone()
+		sol.TPX = sol.T, sol.P if pressure is None else pressure, mole_fractions
+		reactors.append(ct.IdealGasReactor(sol, clone=False))
+	sim = ct.ReactorNet(reactors)
+	if rtol:
+		sim.rtol = rtol
+
+	# position of the mass fractions in the state vectors of the reactors:
+	reac = reactors[0]
+	n_vars = reac.n_vars
+	i_species = reac.component_index(species_names[0])
+	i_species_end = i_species + n_species
+
+	# mass fractions are converted to concentrations in molecules / cm^3 with the densities and molecular weights.
+	# Mass and volume of the reactors are constant (there are no walls or flows), thus the densities are constant:
+	n_reactors = len(reactors)
+	densities = np.array([r.density for r in reactors])
+	conversion = np.outer(densities, simulation._CONCENTRATION_CONVERSION / reac.phase.molecular_weights)
+
+	n_rec_steps = int(np.ceil(n_steps / record_period))
+	times = np.zeros(n_rec_steps)
+	data = np.zeros((n_reactors, n_rec_steps, n_species))
+
+	if custom_steps is None:
+		time = 0.0
+	else:
+		time = custom_steps[0]
+	n_recorded = 0
+	for n in range(n_steps):
+		sim.advance(time)
+
+		if n % record_period == 0:
+			times[n_recorded] = time
+			state = sim.get_state().reshape(n_reactors, n_vars)
+			np.multiply(state[:, i_species:i_species_end], conversion, out=data[:, n_recorded])
+			n_recorded += 1
+
+		if custom_steps is None:
+			time += dt
+		elif n < n_steps-1:
+			time = custom_steps[n+1]
+
+	return [Trajectory(species_names, times.copy(), data[i], {'pressure': pressure}) for i in range(n_reactors)]
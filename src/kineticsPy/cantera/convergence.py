@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+"""
+Online convergence detection for running kinetic simulations
+"""
+import numpy as np
+
+__all__ = ["ConvergenceMonitor"]
+
+
+class ConvergenceMonitor:
+	"""
+	Incremental convergence monitor: Detects while a simulation is running if all chemical species have reached
+	an equilibrium state. The monitor keeps running statistics of the concentrations in a sliding window of the last
+	``window`` recorded samples: A running mean (a Welford update while the window is filled, a sliding window
+	update afterwards) and the minimum / maximum in the window. The running mean is recomputed from the window
+	every ``check_period`` samples, thus rounding errors of the sliding update do not accumulate. The simulation is
+	considered as converged if the relative fluctuation ``(max - min) / mean`` of every chemical
+	species in the window is not larger than ``reltol``, which is the same criterion as used by
+	:py:func:`kineticsPy.analysis.analysis.equilibrium_state`. Trace species, which fluctuate around zero, can be
+	excluded from the criterion with an absolute tolerance ``atol``: A species is converged if
+	``max - min <= atol + reltol * |mean|``.
+
+	If ``stop`` is True, the simulation is stopped as soon as convergence is detected.
+	"""
+
+	def __init__(self, window=100, reltol=0.01, atol=0.0, stop=True, check_period=10):
+		"""
+		Constructs a new convergence monitor
+
+		:param window: Number of recorded samples in the sliding window
+		:type window: int
+		:param reltol: Relative tolerance for the fluctuation of the chemical species in the window
+		:type reltol: float
+		:param atol: Absolute tolerance for the fluctuation of the chemical species in the window (in the
+			concentration unit of the simulation)
+		:type atol: float
+		:param stop: If True, the simulation is stopped when convergence is detected
+		:type stop: bool
+		:param check_period: The period (in recorded samples) with which the convergence criterion is checked
+		:type check_period: int
+		"""
+		if window < 2:
+			raise ValueError('Convergence window has to contain at least two samples')
+		if check_period < 1:
+			raise ValueError('Convergence check period has to be at least 1')
+
+		self._window = window
+		self._reltol = reltol
+		self._atol = atol
+		self._stop = stop
+		self._check_period = check_period
+		self.reset(0)
+
+	@property
+	def stop(self):
+		"""
+		Returns True if the simulation should be stopped when convergence is detected
+		"""
+		return self._stop
+
+	@property
+	def converged(self):
+		"""
+		Returns True if convergence was detected
+		"""
+		return self._converged_time is not None
+
+	@property
+	def converged_time(self):
+		"""
+		Returns the simulated time at which convergence was detected (None if not converged)
+		"""
+		return self._converged_time
+
+	@property
+	def number_of_samples(self):
+		"""
+		Returns the number of samples passed to the monitor
+		"""
+		return self._n_samples
+
+	@property
+	def mean(self):
+		"""
+		Returns the running average concentrations in the current window
+		"""
+		return self._mean
+
+	@property
+	def relative_spread(self):
+		"""
+		Returns the relative fluctuations of the chemical species in the window at the last convergence check
+		"""
+		return self._relative_spread
+
+	def reset(self, n_species):
+		"""
+		Prepares the monitor for a new simulation run
+
+		:param n_species: Number of chemical species in the simulation
+		:type n_species: int
+		"""
+		self._buffer = np.zeros((self._window, n_species))
+		self._mean = np.zeros(n_species)
+		self._relative_spread = None
+		self._n_samples = 0
+		self._converged_time = None
+
+	def update(self, time, concentrations):
+		"""
+		Adds a sample to the monitor
+
+		:param time: Simulated time of the sample
+		:type time: float
+		:param concentrations: Concentrations of the chemical species
+		:type concentrations: numpy.ndarray
+		:returns: True if the simulation is converged
+		:rtype: bool
+		"""
+		pos = self._n_samples % self._window
+		self._n_samples += 1
+
+		if self._n_samples <= self._window:
+			# Welford update of the mean while the window is filled:
+			self._mean += (concentrations - self._mean) / self._n_samples
+		else:
+			# sliding window: the oldest sample leaves the window
+			self._mean += (concentrations - self._buffer[pos]) / self._window
+		self._buffer[pos] = concentrations
+
+		if self._n_samples < self._window or self._n_samples % self._check_period != 0:
+			return self._converged_time is not None
+
+		# the running mean is synchronized with the window, the sliding update accumulates rounding errors:
+		self._mean = self._buffer.mean(axis=0)
+		if self._converged_time is None:
+			with np.errstate(divide='ignore', invalid='ignore'):
+				spread = self._buffer.max(axis=0) - self._buffer.min(axis=0)
+				self._relative_spread = np.abs(spread / self._mean)
+			if not np.any(spread > self._atol + self._reltol * np.abs(self._mean)):
+				self._converged_time = time
+
+		return self._converged_time is not None
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+"""
+Opt-in instrumentation of running simulations: Wall clock timers, counters, solver statistics and periodic callbacks
+"""
+from time import perf_counter
+
+__all__ = ["SimulationProfiler"]
+
+# timer categories of the simulation loops:
+SETUP = 'setup'
+INTEGRATION = 'integration'
+EXTRACTION = 'extraction'
+CONVERSION = 'conversion'
+RECORDING = 'recording'
+CONVERGENCE = 'convergence'
+CALLBACKS = 'callbacks'
+OVERHEAD = 'overhead'
+
+_TIMER_CATEGORIES = (SETUP, INTEGRATION, EXTRACTION, CONVERSION, RECORDING, CONVERGENCE, CALLBACKS, OVERHEAD)
+
+
+class SimulationProfiler:
+	"""
+	Profiler for simulation runs: Measures how the wall clock time of a simulation is distributed on
+
+	* ``setup``: Reset of the mechanism and construction of the reactor network
+	* ``integration``: The Cantera solver (``advance`` / ``step`` calls)
+	* ``extraction``: Reading the concentrations from the Cantera phase
+	* ``conversion``: Conversion of the concentrations to molecules / cm^3
+	* ``recording``: Recording decisions, writing of the recording buffers and interpolation of solver steps
+	* ``convergence``: Updates of the convergence monitor
+	* ``callbacks``: Progress reports and profiler callbacks
+	* ``overhead``: The remaining time of the Python simulation loop
+
+	and counts the simulation loop steps, the recorded samples and the callback calls. The statistics of the
+	Cantera solver (e.g. internal integrator steps and right hand side evaluations) are taken over at the end of the
+	simulation if the Cantera version provides them (``ReactorNet.solver_stats``).
+
+	A profiler is passed to a simulation function (e.g. with the ``profiler`` argument of
+	:py:func:`kineticsPy.cantera.simulation.simulate_isobar_adiabatic`), the collected statistics are attached as
+	``profile`` attribute to the resulting trajectory:
+
+	.. code-block:: python
+
+		result = simulate_isobar_adiabatic(input_file, initial_mole_fractions, 100000, 2e-9, 1e5,
+		                                   profiler=SimulationProfiler())
+		print(result.attributes['profile']['timers']['integration'])
+
+	Timing of the individual parts of the simulation loop adds a small overhead to every simulation step,
+	simulations without profiler are not affected.
+	"""
+
+	def __init__(self):
+		"""
+		Constructs a new simulation profiler
+		"""
+		self._callbacks = []
+		self.reset()
+
+	@property
+	def timers(self):
+		"""
+		Returns the accumulated wall clock times (in s) of the timer categories
+		"""
+		return dict(self._timers)
+
+	@property
+	def counters(self):
+		"""
+		Returns the counters of simulation loop steps (``steps``), recorded samples (``recorded_samples``) and
+		callback calls (``callback_calls``)
+		"""
+		return {'steps': self._n_steps, 'recorded_samples': self._n_recorded, 'callback_calls': self._n_callback_calls}
+
+	@property
+	def solver_stats(self):
+		"""
+		Returns the statistics of the Cantera solver (None if not provided by the Cantera version)
+		"""
+		return self._solver_stats
+
+	@property
+	def total_time(self):
+		"""
+		Returns the total wall clock time (in s) of the profiled simulation (the time until now if the simulation is
+		running). The time spent outside of the simulation between the chunks of a chunked simulation is not
+		included.
+		"""
+		if self._start_time is None:
+			return 0.0
+		end_time = perf_counter() if self._end_time is None else self._end_time
+		return end_time - self._start_time - self._skipped_time
+
+	@property
+	def stats(self):
+		"""
+		Returns all collected statistics as dict with the entries ``total_time``, ``timers``, ``counters`` and
+		``solver_stats``
+		"""
+		return {
+			'total_time': self.total_time,
+			'timers': self.timers,
+			'counters': self.counters,
+			'solver_stats': None if self._solver_stats is None else dict(self._solver_stats)}
+
+	def add_callback(self, callback, period=1000):
+		"""
+		Adds a callback which is called every ``period`` simulation loop steps with the index of the current
+		step, the current simulated time and the profiler (``callback(step, time, profiler)``)
+
+		:param callback: The callback
+		:type callback: callable
+		:param period: The period (in simulation loop steps) of the calls
+		:type period: int
+		"""
+		if period < 1:
+			raise ValueError('Callback period has to be at least 1')
+		self._callbacks.append((callback, period))
+
+	def reset(self):
+		"""
+		Resets all statistics of the profiler (the callbacks are kept)
+		"""
+		self._timers = dict.fromkeys(_TIMER_CATEGORIES, 0.0)
+		self._n_steps = 0
+		self._n_recorded = 0
+		self._n_callback_calls = 0
+		self._solver_stats = None
+		self._start_time = None
+		self._end_time = None
+		self._lap_time = None
+		self._skipped_time = 0.0
+
+	def _start(self):
+		"""
+		Starts the profiling of a simulation run
+		"""
+		self.reset()
+		self._start_time = perf_counter()
+		self._lap_time = self._start_time
+
+	def _lap(self, category):
+		"""
+		Adds the time since the last lap to a timer category
+		"""
+		now = perf_counter()
+		self._timers[category] += now - self._lap_time
+		self._lap_time = now
+
+	def _skip(self):
+		"""
+		Discards the time since the last lap (e.g. the time a consumer of a chunked simulation spends between the
+		chunks)
+		"""
+		now = perf_counter()
+		self._skipped_time += now - self._lap_time
+		self._lap_time = now
+
+	def _step(self, step, time):
+		"""
+		Counts a simulation loop step and calls the due callbacks
+		"""
+		self._n_steps += 1
+		for callback, period in self._callbacks:
+			if step % period == 0:
+				self._n_callback_calls += 1
+				callback(step, time, self)
+
+	def _recorded(self, n_samples=1):
+		"""
+		Counts recorded samples
+		"""
+		self._n_recorded += n_samples
+
+	def _finish(self, sim):
+		"""
+		Ends the profiling of a simulation run and takes over the statistics of the Cantera solver
+		"""
+		self._lap(OVERHEAD)
+		self._end_time = self._lap_time
+		solver_stats = getattr(sim, 'solver_stats', None)
+		self._solver_stats = None if solver_stats is None else dict(solver_stats)
@@ -0,0 +1,432 @@
+# -*- coding: utf-8 -*-
+
+"""
+Lightweight mass action kinetics engine: Isothermal, isochoric kinetics of simple reaction systems (e.g. ion cluster
+systems) integrated directly with NumPy / SciPy instead of a Cantera reactor network
+"""
+import os
+import numpy as np
+import scipy.sparse as sp
+from scipy.integrate import solve_ivp
+import cantera as ct
+from kineticsPy.base.trajectory import Trajectory
+from kineticsPy.cantera import simulation
+from kineticsPy.cantera.mechanism import load_mechanism
+
+__all__ = ["MassActionModel", "simulate_mass_action", "simulate_mass_action_batch"]
+
+# stiff solvers of scipy which use the analytic Jacobian:
+_SOLVER_METHODS = ('BDF', 'Radau', 'LSODA')
+
+# Cantera versions before 3.0 include the third body concentration in the forward / reverse rate constants:
+_LEGACY_RATE_CONSTANTS = int(ct.__version__.split('.')[0]) < 3
+
+
+class MassActionModel:
+	"""
+	Mass action kinetics of a parsed Cantera mechanism at constant temperature: The reactions are compiled into a
+	sparse stoichiometry matrix, an index matrix of the reactants and a sparse matrix of third body efficiencies.
+	Thus, the rates of progress, the species production rates and the analytic Jacobian of the production rates are
+	evaluated with vectorized numpy operations for a whole batch of independent cases (concentration vectors) at once.
+
+	Reversible reactions are split into a forward and a reverse reaction direction. The rate of progress of a reaction
+	direction :math:`j` is
+
+	.. math::
+
+		r_j = k_j \\, [M]_j \\prod_i c_i^{\\nu_{ij}}
+
+	with the rate constant :math:`k_j`, the reactant orders :math:`\\nu_{ij}` and the effective third body
+	concentration :math:`[M]_j` (1 for reactions without third body). The rate constants are taken from Cantera at the
+	temperature of the mechanism, concentrations are in molecules / cm^3 and times in s.
+
+	Only reactions with rates which depend solely on the temperature (elementary and three body reactions with
+	Arrhenius rates and integer reaction orders) are supported.
+	"""
+
+	def __init__(self, mechanism, pressure=None):
+		"""
+		Compiles the mass action kinetics of a mechanism
+
+		:param mechanism: A parsed Cantera mechanism
+		:type mechanism: kineticsPy.cantera.mechanism.Mechanism
+		:param pressure: Pressure at which the rate constants are evaluated (the pressure from the input file is used
+			if None)
+		:type pressure: float
+		"""
+		sol = mechanism.reset(pressure)
+		species_names = sol.species_names
+		n_species = len(species_names)
+
+		kf = sol.forward_rate_constants
+		kr = sol.reverse_rate_constants
+		if _LEGACY_RATE_CONSTANTS:
+			concentrations = sol.concentrations
+
+		orders = []
+		direction_reactions = []
+		changes = []
+		rate_constants = []
+		efficiencies = []
+		for i, reaction in enumerate(sol.reactions()):
+			third_body = _third_body_efficiencies(reaction, species_names)
+			reactants = _stoichiometry_vector(reaction.reactants, species_names)
+			products = _stoichiometry_vector(reaction.products, species_names)
+
+			forward_orders = reactants.copy()
+			for species, order in reaction.orders.items():
+				forward_orders[species_names.index(species)] = order
+
+			directions = [(forward_orders, products - reactants, kf[i])]
+			if reaction.reversible:
+				directions.append((products, reactants - products, kr[i]))
+
+			for direction_orders, change, k in directions:
+				if np.any(direction_orders != np.round(direction_orders)):
+					raise ValueError('Reaction ' + reaction.equation + ' has non integer reaction orders')
+				total_order = np.sum(direction_orders)
+				if third_body is not None:
+					total_order += 1
+					if _LEGACY_RATE_CONSTANTS:
+						k /= np.dot(third_body, concentrations)
+
+				orders.append(direction_orders.astype(int))
+				direction_reactions.append(i)
+				changes.append(change)
+				# rate constants in kmol, m^3 are converted to molecules, cm^3:
+				rate_constants.append(k * simulation._CONCENTRATION_CONVERSION ** (1 - total_order))
+				efficiencies.append(third_body)
+
+		n_directions = len(orders)
+		max_order = max([np.sum(o) for o in orders] + [1])
+
+		# reactant index matrix: every reactant appears as often as its order, unused positions are padded with the
+		# index of an additional constant concentration of 1:
+		reactant_index = np.full((n_directions, max_order), n_species)
+		for j, direction_orders in enumerate(orders):
+			indices = np.repeat(np.arange(n_species), direction_orders)
+			reactant_index[j, :len(indices)] = indices
+
+		self._species_names = list(species_names)
+		self._temperature = sol.T
+		self._reactant_index = reactant_index
+		self._direction_reactions = np.array(direction_reactions, dtype=int)
+		self._stoichiometry = sp.csr_matrix(np.array(changes).T)
+		self._third_body = np.array([e is not None for e in efficiencies])
+		self._efficiencies = sp.csr_matrix(
+			np.array([np.zeros(n_species) if e is None else e for e in efficiencies]).reshape(n_directions, n_species))
+		self._rate_constants = np.array(rate_constants)
+		self._batch_stoichiometry_matrix = None
+
+	@property
+	def species_names(self):
+		"""
+		Returns the chemical species names of the model
+		"""
+		return self._species_names
+
+	@property
+	def temperature(self):
+		"""
+		Returns the temperature of the model (the temperature at which the rate constants are evaluated)
+		"""
+		return self._temperature
+
+	@property
+	def n_directions(self):
+		"""
+		Returns the number of reaction directions (reversible reactions are two reaction directions)
+		"""
+		return len(self._rate_constants)
+
+	@property
+	def direction_reactions(self):
+		"""
+		Returns the indices of the mechanism reactions of the reaction directions
+		"""
+		return self._direction_reactions
+
+	@property
+	def stoichiometry(self):
+		"""
+		Returns the sparse stoichiometry matrix (species x reaction directions)
+		"""
+		return self._stoichiometry
+
+	@property
+	def rate_constants(self):
+		"""
+		Returns the rate constants of the reaction directions in molecules, cm^3 and s
+		"""
+		return self._rate_constants
+
+	def rates_of_progress(self, concentrations, rate_constants=None):
+		"""
+		Calculates the rates of progress of the reaction directions
+
+		:param concentrations: Concentrations of a batch of cases in molecules / cm^3
+		:type concentrations: numpy.ndarray with shape ``[number of cases, number of species]``
+		:param rate_constants: Rate constants of the reaction directions, for all cases or per case (the rate constants
+			of the model are used if None)
+		:type rate_constants: numpy.ndarray with shape ``[number of directions]`` or
+			``[number of cases, number of directions]``
+		:return: Rates of progress in molecules / (cm^3 s)
+		:rtype: numpy.ndarray with shape ``[number of cases, number of directions]``
+		"""
+		return self._rate_terms(concentrations, rate_constants)[0]
+
+	def production_rates(self, concentrations, rate_constants=None):
+		"""
+		Calculates the net production rates of the species (the time derivatives of the concentrations)
+
+		See :py:meth:`rates_of_progress` for the parameters.
+
+		:return: Net production rates in molecules / (cm^3 s)
+		:rtype: numpy.ndarray with shape ``[number of cases, number of species]``
+		"""
+		return (self._stoichiometry @ self.rates_of_progress(concentrations, rate_constants).T).T
+
+	def jacobian(self, concentrations, rate_constants=None):
+		"""
+		Calculates the analytic Jacobian of the production rates with respect to the concentrations. The cases of a
+		batch are independent, thus the Jacobian of a batch is a block diagonal matrix with one block per case.
+
+		See :py:meth:`rates_of_progress` for the parameters.
+
+		:return: Sparse Jacobian of the flattened production rates of all cases
+		:rtype: scipy.sparse.csc_matrix with shape ``[number of cases * number of species,
+			number of cases * number of species]``
+		"""
+		concentrations = np.atleast_2d(concentrations)
+		n_cases, n_species = concentrations.shape
+		n_directions = self.n_directions
+		_, k, k_m, reactant_conc, reactant_products = self._rate_terms(concentrations, rate_constants)
+
+		# derivatives of the reactant products, the product of all other reactant positions for every position:
+		reactant_index = self._reactant_index
+		valid = reactant_index < n_species
+		directions, positions = np.nonzero(valid)
+		partial_products = np.empty((n_cases, len(directions)))
+		for p in range(reactant_index.shape[1]):
+			others = np.delete(reactant_conc, p, axis=2).prod(axis=2)
+			partial_products[:, positions == p] = others[:, directions[positions == p]]
+
+		case_offsets = np.arange(n_cases)[:, np.newaxis]
+		rows = [(case_offsets * n_directions + directions).ravel()]
+		cols = [(case_offsets * n_species + reactant_index[directions, positions]).ravel()]
+		data = [(k_m[:, directions] * partial_products).ravel()]
+
+		# derivatives of the third body concentrations:
+		efficiencies = self._efficiencies.tocoo()
+		rows.append((case_offsets * n_directions + efficiencies.row).ravel())
+		cols.append((case_offsets * n_species + efficiencies.col).ravel())
+		data.append((efficiencies.data * (k * reactant_products)[:, efficiencies.row]).ravel())
+
+		rate_derivatives = sp.csr_matrix(
+			(np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+			shape=(n_cases * n_directions, n_cases * n_species))
+		return (self._batch_stoichiometry(n_cases) @ rate_derivatives).tocsc()
+
+	def _rate_terms(self, concentrations, rate_constants=None):
+		"""
+		Calculates the rates of progress and the intermediate terms of the rates required for the Jacobian
+		"""
+		concentrations = np.atleast_2d(concentrations)
+		if rate_constants is None:
+			rate_constants = self._rate_constants
+		rate_constants = np.broadcast_to(rate_constants, (concentrations.shape[0], self.n_directions))
+
+		# the reactant concentrations of all reaction directions, padded with a constant concentration of 1:
+		extended = np.concatenate((concentrations, np.ones((concentrations.shape[0], 1))), axis=1)
+		reactant_conc = extended[:, self._reactant_index]
+		reactant_products = reactant_conc.prod(axis=2)
+
+		k_m = rate_constants * np.where(self._third_body, self._third_body_concentrations(concentrations), 1.0)
+		return k_m * reactant_products, rate_constants, k_m, reactant_conc, reactant_products
+
+	def _third_body_concentrations(self, concentrations):
+		"""
+		Calculates the effective third body concentrations of the reaction directions
+		"""
+		return (self._efficiencies @ concentrations.T).T
+
+	def _batch_stoichiometry(self, n_cases):
+		"""
+		Returns the block diagonal stoichiometry matrix of a batch of cases
+		"""
+		batch_stoichiometry = self._batch_stoichiometry_matrix
+		if batch_stoichiometry is None or batch_stoichiometry.shape[0] != n_cases * len(self._species_names):
+			batch_stoichiometry = sp.kron(sp.identity(n_cases, format='csr'), self._stoichiometry, format='csr')
+			self._batch_stoichiometry_matrix = batch_stoichiometry
+		return batch_stoichiometry
+
+
+def simulate_mass_action(input_file, initial_mole_fractions, *args, record_period=1, rtol=None, atol=None,
+                         method='BDF', mechanism_cache=True, rate_multipliers=None):
+	"""
+	Isothermal, isochoric kinetics simulation with the built-in mass action kinetics engine (see
+	:py:class:`MassActionModel`): The concentrations are integrated directly with a stiff scipy solver using the
+	analytic Jacobian, without the thermodynamics of a Cantera reactor network. For small reaction systems like ion
+	cluster systems, this is considerably faster than a Cantera simulation. The result corresponds to
+	:py:func:`kineticsPy.cantera.simulation.simulate_isochoric_isothermal` within the solver tolerances.
+
+	Call signatures:
+
+	.. code-block:: python
+
+		simulate_mass_action(input_file, initial_mole_fractions, n_steps, dt, pressure, record_period=1, ...)
+		simulate_mass_action(input_file, initial_mole_fractions, custom_steps, pressure, record_period=1, ...)
+
+	:param rtol: Relative tolerance of the solver (1e-9 if None)
+	:type rtol: float
+	:param atol: Absolute tolerance of the solver in molecules / cm^3 (1e-15 times the total initial concentration
+		if None)
+	:type atol: float
+	:param method: Stiff solver of :py:func:`scipy.integrate.solve_ivp` ('BDF', 'Radau' or 'LSODA')
+	:type method: str
+	:param rate_multipliers: Multipliers of the rate constants of the reactions
+	:type rate_multipliers: numpy.ndarray with shape ``[number of reactions]``
+	:return: :class:`kineticsPy.base.trajectory.Trajectory` (a kinetic trajectory object)
+
+	See :py:func:`kineticsPy.cantera.simulation.simulate_isobar_adiabatic` for the other parameters, the
+	pressure is the initial pressure in the reactor.
+	"""
+	if rate_multipliers is not None:
+		rate_multipliers = [rate_multipliers]
+	return simulate_mass_action_batch(
+		input_file, [initial_mole_fractions], *args, record_period=record_period, rtol=rtol, atol=atol,
+		method=method, mechanism_cache=mechanism_cache, rate_multipliers=rate_multipliers)[0]
+
+
+def simulate_mass_action_batch(input_file, initial_mole_fractions, *args, record_period=1, rtol=None, atol=None,
+                               method='BDF', mechanism_cache=True, rate_multipliers=None):
+	"""
+	Runs isothermal, isochoric simulations with the built-in mass action kinetics engine (see
+	:py:func:`simulate_mass_action`) for a set of cases at the same pressure and time steps. The cases differ in the
+	initial compositions and / or the multipliers of the rate constants. All cases are integrated together as one
+	system with a vectorized right hand side and a sparse, block diagonal Jacobian, thus hundreds of parameter sets
+	are integrated in one solver run:
+
+	.. code-block:: python
+
+		multipliers = np.ones((200, 8))
+		multipliers[:, 0] = np.linspace(0.5, 2.0, 200)
+		results = simulate_mass_action_batch(
+			'WaterCluster_RoomTemp.cti', 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10', 10000, 2e-9, 1e5,
+			rate_multipliers=multipliers)
+
+	Since the time steps of the solver are chosen for all cases together, the results can differ from individual
+	simulation runs within the solver tolerances.
+
+	:param initial_mole_fractions: Inital mole fraction configurations of the simulated cases, or one configuration
+		for all cases
+	:type initial_mole_fractions: list of str or dict or numpy.ndarray, or str or dict
+	:param rate_multipliers: Multipliers of the rate constants of the reactions per case, or for all cases
+	:type rate_multipliers: numpy.ndarray with shape ``[number of cases, number of reactions]`` or
+		``[number of reactions]``
+	:return: The resulting trajectories in the order of the cases
+	:rtype: list of :class:`kineticsPy.base.trajectory.Trajectory`
+
+	See :py:func:`simulate_mass_action` for the other parameters.
+	"""
+	if not os.path.isfile(input_file):
+		raise ValueError('The given cantea file input file is not existing')
+	if record_period < 1:
+		raise ValueError('Recording period has to be at least 1')
+	if method not in _SOLVER_METHODS:
+		raise ValueError('Solver method has to be one of ' + ', '.join(_SOLVER_METHODS))
+
+	n_steps, dt, custom_steps, pressure = simulation._parse_time_step_arguments(args)
+	mechanism = load_mechanism(input_file, cache=mechanism_cache)
+	model = MassActionModel(mechanism, pressure)
+	n_species = len(model.species_names)
+
+	# initial concentrations and rate constants of the cases:
+	if isinstance(initial_mole_fractions, (str, dict)):
+		initial_mole_fractions = [initial_mole_fractions]
+	initial_concentrations = np.array(
+		[mechanism.reset(pressure, mole_fractions).concentrations for mole_fractions in initial_mole_fractions]
+	) * simulation._CONCENTRATION_CONVERSION
+
+	rate_constants = model.rate_constants[np.newaxis, :]
+	if rate_multipliers is not None:
+		rate_multipliers = np.atleast_2d(rate_multipliers)
+		if rate_multipliers.shape[1] != mechanism.solution.n_reactions:
+			raise ValueError('Number of rate multipliers does not match the number of reactions')
+		rate_constants = rate_constants * rate_multipliers[:, model.direction_reactions]
+
+	n_cases = max(len(initial_concentrations), len(rate_constants))
+	if len(initial_concentrations) not in (1, n_cases) or len(rate_constants) not in (1, n_cases):
+		raise ValueError('Number of initial mole fraction configurations and rate multipliers does not match')
+	initial_concentrations = np.broadcast_to(initial_concentrations, (n_cases, n_species))
+
+	# recorded time steps:
+	if custom_steps is None:
+		times = np.arange(n_steps) * dt
+	else:
+		times = np.asarray(custom_steps, dtype=float)
+	times = times[::record_period]
+
+	if rtol is None:
+		rtol = 1e-9
+	if atol is None:
+		atol = np.repeat(1e-15 * np.sum(initial_concentrations, axis=1), n_species)
+
+	def rhs(t, y):
+		return model.production_rates(y.reshape(n_cases, n_species), rate_constants).ravel()
+
+	if method == 'LSODA':
+		def jac(t, y):
+			return model.jacobian(y.reshape(n_cases, n_species), rate_constants).toarray()
+	else:
+		def jac(t, y):
+			return model.jacobian(y.reshape(n_cases, n_species), rate_constants)
+
+	if len(times) > 1:
+		solution = solve_ivp(rhs, (times[0], times[-1]), initial_concentrations.ravel(), method=method,
+		                     t_eval=times, rtol=rtol, atol=atol, jac=jac)
+		if not solution.success:
+			raise ValueError('Integration of the mass action kinetics failed: ' + solution.message)
+		data = solution.y.reshape(n_cases, n_species, len(times)).transpose(0, 2, 1)
+	else:
+		data = initial_concentrations[:, np.newaxis, :]
+
+	return [Trajectory(model.species_names, times.copy(), data[i].copy(), {'pressure': pressure})
+	        for i in range(n_cases)]
+
+
+def _stoichiometry_vector(coefficients, species_names):
+	"""
+	Converts a dict of stoichiometric coefficients of a reaction into a vector over all species
+	"""
+	vector = np.zeros(len(species_names))
+	for species, coefficient in coefficients.items():
+		vector[species_names.index(species)] = coefficient
+	return vector
+
+
+def _third_body_efficiencies(reaction, species_names):
+	"""
+	Returns the third body efficiencies of a reaction as vector over all species (None for reactions without third
+	body), unsupported reaction types raise a ValueError
+	"""
+	if hasattr(ct, 'ElementaryReaction'):
+		# Cantera 2.x: reaction types are reaction classes, three body reactions are elementary reactions
+		if not isinstance(reaction, ct.ElementaryReaction):
+			raise ValueError('Reaction ' + reaction.equation + ' is not supported by the mass action kinetics')
+		if not isinstance(reaction, ct.ThreeBodyReaction):
+			return None
+		efficiencies = reaction.efficiencies
+		default_efficiency = reaction.default_efficiency
+	else:
+		if reaction.rate.type != 'Arrhenius':
+			raise ValueError('Reaction ' + reaction.equation + ' is not supported by the mass action kinetics')
+		if reaction.third_body is None:
+			return None
+		efficiencies = reaction.third_body.efficiencies
+		default_efficiency = reaction.third_body.default_efficiency
+
+	vector = np.full(len(species_names), default_efficiency, dtype=float)
+	for species, efficiency in efficiencies.items():
+		vector[species_names.index(species)] = efficiency
+	return vector
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+
+"""
+Loading and caching of parsed Cantera mechanisms (phases, species and reactions defined by Cantera input files)
+"""
+import os
+import hashlib
+import collections
+import cantera as ct
+
+__all__ = ["Mechanism", "MechanismCache", "load_mechanism", "default_mechanism_cache"]
+
+
+class Mechanism:
+	"""
+	A parsed Cantera mechanism: The reaction phase defined by a Cantera input file, the environment phase used for
+	pressure control and the initial thermodynamic state defined by the input file.
+
+	Parsing large mechanisms is expensive, a mechanism object is therefore intended to be reused for multiple
+	simulations: :py:meth:`reset` brings the reaction phase back to a fresh initial state without re-parsing the
+	input file.
+	"""
+
+	def __init__(self, input_file):
+		"""
+		Parses a Cantera input file and constructs a new mechanism
+
+		:param input_file: Path to a configuration (.cti) file
+		:type input_file: path
+		"""
+		self._input_file = input_file
+		self._solution = ct.Solution(input_file)
+		self._environment = ct.Solution('air.xml')
+		self._initial_temperature, self._initial_pressure, self._initial_mole_fractions = self._solution.TPX
+
+	@property
+	def input_file(self):
+		"""
+		Returns the path of the parsed Cantera input file
+		"""
+		return self._input_file
+
+	@property
+	def solution(self):
+		"""
+		Returns the Cantera reaction phase (a Cantera Solution)
+		"""
+		return self._solution
+
+	@property
+	def environment(self):
+		"""
+		Returns the Cantera environment phase (a Cantera Solution)
+		"""
+		return self._environment
+
+	@property
+	def initial_temperature(self):
+		"""
+		Returns the initial temperature defined by the input file
+		"""
+		return self._initial_temperature
+
+	@property
+	def species_names(self):
+		"""
+		Returns the chemical species names of the mechanism
+		"""
+		return self._solution.species_names
+
+	def reset(self, pressure=None, mole_fractions=None):
+		"""
+		Resets the reaction phase to the initial state defined by the input file and returns it. The initial pressure
+		and mole fractions can be replaced by ``pressure`` and ``mole_fractions``.
+
+		:param pressure: Pressure of the reset state (the pressure from the input file is used if None)
+		:type pressure: float
+		:param mole_fractions: Mole fractions of the reset state, a Cantera mole fraction string, dict or array
+			(the mole fractions from the input file are used if None)
+		:type mole_fractions: str or dict or array_like
+		:returns: The reset reaction phase
+		:rtype: cantera.Solution
+		"""
+		if pressure is None:
+			pressure = self._initial_pressure
+		if mole_fractions is None:
+			mole_fractions = self._initial_mole_fractions
+
+		self._solution.TPX = self._initial_temperature, pressure, mole_fractions
+		return self._solution
+
+	def clone(self):
+		"""
+		Creates an independent copy of the reaction phase (in the initial state defined by the input file)
+		from the already parsed species and reactions, without parsing the input file again
+
+		:returns: A new reaction phase
+		:rtype: cantera.Solution
+		"""
+		sol = self._solution
+		clone = ct.Solution(thermo=sol.thermo_model, kinetics=sol.kinetics_model,
+		                    species=sol.species(), reactions=sol.reactions())
+		clone.TPX = self._initial_temperature, self._initial_pressure, self._initial_mole_fractions
+		return clone
+
+
+class MechanismCache:
+	"""
+	Least recently used (LRU) cache of parsed Cantera mechanisms.
+
+	Cached mechanisms are identified by the path, the modification time and a hash of the content of the input
+	file. Thus, a modified input file is parsed again.
+	"""
+
+	def __init__(self, max_size=8):
+		"""
+		Constructs a new mechanism cache
+
+		:param max_size: Maximum number of mechanisms in the cache. If the cache is full, the least recently used
+			mechanism is evicted.
+		:type max_size: int
+		"""
+		if max_size < 1:
+			raise ValueError('Size of mechanism cache has to be at least 1')
+
+		self._max_size = max_size
+		self._mechanisms = collections.OrderedDict()
+		self._file_hashes = {}
+		self._hits = 0
+		self._misses = 0
+
+	@property
+	def max_size(self):
+		"""
+		Returns the maximum number of cached mechanisms
+		"""
+		return self._max_size
+
+	@property
+	def hits(self):
+		"""
+		Returns the number of mechanism requests served from the cache
+		"""
+		return self._hits
+
+	@property
+	def misses(self):
+		"""
+		Returns the number of mechanism requests which required parsing of an input file
+		"""
+		return self._misses
+
+	def get(self, input_file):
+		"""
+		Returns the parsed mechanism for a Cantera input file, the input file is only parsed if there
+		is no cached mechanism for the current version of the file.
+
+		:param input_file: Path to a configuration (.cti) file
+		:type input_file: path
+		:returns: The parsed mechanism
+		:rtype: Mechanism
+		"""
+		key = self._key(input_file)
+		if key in self._mechanisms:
+			self._hits += 1
+			self._mechanisms.move_to_end(key)
+			return self._mechanisms[key]
+
+		self._misses += 1
+		mechanism = Mechanism(input_file)
+		self._mechanisms[key] = mechanism
+		if len(self._mechanisms) > self._max_size:
+			self._mechanisms.popitem(last=False)
+
+		return mechanism
+
+	def clear(self):
+		"""
+		Removes all mechanisms from the cache
+		"""
+		self._mechanisms.clear()
+		self._file_hashes.clear()
+
+	def __len__(self):
+		return len(self._mechanisms)
+
+	def __contains__(self, input_file):
+		return self._key(input_file) in self._mechanisms
+
+	def _key(self, input_file):
+		"""
+		Generates the cache key (path, modification time and content hash) for an input file
+		"""
+		path = os.path.abspath(input_file)
+		stat = os.stat(path)
+		file_version = (path, stat.st_mtime_ns, stat.st_size)
+
+		# the content hash is only recalculated if the file was touched:
+		if file_version not in self._file_hashes:
+			self._file_hashes = {v: h for v, h in self._file_hashes.items() if v[0] != path}
+			with open(path, 'rb') as f:
+				self._file_hashes[file_version] = hashlib.sha1(f.read()).hexdigest()
+
+		return path, stat.st_mtime_ns, self._file_hashes[file_version]
+
+
+default_mechanism_cache = MechanismCache()
+
+
+def load_mechanism(input_file, cache=True):
+	"""
+	Loads a Cantera mechanism from an input file.
+
+	:param input_file: Path to a configuration (.cti) file
+	:type input_file: path
+	:param cache: Mechanism cache to use. If True, the default, process wide, mechanism cache is used. If False or
+		None, the input file is always parsed
+	:type cache: MechanismCache or bool
+	:returns: The parsed mechanism
+	:rtype: Mechanism
+	"""
+	if cache is True:
+		cache = default_mechanism_cache
+
+	if cache is None or cache is False:
+		return Mechanism(input_file)
+	else:
+		return cache.get(input_file)
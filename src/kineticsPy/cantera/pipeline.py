@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+"""
+Chained multi-stage simulations: Sequences of simulations where every stage starts from the final state of the
+previous stage
+"""
+import os
+import numpy as np
+from kineticsPy.base.trajectory import Trajectory
+from kineticsPy.cantera import simulation
+from kineticsPy.cantera.mechanism import load_mechanism
+
+__all__ = ["SimulationStage", "simulate_isobar_adiabatic_pipeline"]
+
+
+class SimulationStage:
+	"""
+	A stage of a multi-stage simulation pipeline (see :py:func:`simulate_isobar_adiabatic_pipeline`). A stage
+	defines the simulated time steps and the changes of the thermodynamic conditions at the beginning of the stage,
+	all conditions which are not changed are taken from the final state of the previous stage.
+
+	Call signatures:
+
+	.. code-block:: python
+
+		SimulationStage(n_steps, dt, pressure=None, temperature=None, mole_fractions=None, ...)
+		SimulationStage(custom_steps, pressure=None, temperature=None, mole_fractions=None, ...)
+	"""
+
+	def __init__(self, *args, pressure=None, temperature=None, mole_fractions=None, record_period=1, rtol=None,
+	             recording=None, integrator_steps=False, convergence=None):
+		"""
+		Constructs a new simulation stage
+
+		:param n_steps: Number of time steps to simulate
+		:type n_steps: int
+		:param dt: Length of a time step
+		:type dt: float
+		:param custom_steps: Explicit time steps (relative to the beginning of the stage)
+		:type custom_steps: list of float
+		:param pressure: Pressure of the stage (the pressure of the previous stage is kept if None)
+		:type pressure: float
+		:param temperature: Temperature of the stage (the temperature of the previous stage is kept if None)
+		:type temperature: float
+		:param mole_fractions: Mole fractions at the beginning of the stage, replacing the final composition of the
+			previous stage (the composition of the previous stage is kept if None)
+		:type mole_fractions: str or dict or numpy.ndarray
+		:param record_period: The period with which simulated samples are recorded
+		:type record_period: int
+		:param rtol: Relative tolerance of the solver
+		:type rtol: float
+		:param recording: Recording policy of the stage
+		:type recording: kineticsPy.cantera.recording.RecordingPolicy
+		:param integrator_steps: If True, the solver chooses the internal time steps of the stage
+		:type integrator_steps: bool
+		:param convergence: Convergence monitor which can end the stage as soon as it is converged
+		:type convergence: kineticsPy.cantera.convergence.ConvergenceMonitor
+
+		See :py:func:`kineticsPy.cantera.simulation.simulate_isobar_adiabatic` for details of the parameters.
+		"""
+		if len(args) == 2:
+			self._n_steps, self._dt = args
+			self._custom_steps = None
+		elif len(args) == 1:
+			self._custom_steps = args[0]
+			self._n_steps = len(self._custom_steps)
+			self._dt = None
+		else:
+			raise ValueError('Wrong number of arguments')
+
+		self._pressure = pressure
+		self._temperature = temperature
+		self._mole_fractions = mole_fractions
+		self._record_period = record_period
+		self._rtol = rtol
+		self._recording = recording
+		self._integrator_steps = integrator_steps
+		self._convergence = convergence
+
+	@property
+	def n_steps(self):
+		"""
+		Returns the number of simulated time steps
+		"""
+		return self._n_steps
+
+	@property
+	def pressure(self):
+		"""
+		Returns the pressure of the stage (None if the pressure of the previous stage is kept)
+		"""
+		return self._pressure
+
+	@property
+	def temperature(self):
+		"""
+		Returns the temperature of the stage (None if the temperature of the previous stage is kept)
+		"""
+		return self._temperature
+
+	@property
+	def mole_fractions(self):
+		"""
+		Returns the initial mole fractions of the stage (None if the composition of the previous stage is kept)
+		"""
+		return self._mole_fractions
+
+	@property
+	def convergence(self):
+		"""
+		Returns the convergence monitor of the stage
+		"""
+		return self._convergence
+
+	def _apply_conditions(self, sol):
+		"""
+		Changes the state of a reaction phase to the conditions at the beginning of the stage
+		"""
+		temperature = sol.T if self._temperature is None else self._temperature
+		pressure = sol.P if self._pressure is None else self._pressure
+		if self._mole_fractions is None:
+			sol.TP = temperature, pressure
+		else:
+			sol.TPX = temperature, pressure, self._mole_fractions
+
+	def _run(self, mechanism):
+		"""
+		Runs the stage from the current state of the reaction phase of a mechanism and returns the recorded
+		times, the recorded concentrations and the simulated end time of the stage. The final state of the stage is
+		written back to the reaction phase of the mechanism.
+		"""
+		sim, reac = simulation._setup_reactor_network(mechanism, self._rtol)
+		times, data = simulation._record_trajectory(
+			sim, reac, self._n_steps, self._dt, self._custom_steps, self._record_period, recording=self._recording,
+			integrator_steps=self._integrator_steps, convergence=self._convergence)
+
+		# the final state is copied back explicitly for the next stage, independent of whether the reactor shares
+		# the reaction phase of the mechanism or works on a copy of it. The mass fractions are set
+		# unnormalized, since setting the normalized mass fractions would clip small negative values of the solver:
+		sol = mechanism.solution
+		sol.set_unnormalized_mass_fractions(reac.phase.Y)
+		sol.TP = reac.phase.T, reac.phase.P
+
+		return times, data, sim.time
+
+
+def simulate_isobar_adiabatic_pipeline(input_file, initial_mole_fractions, stages, mechanism_cache=True):
+	"""
+	Runs a chained sequence of isobar, adiabatic simulations (stages). The first stage starts from the
+	initial state defined by the input file and ``initial_mole_fractions``, every following stage starts from the full
+	thermodynamic state (temperature, pressure and composition) at the end of the previous stage, with the changes
+	of the conditions defined by the stage. The mechanism is parsed once for all stages and the state is passed
+	directly to the next stage, without a detour via concentration strings.
+
+	A typical application is the equilibration of a mixture, which is subsequently simulated at new conditions:
+
+	.. code-block:: python
+
+		stages = [
+			SimulationStage(1000000, 2e-9, pressure=1e5, convergence=ConvergenceMonitor()),
+			SimulationStage(10000, 2e-9, pressure=2e5, temperature=350)]
+		result = simulate_isobar_adiabatic_pipeline(
+			'WaterCluster_RoomTemp.cti', 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10', stages)
+
+	All stages are recorded into one trajectory with a continuous time axis: The times of a stage are shifted by the
+	simulated end time of the previous stage. Therefore, the last sample of a stage and the first sample of the
+	next stage can share their time, the first sample of a stage is the state after the change of the conditions.
+	The trajectory attributes ``stage_start_times``, ``stage_start_indices`` (index of the first recorded sample of
+	the stages), ``stage_pressures`` and ``stage_temperatures`` (at the beginning of the stages) describe the
+	stages.
+
+	:param input_file: Path to a configuration (.cti) file
+	:type input_file: path
+	:param initial_mole_fractions: Inital mole fraction configuration of the first stage
+	:type initial_mole_fractions: str or dict or numpy.ndarray
+	:param stages: The simulation stages
+	:type stages: list of SimulationStage
+	:param mechanism_cache: Mechanism cache to use (see
+		:py:func:`kineticsPy.cantera.simulation.simulate_isobar_adiabatic`)
+	:type mechanism_cache: kineticsPy.cantera.mechanism.MechanismCache or bool
+	:return: :class:`kineticsPy.base.trajectory.Trajectory` with all stages
+	"""
+	if not os.path.isfile(input_file):
+		raise ValueError('The given cantea file input file is not existing')
+	if not stages:
+		raise ValueError('A simulation pipeline requires at least one stage')
+
+	mechanism = load_mechanism(input_file, cache=mechanism_cache)
+	mechanism.reset(stages[0].pressure, initial_mole_fractions)
+
+	times = []
+	data = []
+	stage_start_times = []
+	stage_start_indices = []
+	stage_pressures = []
+	stage_temperatures = []
+	time_offset = 0.0
+	for stage in stages:
+		stage._apply_conditions(mechanism.solution)
+		stage_start_times.append(time_offset)
+		stage_start_indices.append(sum(len(t) for t in times))
+		stage_pressures.append(mechanism.solution.P)
+		stage_temperatures.append(mechanism.solution.T)
+
+		stage_times, stage_data, end_time = stage._run(mechanism)
+		times.append(stage_times + time_offset)
+		data.append(stage_data)
+		time_offset += end_time
+
+	sim_attributes = {
+		'stage_start_times': stage_start_times,
+		'stage_start_indices': stage_start_indices,
+		'stage_pressures': stage_pressures,
+		'stage_temperatures': stage_temperatures}
+
+	return Trajectory(mechanism.species_names, np.concatenate(times), np.concatenate(data), sim_attributes)
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+"""
+Recording policies: Selection of the simulated time steps which are written to a resulting kinetic trajectory
+"""
+import numpy as np
+
+__all__ = ["RecordingPolicy", "PeriodicRecording", "ChangeThresholdRecording", "LogTimeRecording"]
+
+
+class RecordingPolicy:
+	"""
+	Base class of recording policies. A recording policy decides for every simulated time step if the
+	sample is written to the resulting trajectory.
+	"""
+
+	#: True if the policy requires the current concentrations to decide if a sample is recorded
+	uses_concentrations = False
+
+	def reset(self, n_steps):
+		"""
+		Prepares the policy for a new simulation run
+
+		:param n_steps: Number of time steps of the simulation run
+		:type n_steps: int
+		"""
+		pass
+
+	def max_samples(self, n_steps):
+		"""
+		Returns the maximum number of samples recorded in a simulation run with ``n_steps`` time steps or
+		None if the number of samples is not known in advance
+
+		:param n_steps: Number of time steps of the simulation run
+		:type n_steps: int
+		"""
+		return None
+
+	def record(self, step, time, concentrations):
+		"""
+		Decides if a sample is recorded
+
+		:param step: Index of the simulated time step
+		:type step: int
+		:param time: Simulated time of the time step
+		:type time: float
+		:param concentrations: Concentrations of the chemical species in the time step (None if the policy does not
+			use concentrations)
+		:type concentrations: numpy.ndarray
+		:returns: True if the sample is recorded
+		:rtype: bool
+		"""
+		raise NotImplementedError()
+
+
+class PeriodicRecording(RecordingPolicy):
+	"""
+	Records every ``period``-th time step (the default behavior of the simulation functions with ``record_period``)
+	"""
+
+	def __init__(self, period=1):
+		"""
+		:param period: The period with which simulated samples are recorded
+		:type period: int
+		"""
+		if period < 1:
+			raise ValueError('Recording period has to be at least 1')
+		self._period = period
+
+	@property
+	def period(self):
+		"""
+		Returns the recording period
+		"""
+		return self._period
+
+	def max_samples(self, n_steps):
+		return int(np.ceil(n_steps / self._period))
+
+	def record(self, step, time, concentrations):
+		return step % self._period == 0
+
+
+class ChangeThresholdRecording(RecordingPolicy):
+	"""
+	Event driven recording: A sample is recorded if the concentration of at least one chemical species has changed
+	by more than a relative or absolute threshold since the last recorded sample. Quasi steady phases of a
+	simulation produce only few samples while fast transients are recorded with full time resolution.
+
+	The first and the last time step of a simulation are always recorded.
+	"""
+
+	uses_concentrations = True
+
+	def __init__(self, rtol=0.01, atol=0.0, max_period=None):
+		"""
+		:param rtol: Relative change threshold
+		:type rtol: float
+		:param atol: Absolute change threshold (in the concentration unit of the simulation)
+		:type atol: float
+		:param max_period: If not None, a sample is recorded after at most ``max_period`` time steps, even if the
+			concentrations have not changed
+		:type max_period: int
+		"""
+		if rtol < 0 or atol < 0:
+			raise ValueError('Change thresholds have to be positive')
+		self._rtol = rtol
+		self._atol = atol
+		self._max_period = max_period
+		self._last_step = None
+		self._last_concentrations = None
+		self._n_steps = None
+
+	def reset(self, n_steps):
+		self._n_steps = n_steps
+		self._last_step = None
+		self._last_concentrations = None
+
+	def record(self, step, time, concentrations):
+		if self._last_concentrations is None \
+				or step == self._n_steps - 1 \
+				or (self._max_period is not None and step - self._last_step >= self._max_period) \
+				or np.any(np.abs(concentrations - self._last_concentrations) >
+				          self._atol + self._rtol * np.abs(self._last_concentrations)):
+			self._last_step = step
+			self._last_concentrations = np.array(concentrations)
+			return True
+
+		return False
+
+
+class LogTimeRecording(RecordingPolicy):
+	"""
+	Records samples on a logarithmically spaced time grid: A sample is recorded if the simulated time has increased
+	by at least a factor of :math:`10^{1/n}` since the last recorded sample, where :math:`n` is the number of samples
+	per decade.
+
+	The first and the last time step of a simulation are always recorded.
+	"""
+
+	def __init__(self, samples_per_decade=10, start_time=None):
+		"""
+		:param samples_per_decade: Number of recorded samples per decade of simulated time
+		:type samples_per_decade: int
+		:param start_time: Beginning of the logarithmic time grid. If None, the first time step with a positive
+			time is the beginning of the time grid.
+		:type start_time: float
+		"""
+		if samples_per_decade <= 0:
+			raise ValueError('Number of samples per decade has to be positive')
+		self._factor = 10.0 ** (1.0 / samples_per_decade)
+		self._start_time = np.nextafter(0, 1) if start_time is None else start_time
+		self._next_time = None
+		self._n_steps = None
+
+	def reset(self, n_steps):
+		self._n_steps = n_steps
+		self._next_time = -np.inf
+
+	def record(self, step, time, concentrations):
+		if time >= self._next_time or step == self._n_steps - 1:
+			if time > 0:
+				self._next_time = max(time * self._factor, self._start_time)
+			else:
+				self._next_time = self._start_time
+			return True
+
+		return False
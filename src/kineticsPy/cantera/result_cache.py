@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+
+"""
+Content addressed on-disk cache of simulation results
+"""
+import os
+import json
+import shutil
+import hashlib
+import numpy as np
+import cantera as ct
+from kineticsPy.base.fileio import write_trajectory_store, read_trajectory_store, TRAJECTORY_STORE_VERSION
+
+__all__ = ["ResultCache"]
+
+# version of the cache key generation, a changed key generation invalidates existing cache entries:
+_CACHE_KEY_VERSION = 2
+
+_CACHE_INFO_FILE = 'cache.json'
+_TEMP_PREFIX = '.tmp-'
+
+
+class ResultCache:
+	"""
+	Content addressed on-disk cache of simulation results: Simulation results are stored as trajectory stores (see
+	:py:func:`kineticsPy.base.fileio.write_trajectory_store`) in a cache directory. A cache entry is identified by a
+	hash of the content of the Cantera input file and the simulation parameters (initial mole fractions, time steps,
+	pressure, record period, solver tolerance), thus repeated identical simulations are loaded from the cache
+	instead of being integrated again. Cached results are loaded memory mapped, only accessed data is read from disk.
+
+	The size of the cache is limited, if the cache size exceeds the limit, the least recently used entries are
+	removed. The cache directory is bound to the Cantera version which created the cache entries: If the cache is
+	opened with another Cantera version, all entries are invalidated.
+
+	A result cache is passed to :py:func:`kineticsPy.cantera.simulation.simulate_isobar_adiabatic` with the
+	``result_cache`` argument:
+
+	.. code-block:: python
+
+		cache = ResultCache('~/.cache/kineticsPy', max_size=10 * 1024**3)
+		result = simulate_isobar_adiabatic(input_file, initial_mole_fractions, 100000, 2e-9, 1e5, result_cache=cache)
+	"""
+
+	def __init__(self, cache_dir, max_size=1024**3):
+		"""
+		Opens a result cache. The cache directory is created if not existing, an existing directory has to be
+		empty or a result cache directory.
+
+		:param cache_dir: Path of the cache directory
+		:type cache_dir: path
+		:param max_size: Maximum size of the cache on disk in bytes
+		:type max_size: int
+		"""
+		if max_size <= 0:
+			raise ValueError('Maximum cache size has to be positive')
+
+		self._cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+		self._max_size = max_size
+		self._file_hashes = {}
+		self._hits = 0
+		self._misses = 0
+
+		os.makedirs(self._cache_dir, exist_ok=True)
+		cache_info = self._read_cache_info()
+		if cache_info is None and os.listdir(self._cache_dir):
+			raise ValueError('The directory ' + self._cache_dir + ' is not empty and not a result cache')
+		if cache_info != self._current_cache_info():
+			self.clear()
+
+	@property
+	def cache_dir(self):
+		"""
+		Returns the path of the cache directory
+		"""
+		return self._cache_dir
+
+	@property
+	def max_size(self):
+		"""
+		Returns the maximum size of the cache in bytes
+		"""
+		return self._max_size
+
+	@property
+	def hits(self):
+		"""
+		Returns the number of results loaded from the cache
+		"""
+		return self._hits
+
+	@property
+	def misses(self):
+		"""
+		Returns the number of requested results which were not cached
+		"""
+		return self._misses
+
+	@property
+	def size(self):
+		"""
+		Returns the current size of the cache on disk in bytes
+		"""
+		return sum(entry_size for entry_size, _, _ in self._entries())
+
+	def key(self, input_file, initial_mole_fractions, n_steps, dt, custom_steps, pressure, record_period=1,
+	        rtol=None, integrator_steps=False, reactor_mode='isobar_adiabatic'):
+		"""
+		Generates the cache key of a simulation run
+
+		See :py:func:`kineticsPy.cantera.simulation.simulate_isobar_adiabatic` for the parameters,
+		``reactor_mode`` is the reactor mode of the simulation function (one of
+		:py:data:`kineticsPy.cantera.simulation.REACTOR_MODES`).
+
+		:returns: The cache key (a hex string)
+		:rtype: str
+		"""
+		if isinstance(initial_mole_fractions, dict):
+			mole_fractions = sorted((str(sp), float(x)) for sp, x in initial_mole_fractions.items())
+		elif isinstance(initial_mole_fractions, str):
+			mole_fractions = initial_mole_fractions
+		else:
+			mole_fractions = np.asarray(initial_mole_fractions, dtype=float).tolist()
+
+		# numpy scalars are converted to plain numbers, which are json serializable and give the same key:
+		if custom_steps is None:
+			time_steps = [int(n_steps), float(dt)]
+		else:
+			time_steps = hashlib.sha256(np.asarray(custom_steps, dtype=float).tobytes()).hexdigest()
+
+		parameters = [_CACHE_KEY_VERSION, self._file_hash(input_file), mole_fractions, time_steps,
+		              None if pressure is None else float(pressure), int(record_period),
+		              None if rtol is None else float(rtol), bool(integrator_steps), reactor_mode]
+		return hashlib.sha256(json.dumps(parameters).encode()).hexdigest()
+
+	def get(self, key):
+		"""
+		Loads a cached simulation result (memory mapped)
+
+		:param key: The cache key of the simulation run
+		:type key: str
+		:returns: The cached result or None if the result is not cached
+		:rtype: kineticsPy.base.trajectory.Trajectory
+		"""
+		entry_path = os.path.join(self._cache_dir, key)
+		try:
+			result = read_trajectory_store(entry_path, memory_mapped=True)
+		except (ValueError, OSError):
+			# missing (or incomplete) entries are cache misses:
+			self._misses += 1
+			return None
+
+		# the modification time of an entry is its last use:
+		os.utime(entry_path)
+		self._hits += 1
+		return result
+
+	def put(self, key, trajectory):
+		"""
+		Stores a simulation result in the cache and evicts the least recently used entries if the cache size
+		exceeds the size limit
+
+		:param key: The cache key of the simulation run
+		:type key: str
+		:param trajectory: The simulation result
+		:type trajectory: kineticsPy.base.trajectory.Trajectory
+		"""
+		entry_path = os.path.join(self._cache_dir, key)
+		# the entry is written to a temporary directory and moved to its final location,
+		# thus concurrent readers never see incomplete entries:
+		temp_path = os.path.join(self._cache_dir, _TEMP_PREFIX + key + '-' + str(os.getpid()))
+		write_trajectory_store(trajectory, temp_path)
+		try:
+			os.rename(temp_path, entry_path)
+		except OSError:
+			# the entry was already written by another process
+			shutil.rmtree(temp_path, ignore_errors=True)
+
+		self._evict()
+
+	def clear(self):
+		"""
+		Removes all entries from the cache (and binds the cache to the current Cantera version)
+		"""
+		for name in os.listdir(self._cache_dir):
+			path = os.path.join(self._cache_dir, name)
+			if os.path.isdir(path) and (_is_cache_key(name) or name.startswith(_TEMP_PREFIX)):
+				shutil.rmtree(path, ignore_errors=True)
+
+		with open(os.path.join(self._cache_dir, _CACHE_INFO_FILE), 'w') as info_file:
+			json.dump(self._current_cache_info(), info_file)
+
+	def __len__(self):
+		return len(self._entries())
+
+	def __contains__(self, key):
+		return os.path.isfile(os.path.join(self._cache_dir, key, 'trajectory.json'))
+
+	def _evict(self):
+		"""
+		Removes the least recently used entries until the cache size is within the size limit
+		"""
+		entries = sorted(self._entries(), key=lambda entry: entry[1])
+		cache_size = sum(entry_size for entry_size, _, _ in entries)
+		for entry_size, _, entry_path in entries:
+			if cache_size <= self._max_size:
+				break
+			shutil.rmtree(entry_path, ignore_errors=True)
+			cache_size -= entry_size
+
+	def _entries(self):
+		"""
+		Returns the size, the time of last use and the path of all cache entries
+		"""
+		entries = []
+		with os.scandir(self._cache_dir) as it:
+			for entry in it:
+				if entry.is_dir() and _is_cache_key(entry.name):
+					entry_size = sum(f.stat().st_size for f in os.scandir(entry.path) if f.is_file())
+					entries.append((entry_size, entry.stat().st_mtime_ns, entry.path))
+		return entries
+
+	def _file_hash(self, input_file):
+		"""
+		Returns the content hash of an input file (the hash is only recalculated if the file was touched)
+		"""
+		path = os.path.abspath(input_file)
+		stat = os.stat(path)
+		file_version = (path, stat.st_mtime_ns, stat.st_size)
+		if file_version not in self._file_hashes:
+			with open(path, 'rb') as f:
+				self._file_hashes[file_version] = hashlib.sha256(f.read()).hexdigest()
+		return self._file_hashes[file_version]
+
+	def _read_cache_info(self):
+		"""
+		Reads the versions the cache directory is bound to (None for a new cache directory)
+		"""
+		try:
+			with open(os.path.join(self._cache_dir, _CACHE_INFO_FILE), 'r') as info_file:
+				return json.load(info_file)
+		except (OSError, ValueError):
+			return None
+
+	@staticmethod
+	def _current_cache_info():
+		"""
+		Returns the versions of Cantera, the cache key generation and the trajectory store format
+		"""
+		return {'cantera_version': ct.__version__, 'key_version': _CACHE_KEY_VERSION,
+		        'store_format_version': TRAJECTORY_STORE_VERSION}
+
+
+def _is_cache_key(name):
+	"""
+	Checks if a file name is a cache key (a sha256 hex digest)
+	"""
+	return len(name) == 64 and all(c in '0123456789abcdef' for c in name)
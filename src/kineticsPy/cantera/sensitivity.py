@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+
+"""
+Sensitivity analysis: Sensitivities of the simulated concentrations with respect to the reaction rate constants,
+calculated by the Cantera solver in the same integration as the concentrations
+"""
+import numpy as np
+import pandas as pd
+from kineticsPy.base.trajectory import Trajectory
+
+__all__ = ["SensitivityAnalysis", "SensitivityTrajectory"]
+
+
+class SensitivityAnalysis:
+	"""
+	Configuration of a sensitivity analysis of a simulation run: The Cantera solver integrates the sensitivities of
+	the chemical species with respect to the rate constants (pre-exponential factors) of selected reactions together
+	with the concentrations. Thus, the sensitivities for all selected reactions are calculated in one single
+	integration, instead of one additional simulation run for every perturbed reaction.
+
+	The sensitivity coefficients are the normalized sensitivities calculated by Cantera
+	:math:`\\partial \\ln Y_k / \\partial \\ln A_i` of the mass fraction :math:`Y_k` of a species :math:`k` with
+	respect to the pre-exponential factor :math:`A_i` of a reaction :math:`i`. A sensitivity analysis is passed to a
+	simulation function (e.g. with the ``sensitivity`` argument of
+	:py:func:`kineticsPy.cantera.simulation.simulate_isobar_adiabatic`), which returns a
+	:py:class:`SensitivityTrajectory` with the recorded sensitivity coefficients:
+
+	.. code-block:: python
+
+		result = simulate_isobar_adiabatic(input_file, initial_mole_fractions, 10000, 2e-9, 1e5,
+		                                   sensitivity=SensitivityAnalysis())
+		print(result.sensitivity_table())
+	"""
+
+	def __init__(self, reactions=None, species=None, rtol=None, atol=None):
+		"""
+		Constructs a new sensitivity analysis configuration
+
+		:param reactions: The reactions which are the parameters of the analysis, given as reaction indices or
+			reaction equations (all reactions of the mechanism if None)
+		:type reactions: list of int or list of str
+		:param species: The chemical species for which sensitivities are recorded (all species if None)
+		:type species: list of str
+		:param rtol: Relative tolerance of the solver for the sensitivities
+		:type rtol: float
+		:param atol: Absolute tolerance of the solver for the sensitivities
+		:type atol: float
+		"""
+		self._reactions = None if reactions is None else list(reactions)
+		self._species = None if species is None else list(species)
+		self._rtol = rtol
+		self._atol = atol
+		self._reaction_indices = None
+		self._parameter_names = None
+		self._species_names = None
+		self._components = None
+		self._samples = []
+
+	@property
+	def reactions(self):
+		"""
+		Returns the configured reactions (None if all reactions are analyzed)
+		"""
+		return self._reactions
+
+	@property
+	def species(self):
+		"""
+		Returns the configured chemical species (None if the sensitivities of all species are recorded)
+		"""
+		return self._species
+
+	def _setup(self, mechanism, reac, sim):
+		"""
+		Registers the sensitivity parameters with a reactor network before the integration is started
+		"""
+		sol = mechanism.solution
+		equations = sol.reaction_equations()
+		if self._reactions is None:
+			reaction_indices = list(range(sol.n_reactions))
+		else:
+			reaction_indices = []
+			for reaction in self._reactions:
+				if isinstance(reaction, str):
+					if reaction not in equations:
+						raise ValueError('Reaction ' + reaction + ' not found in mechanism')
+					reaction_indices.append(equations.index(reaction))
+				elif 0 <= reaction < sol.n_reactions:
+					reaction_indices.append(reaction)
+				else:
+					raise ValueError('Reaction index ' + str(reaction) + ' out of range')
+
+		species_names = sol.species_names if self._species is None else self._species
+		for sp in species_names:
+			if sp not in sol.species_names:
+				raise ValueError('Species ' + sp + ' not found in mechanism')
+
+		for i in reaction_indices:
+			reac.add_sensitivity_reaction(i)
+		if self._rtol is not None:
+			sim.rtol_sensitivity = self._rtol
+		if self._atol is not None:
+			sim.atol_sensitivity = self._atol
+
+		self._reaction_indices = reaction_indices
+		self._parameter_names = [equations[i] for i in reaction_indices]
+		self._species_names = list(species_names)
+		self._components = [reac.component_index(sp) for sp in species_names]
+		self._samples = []
+
+	def _record(self, sim):
+		"""
+		Records the current sensitivities of a reactor network
+		"""
+		self._samples.append(sim.sensitivities()[self._components])
+
+	def _take(self):
+		"""
+		Returns the sensitivities recorded since the last call as array (samples x species x reactions)
+		"""
+		if self._samples:
+			result = np.array(self._samples)
+		else:
+			result = np.zeros((0, len(self._components), len(self._reaction_indices)))
+		self._samples = []
+		return result
+
+	def _trajectory(self, species_names, times, data, attributes):
+		"""
+		Constructs a sensitivity trajectory from recorded simulation data and the recorded sensitivities
+		"""
+		return SensitivityTrajectory(species_names, times, data, self._take(), self._species_names,
+		                             self._parameter_names, attributes)
+
+
+class SensitivityTrajectory(Trajectory):
+	"""
+	Kinetic trajectory with sensitivity coefficients: In addition to the concentration time series, a sensitivity
+	trajectory contains the time series of the sensitivity coefficients of chemical species with respect to a set of
+	sensitivity parameters (typically reactions), as three dimensional numpy array
+	(time steps x species x parameters).
+	"""
+
+	def __init__(self, species_names, times, data, sensitivities, sensitivity_species, sensitivity_parameters,
+	             attributes=None, **kwargs):
+		"""
+		Constructs a new sensitivity trajectory
+
+		:param sensitivities: Sensitivity coefficients
+		:type sensitivities: numpy.ndarray with shape ``[number of time steps, number of sensitivity species,
+			number of sensitivity parameters]``
+		:param sensitivity_species: Names of the chemical species in the sensitivity coefficients
+		:type sensitivity_species: list[str]
+		:param sensitivity_parameters: Names of the sensitivity parameters (e.g. reaction equations)
+		:type sensitivity_parameters: list[str]
+
+		See :py:class:`kineticsPy.base.trajectory.Trajectory` for the other parameters.
+		"""
+		super().__init__(species_names, times, data, attributes, **kwargs)
+		sensitivities = np.asarray(sensitivities)
+		if sensitivities.shape != (len(times), len(sensitivity_species), len(sensitivity_parameters)):
+			raise ValueError('Shape of sensitivity data ' + str(sensitivities.shape) + ' does not match the number of '
+			                 'time steps, sensitivity species and sensitivity parameters')
+
+		self._sensitivities = sensitivities
+		self._sensitivity_species = list(sensitivity_species)
+		self._sensitivity_parameters = list(sensitivity_parameters)
+
+	@property
+	def sensitivities(self):
+		"""
+		Returns the sensitivity coefficients as three dimensional numpy array (time steps x species x parameters)
+		"""
+		return self._sensitivities
+
+	@property
+	def sensitivity_species(self):
+		"""
+		Returns the names of the chemical species in the sensitivity coefficients
+		"""
+		return self._sensitivity_species
+
+	@property
+	def sensitivity_parameters(self):
+		"""
+		Returns the names of the sensitivity parameters
+		"""
+		return self._sensitivity_parameters
+
+	def sensitivity(self, species, parameter):
+		"""
+		Returns the time series of the sensitivity coefficient of a chemical species with respect to a parameter
+
+		:param species: Name of the chemical species
+		:type species: str
+		:param parameter: Index or name of the sensitivity parameter
+		:type parameter: int or str
+		:rtype: pandas.Series
+		"""
+		sp_index = self._sensitivity_species_index(species)
+		par_index = self._sensitivity_parameter_index(parameter)
+		return pd.Series(self._sensitivities[:, sp_index, par_index], index=self.time_index,
+		                 name=self._sensitivity_parameters[par_index], copy=False)
+
+	def sensitivity_table(self, time_step=-1):
+		"""
+		Returns the sensitivity coefficients of all species with respect to all parameters at a time step
+
+		:param time_step: Index of the time step (the last time step by default)
+		:type time_step: int
+		:return: Table with species as rows and sensitivity parameters as columns
+		:rtype: pandas.DataFrame
+		"""
+		return pd.DataFrame(self._sensitivities[time_step], index=self._sensitivity_species,
+		                    columns=self._sensitivity_parameters)
+
+	def _sensitivity_species_index(self, species):
+		try:
+			return self._sensitivity_species.index(species)
+		except ValueError:
+			raise ValueError('Species ' + species + ' not found in sensitivity data')
+
+	def _sensitivity_parameter_index(self, parameter):
+		if isinstance(parameter, str):
+			try:
+				return self._sensitivity_parameters.index(parameter)
+			except ValueError:
+				raise ValueError('Sensitivity parameter ' + parameter + ' not found')
+		return parameter
@@ -4,14 +4,40 @@
 Interface to run kinetic simulations with cantera_simulation
 """
 import os
+import logging
+from time import monotonic
 import numpy as np
 import cantera as ct
 from kineticsPy.base.trajectory import Trajectory
+from kineticsPy.cantera.mechanism import load_mechanism
+from kineticsPy.cantera.recording import PeriodicRecording
+from kineticsPy.cantera.instrumentation import INTEGRATION, EXTRACTION, CONVERSION, RECORDING, CONVERGENCE, \
+	CALLBACKS, OVERHEAD, SETUP
+
+__all__ = ["simulate_isobar_adiabatic", "simulate_isobar_isothermal", "simulate_isochoric_adiabatic",
+           "simulate_isochoric_isothermal", "simulate_isobar_adiabatic_chunked"]
+
+# reactor modes (thermodynamic constraints of the simulated reactor):
+ISOBAR_ADIABATIC = 'isobar_adiabatic'
+ISOBAR_ISOTHERMAL = 'isobar_isothermal'
+ISOCHORIC_ADIABATIC = 'isochoric_adiabatic'
+ISOCHORIC_ISOTHERMAL = 'isochoric_isothermal'
+REACTOR_MODES = (ISOBAR_ADIABATIC, ISOBAR_ISOTHERMAL, ISOCHORIC_ADIABATIC, ISOCHORIC_ISOTHERMAL)
+
+# size of the recording buffer chunks if the number of recorded samples is not known in advance:
+_ADAPTIVE_RECORDING_CHUNK_SIZE = 10000
+
+# .concentrations of a ThermoPhase returns concentrations in [kmol/m^3],
+# we want to use molecules / cm^3 and have to convert:
+_CONCENTRATION_CONVERSION = 6.022E20
+
+_logger = logging.getLogger(__name__)
 
-__all__ = ["simulate_isobar_adiabatic"]
 
 def simulate_isobar_adiabatic(input_file, initial_mole_fractions, *args,
-                              record_period=1, rtol=None):
+                              record_period=1, rtol=None, mechanism_cache=True, recording=None,
+                              integrator_steps=False, progress=None, progress_period=30000, convergence=None,
+                              profiler=None, sensitivity=None, result_cache=None):
 	"""
 	Constant-pressure, adiabatic kinetics simulation with Cantera: 
 	Simulation of chemical kinetics in an ideally stirred, isobar and adiabatic reactor.
@@ -36,6 +62,10 @@ def simulate_isobar_adiabatic(input_file, initial_mole_fractions, *args,
 	.. note::
 		Species can be omitted in the initialization. Omitted species are initalized with no concentration.
 
+	Alternatively, the mole fractions can be given as dict of species names and values or as array with values for
+	all species of the simulation. The equilibrium state of a previous simulation can be passed directly in this
+	form (see :py:func:`kineticsPy.analysis.analysis.equilibrium_state_composition`).
+
 	Call signatures:
 
 	.. code-block:: python
@@ -47,7 +77,7 @@ def simulate_isobar_adiabatic(input_file, initial_mole_fractions, *args,
 	:param input_file: Path to a configuration (.cti) file
 	:type input_file: path
 	:param initial_mole_fractions: Inital mole fraction configuration
-	:type initial_mole_fractions: str
+	:type initial_mole_fractions: str or dict or numpy.ndarray
 	:param n_steps: Number of time steps to simulate
 	:type n_steps: int
 	:param dt: Length of a time step
@@ -63,15 +93,203 @@ def simulate_isobar_adiabatic(input_file, initial_mole_fractions, *args,
 	:type record_period:
 	:param rtol: Relative tolerance passed to cantera solver
 	:type rtol: float
+	:param mechanism_cache: Cache for parsed Cantera input files (see :py:mod:`kineticsPy.cantera.mechanism`). If True,
+		the default mechanism cache is used, thus repeated simulations with the same input file in one process
+		parse the input file only once. If False, the input file is parsed for every simulation.
+	:type mechanism_cache: bool or kineticsPy.cantera.mechanism.MechanismCache
+	:param recording: Recording policy which selects the samples written to the trajectory (see
+		:py:mod:`kineticsPy.cantera.recording`), e.g. adaptive recording of samples with significant concentration
+		changes. If a recording policy is given, ``record_period`` is ignored.
+	:type recording: kineticsPy.cantera.recording.RecordingPolicy
+	:param integrator_steps: If True, the solver chooses its internal time steps freely instead of stopping at every
+		requested time step and the concentrations are linearly interpolated from the internal solver steps onto
+		the requested (recorded) time steps. This is considerably faster for simulations with many, fine grained time
+		steps, but the interpolated concentrations are less precise than the concentrations calculated directly
+		by the solver.
+	:type integrator_steps: bool
+	:param progress: Optional progress callback, which is called every ``progress_period`` time steps with the
+		current time step index, the total number of time steps and the current simulated time
+		(``progress(step, n_steps, time)``). Independently of the callback, the simulation progress is logged with
+		the ``logging`` module (logger ``kineticsPy.cantera.simulation``, level DEBUG).
+	:type progress: callable
+	:param progress_period: The period (in time steps) of progress reports
+	:type progress_period: int
+	:param convergence: Optional convergence monitor which checks the recorded samples for convergence to an
+		equilibrium state while the simulation is running and stops the simulation early if convergence is detected
+		(see :py:class:`kineticsPy.cantera.convergence.ConvergenceMonitor`). The simulated time of convergence is
+		stored in the ``converged_time`` trajectory attribute (None if no convergence was detected).
+	:type convergence: kineticsPy.cantera.convergence.ConvergenceMonitor
+	:param profiler: Optional profiler which measures the time spent in the Cantera solver, the extraction and
+		conversion of the concentrations, the recording and the simulation loop and collects the solver statistics
+		(see :py:class:`kineticsPy.cantera.instrumentation.SimulationProfiler`). The collected statistics are stored
+		in the ``profile`` trajectory attribute.
+	:type profiler: kineticsPy.cantera.instrumentation.SimulationProfiler
+	:param sensitivity: Optional sensitivity analysis (see
+		:py:class:`kineticsPy.cantera.sensitivity.SensitivityAnalysis`): The sensitivities of the chemical species with
+		respect to the rate constants of the selected reactions are integrated together with the concentrations and
+		recorded for the recorded time steps. The result is a
+		:py:class:`kineticsPy.cantera.sensitivity.SensitivityTrajectory` then. Sensitivity analysis is not available
+		with ``integrator_steps``.
+	:type sensitivity: kineticsPy.cantera.sensitivity.SensitivityAnalysis
+	:param result_cache: Optional on-disk cache of simulation results (see
+		:py:class:`kineticsPy.cantera.result_cache.ResultCache`): If the result of an identical simulation (same input
+		file content and simulation parameters) is cached, the cached result is loaded (memory mapped) instead of
+		running the simulation, otherwise the result is stored in the cache. Results of simulations with recording
+		policies, convergence monitors, profilers or sensitivity analyses are not cached.
+	:type result_cache: kineticsPy.cantera.result_cache.ResultCache
+	:return: :class:`kineticsPy.base.trajectory.Trajectory` (a kinetic trajectory object)
+	"""
+	return _simulate(
+		ISOBAR_ADIABATIC, input_file, initial_mole_fractions, args, record_period=record_period, rtol=rtol,
+		mechanism_cache=mechanism_cache, recording=recording, integrator_steps=integrator_steps, progress=progress,
+		progress_period=progress_period, convergence=convergence, profiler=profiler, sensitivity=sensitivity,
+		result_cache=result_cache)
+
+
+def simulate_isobar_isothermal(input_file, initial_mole_fractions, *args, **kwargs):
+	"""
+	Constant-pressure, isothermal kinetics simulation with Cantera: Simulation of chemical kinetics in an ideally
+	stirred reactor with constant pressure and constant temperature (the initial temperature defined by the input
+	file). The reactor is a Cantera ``IdealGasConstPressureReactor`` with disabled energy equation, thus the
+	temperature is not integrated and no pressure control by a wall is required.
+
+	Takes the same arguments as :py:func:`simulate_isobar_adiabatic`.
+
 	:return: :class:`kineticsPy.base.trajectory.Trajectory` (a kinetic trajectory object)
 	"""
+	return _simulate(ISOBAR_ISOTHERMAL, input_file, initial_mole_fractions, args, **kwargs)
+
+
+def simulate_isochoric_adiabatic(input_file, initial_mole_fractions, *args, **kwargs):
+	"""
+	Constant-volume, adiabatic kinetics simulation with Cantera: Simulation of chemical kinetics in an ideally
+	stirred, closed reactor with constant volume (a Cantera ``IdealGasReactor`` without walls). The pressure argument
+	is the initial pressure in the reactor.
 
+	Takes the same arguments as :py:func:`simulate_isobar_adiabatic`.
+
+	:return: :class:`kineticsPy.base.trajectory.Trajectory` (a kinetic trajectory object)
+	"""
+	return _simulate(ISOCHORIC_ADIABATIC, input_file, initial_mole_fractions, args, **kwargs)
+
+
+def simulate_isochoric_isothermal(input_file, initial_mole_fractions, *args, **kwargs):
+	"""
+	Constant-volume, isothermal kinetics simulation with Cantera: Simulation of chemical kinetics in an ideally
+	stirred, closed reactor with constant volume and constant temperature (a Cantera ``IdealGasReactor`` with
+	disabled energy equation). The pressure argument is the initial pressure in the reactor.
+
+	Takes the same arguments as :py:func:`simulate_isobar_adiabatic`.
+
+	:return: :class:`kineticsPy.base.trajectory.Trajectory` (a kinetic trajectory object)
+	"""
+	return _simulate(ISOCHORIC_ISOTHERMAL, input_file, initial_mole_fractions, args, **kwargs)
+
+
+def _simulate(reactor_mode, input_file, initial_mole_fractions, args, record_period=1, rtol=None,
+              mechanism_cache=True, recording=None, integrator_steps=False, progress=None, progress_period=30000,
+              convergence=None, profiler=None, sensitivity=None, result_cache=None):
+	"""
+	Runs a simulation in one of the reactor modes, the common implementation of the public simulation functions
+	"""
 	# Parse / Process arguments:
 
 	# check if input file exists:
 	if not os.path.isfile(input_file):
 		raise ValueError('The given cantea file input file is not existing')
 
+	n_steps, dt, custom_steps, pressure = _parse_time_step_arguments(args)
+
+	if result_cache is not None:
+		if recording is not None or convergence is not None or profiler is not None or sensitivity is not None:
+			raise ValueError('Results of simulations with recording policies, convergence monitors, profilers or '
+			                 'sensitivity analyses can not be cached')
+		cache_key = result_cache.key(input_file, initial_mole_fractions, n_steps, dt, custom_steps, pressure,
+		                             record_period=record_period, rtol=rtol, integrator_steps=integrator_steps,
+		                             reactor_mode=reactor_mode)
+		result = result_cache.get(cache_key)
+		if result is not None:
+			return result
+
+	mechanism = load_mechanism(input_file, cache=mechanism_cache)
+
+	result = _run_simulation(
+		mechanism, initial_mole_fractions, n_steps, dt, custom_steps, pressure,
+		record_period=record_period, rtol=rtol, recording=recording, integrator_steps=integrator_steps,
+		progress=progress, progress_period=progress_period, convergence=convergence, profiler=profiler,
+		sensitivity=sensitivity, reactor_mode=reactor_mode)
+
+	if result_cache is not None:
+		result_cache.put(cache_key, result)
+	return result
+
+
+def simulate_isobar_adiabatic_chunked(input_file, initial_mole_fractions, *args,
+                                      chunk_size=10000, record_period=1, rtol=None, mechanism_cache=True,
+                                      recording=None, progress=None, progress_period=30000, convergence=None,
+                                      profiler=None, sensitivity=None):
+	"""
+	Streaming variant of :py:func:`simulate_isobar_adiabatic`: Instead of returning the complete trajectory at the
+	end of the simulation, the recorded samples are yielded in chunks while the simulation proceeds. Every chunk is a
+	kinetic trajectory with at most ``chunk_size`` recorded time steps. Thus, the memory consumption is bounded by the
+	chunk size and not by the length of the simulation and the chunks can be analyzed or written to disk before the
+	simulation is complete:
+
+	.. code-block:: python
+
+		for chunk in simulate_isobar_adiabatic_chunked(input_file, 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10',
+		                                               100000000, 2e-9, 100000, chunk_size=100000):
+			print(chunk.times.iloc[-1], chunk.loc['H3O+(H2O)4'].iloc[-1])
+
+	The chunks can be joined into a complete trajectory with
+	:py:func:`kineticsPy.base.trajectory.concatenate_trajectories`.
+
+	Call signatures:
+
+	.. code-block:: python
+
+		simulate_isobar_adiabatic_chunked(input_file, initial_mole_fractions, n_steps, dt, pressure, chunk_size=10000, ...)
+		simulate_isobar_adiabatic_chunked(input_file, initial_mole_fractions, custom_steps, pressure, chunk_size=10000, ...)
+
+	:param chunk_size: Maximum number of recorded time steps in a chunk
+	:type chunk_size: int
+	:param profiler: Optional profiler (see :py:func:`simulate_isobar_adiabatic`), the ``profile`` attribute of a
+		chunk contains the statistics collected until the chunk was recorded
+	:type profiler: kineticsPy.cantera.instrumentation.SimulationProfiler
+	:return: Generator of :class:`kineticsPy.base.trajectory.Trajectory` chunks
+
+	See :py:func:`simulate_isobar_adiabatic` for the other parameters.
+	"""
+	if not os.path.isfile(input_file):
+		raise ValueError('The given cantea file input file is not existing')
+	if chunk_size < 1:
+		raise ValueError('Chunk size has to be at least 1')
+
+	n_steps, dt, custom_steps, pressure = _parse_time_step_arguments(args)
+
+	mechanism = load_mechanism(input_file, cache=mechanism_cache)
+	if profiler is not None:
+		profiler._start()
+	sim, reac = _setup_simulation(mechanism, initial_mole_fractions, pressure, rtol)
+	species_names = reac.phase.species_names
+	if sensitivity is not None:
+		sensitivity._setup(mechanism, reac, sim)
+	if profiler is not None:
+		profiler._lap(SETUP)
+
+	return (
+		_simulation_trajectory(species_names, times, data, _simulation_attributes(pressure, profiler=profiler),
+		                       sensitivity)
+		for times, data in _record_chunks(sim, reac, n_steps, dt, custom_steps, record_period, chunk_size,
+		                                  recording=recording, progress=progress, progress_period=progress_period,
+		                                  convergence=convergence, profiler=profiler, sensitivity=sensitivity))
+
+
+def _parse_time_step_arguments(args):
+	"""
+	Parses the variable positional arguments of the simulation functions
+	(either ``n_steps, dt, pressure`` or ``custom_steps, pressure``)
+	"""
 	if len(args) == 3:
 		n_steps = args[0]
 		custom_steps = None
@@ -80,36 +298,171 @@ def simulate_isobar_adiabatic(input_file, initial_mole_fractions, *args,
 	elif len(args) == 2:
 		custom_steps = args[0]
 		n_steps = len(custom_steps)
+		dt = None
 		pressure = args[1]
 	else:
 		raise ValueError('Wrong number of arguments')
 
-	sol = ct.Solution(input_file)
-	air = ct.Solution('air.xml')
+	return n_steps, dt, custom_steps, pressure
 
-	sol.TPX = sol.T, pressure, initial_mole_fractions
 
-	species_names = sol.species_names
-	n_species = len(species_names)
-	reac = ct.IdealGasReactor(sol)
-	env = ct.Reservoir(air)
+def _run_simulation(mechanism, initial_mole_fractions, n_steps, dt, custom_steps, pressure,
+                    record_period=1, rtol=None, recording=None, integrator_steps=False,
+                    progress=None, progress_period=30000, convergence=None, deadline=None, profiler=None,
+                    sensitivity=None, reactor_mode=ISOBAR_ADIABATIC):
+	"""
+	Runs a simulation with an already loaded mechanism (see :py:class:`kineticsPy.cantera.mechanism.Mechanism`)
+	in one of the reactor modes.
+
+	``deadline`` is an optional point in time (in terms of :func:`time.monotonic`) after which the
+	simulation is aborted with a TimeoutError.
+	"""
+	if sensitivity is not None and integrator_steps:
+		raise ValueError('Sensitivity analysis is not available with integrator steps')
 
-	# Define a wall between the reactor and the environment, and
-	# make it flexible, so that the pressure in the reactor is held
-	# at the environment pressure.
-	wall = ct.Wall(reac, env)
-	wall.expansion_rate_coeff = 1.0e0  # set expansion parameter. dV/dt = KA(P_1 - P_2)
-	wall.area = 0.0
+	if profiler is not None:
+		profiler._start()
+	sim, reac = _setup_simulation(mechanism, initial_mole_fractions, pressure, rtol, reactor_mode)
+	species_names = reac.phase.species_names
+	if sensitivity is not None:
+		sensitivity._setup(mechanism, reac, sim)
+	if profiler is not None:
+		profiler._lap(SETUP)
+	times, data = _record_trajectory(
+		sim, reac, n_steps, dt, custom_steps, record_period, recording=recording, integrator_steps=integrator_steps,
+		progress=progress, progress_period=progress_period, convergence=convergence, deadline=deadline,
+		profiler=profiler, sensitivity=sensitivity)
+
+	result = _simulation_trajectory(
+		species_names, times, data, _simulation_attributes(pressure, convergence, profiler), sensitivity)
+	return result
+
+
+def _simulation_trajectory(species_names, times, data, sim_attributes, sensitivity=None):
+	"""
+	Constructs the resulting trajectory of a simulation run (a sensitivity trajectory if a sensitivity analysis
+	was performed)
+	"""
+	if sensitivity is None:
+		return Trajectory(species_names, times, data, sim_attributes)
+	return sensitivity._trajectory(species_names, times, data, sim_attributes)
+
+
+def _simulation_attributes(pressure, convergence=None, profiler=None):
+	"""
+	Generates the trajectory attributes of a simulation run
+	"""
+	sim_attributes = {'pressure': pressure}
+	if convergence is not None:
+		sim_attributes['converged_time'] = convergence.converged_time
+	if profiler is not None:
+		sim_attributes['profile'] = profiler.stats
+	return sim_attributes
+
+
+def _record_trajectory(sim, reac, n_steps, dt, custom_steps, record_period, recording=None, integrator_steps=False,
+                       progress=None, progress_period=30000, convergence=None, deadline=None, profiler=None,
+                       sensitivity=None):
+	"""
+	Integrates a reactor network over the simulated time steps and returns the recorded samples as one
+	tuple of times and concentrations (the sensitivities of an optional sensitivity analysis are collected by the
+	sensitivity analysis)
+	"""
+	if integrator_steps:
+		return _record_integrator_steps(
+			sim, reac, n_steps, dt, custom_steps, record_period, recording=recording,
+			progress=progress, progress_period=progress_period, convergence=convergence, deadline=deadline,
+			profiler=profiler)
+
+	# the whole trajectory is recorded into one single chunk if the number of samples is known in advance:
+	chunks = list(_record_chunks(sim, reac, n_steps, dt, custom_steps, record_period,
+	                             recording=recording, progress=progress, progress_period=progress_period,
+	                             convergence=convergence, deadline=deadline, profiler=profiler,
+	                             sensitivity=sensitivity))
+	if len(chunks) == 1:
+		return chunks[0]
+	elif len(chunks) > 1:
+		return np.concatenate([chunk[0] for chunk in chunks]), np.concatenate([chunk[1] for chunk in chunks])
+	else:
+		return np.zeros(0), np.zeros((0, reac.phase.n_species))
+
+
+def _setup_simulation(mechanism, initial_mole_fractions, pressure, rtol, reactor_mode=ISOBAR_ADIABATIC):
+	"""
+	Sets up the reactor network for a simulation in one of the reactor modes and returns the reactor network and
+	the reactor
+	"""
+	mechanism.reset(pressure, initial_mole_fractions)
+	return _setup_reactor_network(mechanism, rtol, reactor_mode)
+
+
+def _setup_reactor_network(mechanism, rtol, reactor_mode=ISOBAR_ADIABATIC):
+	"""
+	Sets up the reactor network for a simulation in one of the reactor modes from the current state of the reaction
+	phase of a mechanism and returns the reactor network and the reactor
+	"""
+	if reactor_mode == ISOBAR_ADIABATIC:
+		reac = ct.IdealGasReactor(mechanism.solution, clone=False)
+		env = ct.Reservoir(mechanism.environment, clone=False)
+
+		# Define a wall between the reactor and the environment, and
+		# make it flexible, so that the pressure in the reactor is held
+		# at the environment pressure.
+		wall = ct.Wall(reac, env)
+		wall.expansion_rate_coeff = 1.0e0  # set expansion parameter. dV/dt = KA(P_1 - P_2)
+		wall.area = 0.0
+	elif reactor_mode == ISOBAR_ISOTHERMAL:
+		reac = ct.IdealGasConstPressureReactor(mechanism.solution, energy='off', clone=False)
+	elif reactor_mode == ISOCHORIC_ADIABATIC:
+		reac = ct.IdealGasReactor(mechanism.solution, clone=False)
+	elif reactor_mode == ISOCHORIC_ISOTHERMAL:
+		reac = ct.IdealGasReactor(mechanism.solution, energy='off', clone=False)
+	else:
+		raise ValueError('Unknown reactor mode ' + str(reactor_mode))
 
 	# Initialize simulation.
 	sim = ct.ReactorNet([reac])
 	if rtol:
 		sim.rtol = rtol
 
-	n_rec_steps = int(np.ceil(n_steps / record_period))
+	return sim, reac
+
 
-	times = np.zeros(n_rec_steps)
-	data = np.zeros((n_rec_steps, n_species))
+def _record_chunks(sim, reac, n_steps, dt, custom_steps, record_period, chunk_size=None,
+                   recording=None, progress=None, progress_period=30000, convergence=None, deadline=None,
+                   profiler=None, sensitivity=None):
+	"""
+	Integrates a reactor network over the simulated time steps and yields the recorded samples in chunks
+	(tuples of times and concentrations) of at most ``chunk_size`` samples. If ``chunk_size`` is None,
+	all samples are recorded in one single chunk if the recording policy knows the number of recorded samples
+	in advance.
+
+	The timing points of an optional profiler are only evaluated if a profiler is given, thus the simulation loop
+	is not slowed down by the instrumentation if no profiler is used.
+	"""
+	thermo = reac.phase
+	n_species = thermo.n_species
+
+	if recording is None:
+		recording = PeriodicRecording(record_period)
+	recording.reset(n_steps)
+	uses_concentrations = recording.uses_concentrations
+	# plain periodic recording is decided inline, without calling the recording policy (subclasses may override
+	# the recording decision):
+	period = recording.period if type(recording) is PeriodicRecording else None
+	report_progress = progress is not None or _logger.isEnabledFor(logging.DEBUG)
+	if convergence is not None:
+		convergence.reset(n_species)
+	stop = False
+
+	n_rec_steps = recording.max_samples(n_steps)
+	if n_rec_steps is None:
+		n_rec_steps = min(n_steps, _ADAPTIVE_RECORDING_CHUNK_SIZE) if chunk_size is None else n_steps
+	if chunk_size is None or chunk_size > n_rec_steps:
+		chunk_size = n_rec_steps
+
+	times = np.zeros(chunk_size)
+	data = np.zeros((chunk_size, n_species))
 
 	if custom_steps is None:
 		time = 0.0
@@ -117,23 +470,180 @@ def simulate_isobar_adiabatic(input_file, initial_mole_fractions, *args,
 		time = custom_steps[0]
 	n_recorded = 0
 	for n in range(n_steps):
+		if profiler is not None:
+			profiler._lap(OVERHEAD)
 		sim.advance(time)
+		if profiler is not None:
+			profiler._lap(INTEGRATION)
+
+		if period is not None:
+			concentrations = None
+			record = n % period == 0
+		else:
+			if uses_concentrations:
+				concentrations = thermo.concentrations
+				if profiler is not None:
+					profiler._lap(EXTRACTION)
+				concentrations *= _CONCENTRATION_CONVERSION
+				if profiler is not None:
+					profiler._lap(CONVERSION)
+			else:
+				concentrations = None
+			record = recording.record(n, time, concentrations)
 
-		if n % record_period == 0:
+		if record:
+			if times is None:
+				# the buffers of the next chunk are only allocated if there are further samples:
+				times = np.zeros(chunk_size)
+				data = np.zeros((chunk_size, n_species))
 			times[n_recorded] = time  # time in s
-			# .concentrations of a ThermoPhase returns concentrations in [kmol/m^3],
-			# we want to use molecules / cm^3 and have to convert:
-			data[n_recorded, :] = reac.thermo[species_names].concentrations * 6.022E20
+			if concentrations is None:
+				raw_concentrations = thermo.concentrations
+				if profiler is not None:
+					profiler._lap(EXTRACTION)
+				np.multiply(raw_concentrations, _CONCENTRATION_CONVERSION, out=data[n_recorded])
+				if profiler is not None:
+					profiler._lap(CONVERSION)
+			else:
+				data[n_recorded] = concentrations
 			n_recorded += 1
-		if n % 30000 == 0:
-			print('%5d %10.3e %10.3f %10.3f %14.6e' % (n, sim.time, reac.T, reac.thermo.P, reac.thermo.u))
+			if sensitivity is not None:
+				sensitivity._record(sim)
+			if profiler is not None:
+				profiler._recorded()
+				profiler._lap(RECORDING)
+
+			if convergence is not None:
+				stop = convergence.update(time, data[n_recorded - 1]) and convergence.stop
+				if profiler is not None:
+					profiler._lap(CONVERGENCE)
+
+			if n_recorded == chunk_size:
+				yield times, data
+				if profiler is not None:
+					profiler._skip()
+				times = None
+				data = None
+				n_recorded = 0
+
+			if stop:
+				break
+		elif profiler is not None:
+			profiler._lap(RECORDING)
+
+		if report_progress and n % progress_period == 0:
+			_report_progress(progress, n, n_steps, sim, reac)
+		if profiler is not None:
+			profiler._step(n, time)
+			profiler._lap(CALLBACKS)
+		if deadline is not None and monotonic() > deadline:
+			raise TimeoutError('Simulation exceeded its time limit after ' + str(n + 1) + ' of '
+			                   + str(n_steps) + ' steps')
 
 		if custom_steps is None:
 			time += dt
 		elif n < n_steps-1:
 			time = custom_steps[n+1]
 
-	sim_attributes = {'pressure': pressure}
-	result = Trajectory(species_names, times, data, sim_attributes)
-	return result
+	if profiler is not None:
+		profiler._finish(sim)
+	if n_recorded > 0:
+		yield times[:n_recorded], data[:n_recorded]
+
+
+def _record_integrator_steps(sim, reac, n_steps, dt, custom_steps, record_period, recording=None,
+                             progress=None, progress_period=30000, convergence=None, deadline=None, profiler=None):
+	"""
+	Integrates a reactor network with the internal time steps chosen by the solver and returns the concentrations
+	linearly interpolated onto the recorded time steps (a tuple of times and concentrations).
+	Progress is reported and convergence is monitored on the internal solver steps.
+	"""
+	thermo = reac.phase
+	n_species = thermo.n_species
+	report_progress = progress is not None or _logger.isEnabledFor(logging.DEBUG)
+
+	if custom_steps is None:
+		output_times = np.arange(n_steps) * dt
+	else:
+		output_times = np.asarray(custom_steps, dtype=float)
+
+	if recording is None:
+		recording = PeriodicRecording(record_period)
+	recording.reset(n_steps)
+
+	# time steps selected by recording policies which do not depend on the concentrations are known in advance:
+	if isinstance(recording, PeriodicRecording):
+		output_times = output_times[::recording.period]
+	elif not recording.uses_concentrations:
+		output_times = output_times[[recording.record(n, t, None) for n, t in enumerate(output_times)]]
+
+	if len(output_times) == 0:
+		if profiler is not None:
+			profiler._finish(sim)
+		return output_times, np.zeros((0, n_species))
+
+	# integrate with free internal time steps up to the last requested time:
+	if convergence is not None:
+		convergence.reset(n_species)
+
+	internal_times = [sim.time]
+	internal_data = [thermo.concentrations]
+	end_time = output_times[-1]
+	while sim.time < end_time:
+		if profiler is not None:
+			profiler._lap(OVERHEAD)
+		internal_times.append(sim.step())
+		if profiler is not None:
+			profiler._lap(INTEGRATION)
+		internal_data.append(thermo.concentrations)
+		if profiler is not None:
+			profiler._lap(EXTRACTION)
+		if convergence is not None:
+			converged = convergence.update(sim.time, internal_data[-1] * _CONCENTRATION_CONVERSION)
+			if profiler is not None:
+				profiler._lap(CONVERGENCE)
+			if converged and convergence.stop:
+				# requested times after the convergence are not recorded:
+				output_times = output_times[output_times <= sim.time]
+				break
+		if report_progress and len(internal_times) % progress_period == 0:
+			_report_progress(progress, len(internal_times), None, sim, reac)
+		if profiler is not None:
+			profiler._step(len(internal_times) - 1, sim.time)
+			profiler._lap(CALLBACKS)
+		if deadline is not None and monotonic() > deadline:
+			raise TimeoutError('Simulation exceeded its time limit at simulated time ' + str(sim.time)
+			                   + ' of ' + str(end_time))
+
+	if profiler is not None:
+		profiler._lap(OVERHEAD)
+	internal_times = np.array(internal_times)
+	internal_data = np.array(internal_data) * _CONCENTRATION_CONVERSION
+	if profiler is not None:
+		profiler._lap(CONVERSION)
 
+	data = np.empty((len(output_times), n_species))
+	for i in range(n_species):
+		data[:, i] = np.interp(output_times, internal_times, internal_data[:, i])
+
+	if recording.uses_concentrations:
+		recorded = [recording.record(n, t, data[n]) for n, t in enumerate(output_times)]
+		output_times, data = output_times[recorded], data[recorded]
+
+	if profiler is not None:
+		profiler._recorded(len(output_times))
+		profiler._lap(RECORDING)
+		profiler._finish(sim)
+
+	return output_times, data
+
+
+def _report_progress(progress, step, n_steps, sim, reac):
+	"""
+	Reports the progress of a simulation to a progress callback and the module logger
+	(``n_steps`` is None if the total number of steps is not known)
+	"""
+	if progress is not None:
+		progress(step, n_steps, sim.time)
+	_logger.debug('step %d: t = %10.3e s, T = %10.3f K, P = %10.3f Pa, u = %14.6e J/kg',
+	              step, sim.time, reac.T, reac.phase.P, reac.phase.u)
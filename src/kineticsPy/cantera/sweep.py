@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+
+"""
+Parallel parameter sweeps of Cantera simulations
+"""
+import os
+import itertools
+import concurrent.futures
+from time import monotonic
+from kineticsPy.cantera import simulation
+from kineticsPy.cantera.mechanism import load_mechanism
+
+__all__ = ["parameter_grid", "simulate_isobar_adiabatic_sweep", "SweepResult"]
+
+
+def parameter_grid(**parameters):
+	"""
+	Generates the full factorial combination (grid) of simulation parameters.
+
+	Every keyword argument is a simulation parameter name with a list of values. Scalar values (and strings) are
+	taken as single value for all parameter sets:
+
+	.. code-block:: python
+
+		parameter_grid(pressure=[1e4, 1e5], initial_mole_fractions=['H2O:1e14, N2:2.54e17', 'H2O:1e15, N2:2.54e17'],
+		               n_steps=1000, dt=1e-6)
+
+	generates four parameter sets with all combinations of the pressures and initial mole fractions.
+
+	:param parameters: Simulation parameter names with lists of parameter values
+	:returns: List of parameter sets (dicts of parameter names and values)
+	:rtype: list of dict
+	"""
+	names = list(parameters.keys())
+	value_lists = []
+	for name in names:
+		values = parameters[name]
+		if isinstance(values, str) or not hasattr(values, '__iter__'):
+			values = [values]
+		value_lists.append(list(values))
+
+	return [dict(zip(names, combination)) for combination in itertools.product(*value_lists)]
+
+
+class SweepResult:
+	"""
+	Result of a parameter sweep: An ordered collection of kinetic trajectories, with one entry for every simulated
+	parameter set. Failed simulation runs are represented by ``None`` entries, the reason for the failure is stored
+	in :py:attr:`errors`.
+	"""
+
+	def __init__(self, parameter_sets, trajectories, errors):
+		"""
+		Constructs a new sweep result
+
+		:param parameter_sets: The simulated parameter sets
+		:type parameter_sets: list of dict
+		:param trajectories: The resulting trajectories (None for failed runs)
+		:type trajectories: list of Trajectory
+		:param errors: The exceptions raised by failed runs (None for successful runs)
+		:type errors: list of Exception
+		"""
+		self._parameter_sets = parameter_sets
+		self._trajectories = trajectories
+		self._errors = errors
+
+	@property
+	def parameter_sets(self):
+		"""
+		Returns the simulated parameter sets
+		"""
+		return self._parameter_sets
+
+	@property
+	def trajectories(self):
+		"""
+		Returns the resulting trajectories in the order of the parameter sets (None for failed runs)
+		"""
+		return self._trajectories
+
+	@property
+	def errors(self):
+		"""
+		Returns the exceptions of failed runs in the order of the parameter sets (None for successful runs)
+		"""
+		return self._errors
+
+	@property
+	def succeeded(self):
+		"""
+		Returns the indices of the successful simulation runs
+		"""
+		return [i for i, err in enumerate(self._errors) if err is None]
+
+	@property
+	def failed(self):
+		"""
+		Returns the indices of the failed simulation runs
+		"""
+		return [i for i, err in enumerate(self._errors) if err is not None]
+
+	def __len__(self):
+		return len(self._trajectories)
+
+	def __getitem__(self, index):
+		return self._trajectories[index]
+
+	def __iter__(self):
+		return iter(self._trajectories)
+
+
+def simulate_isobar_adiabatic_sweep(input_file, parameter_sets, max_workers=None, timeout=None,
+                                    **common_parameters):
+	"""
+	Runs a set of isobar, adiabatic simulations (see
+	:py:func:`kineticsPy.cantera.simulation.simulate_isobar_adiabatic`) in parallel in a pool of worker processes.
+	Every worker process parses the Cantera input file only once and reuses the loaded mechanism (from the
+	worker's default mechanism cache, see :py:mod:`kineticsPy.cantera.mechanism`) for all simulation runs it
+	performs.
+
+	The individual simulation runs are defined by parameter sets, which are dicts with the parameter names of
+	:py:func:`kineticsPy.cantera.simulation.simulate_isobar_adiabatic` as keys (``initial_mole_fractions``,
+	``pressure``, ``n_steps`` and ``dt`` or ``custom_steps``, ``record_period``, ``rtol``, ``recording``,
+	``integrator_steps``, ``convergence``, ``profiler``, ``sensitivity``).
+	Parameters common to all runs can be passed as additional keyword arguments:
+
+	.. code-block:: python
+
+		params = parameter_grid(pressure=[1e4, 1e5, 1e6], rtol=[1e-9, 1e-11])
+		result = simulate_isobar_adiabatic_sweep(
+			'WaterCluster_RoomTemp.cti', params, max_workers=4,
+			initial_mole_fractions='H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10', n_steps=10000, dt=2e-9)
+
+	Failing simulation runs do not abort the sweep: The trajectory of a failed run is None and the raised exception
+	is stored in :py:attr:`SweepResult.errors`. Parameter sets without the required parameters
+	(``initial_mole_fractions``, ``pressure`` and ``n_steps`` and ``dt`` or ``custom_steps``) or with unknown
+	parameters are not simulated and fail with a ValueError. Progress reporting (``progress``, ``progress_period``)
+	is not available for the runs of a sweep.
+
+	:param input_file: Path to a configuration (.cti) file
+	:type input_file: path
+	:param parameter_sets: The parameter sets to simulate (e.g. generated by :py:func:`parameter_grid`)
+	:type parameter_sets: list of dict
+	:param max_workers: The maximum number of concurrently running worker processes (defaults to the number of
+		processors of the machine)
+	:type max_workers: int
+	:param timeout: Maximum wall clock time in seconds for the integration of an individual simulation run. The
+		time starts when the worker has loaded the mechanism, thus parsing the input file and waiting for a free
+		worker are not included. The time limit is checked between the solver calls (time steps or integrator
+		steps): A run is aborted at the first check after the limit has passed and marked as failed with a
+		TimeoutError, a single long solver call is not interrupted.
+	:type timeout: float
+	:param common_parameters: Simulation parameters which are common to all parameter sets
+	:return: The simulation results in the order of the parameter sets
+	:rtype: SweepResult
+	"""
+	if not os.path.isfile(input_file):
+		raise ValueError('The given cantea file input file is not existing')
+
+	parameter_sets = [dict(common_parameters, **p_set) for p_set in parameter_sets]
+	trajectories = [None] * len(parameter_sets)
+	errors = [None] * len(parameter_sets)
+
+	with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+		futures = {}
+		for i, p_set in enumerate(parameter_sets):
+			try:
+				_check_parameter_set(p_set)
+			except ValueError as e:
+				errors[i] = e
+				continue
+			futures[executor.submit(_run_parameter_set, input_file, p_set, timeout)] = i
+
+		for future in concurrent.futures.as_completed(futures):
+			i = futures[future]
+			try:
+				trajectories[i] = future.result()
+			except Exception as e:
+				errors[i] = e
+
+	return SweepResult(parameter_sets, trajectories, errors)
+
+
+#: Simulation parameters which can be defined in the parameter sets of a sweep
+_SWEEP_PARAMETERS = ('initial_mole_fractions', 'pressure', 'n_steps', 'dt', 'custom_steps', 'record_period', 'rtol',
+                     'recording', 'integrator_steps', 'convergence', 'profiler', 'sensitivity')
+
+
+def _check_parameter_set(p_set):
+	"""
+	Checks that a parameter set defines all required simulation parameters and no unknown parameters
+	"""
+	if 'progress' in p_set or 'progress_period' in p_set:
+		raise ValueError('Progress reporting is not available for the runs of a parameter sweep')
+	unknown = [name for name in p_set if name not in _SWEEP_PARAMETERS]
+	if unknown:
+		raise ValueError('Parameter set contains the unknown parameters ' + ', '.join(unknown))
+
+	required = ['initial_mole_fractions', 'pressure']
+	if 'custom_steps' not in p_set:
+		required += ['n_steps', 'dt']
+	missing = [name for name in required if name not in p_set]
+	if missing:
+		raise ValueError('Parameter set is missing the required parameters ' + ', '.join(missing))
+
+
+def _run_parameter_set(input_file, p_set, timeout):
+	"""
+	Runs a single simulation of a parameter sweep in a worker process
+	"""
+	mechanism = load_mechanism(input_file)
+	# the time limit starts after the mechanism is loaded, it limits the integration of the run:
+	deadline = None if timeout is None else monotonic() + timeout
+
+	if 'custom_steps' in p_set:
+		args = (p_set['custom_steps'], p_set['pressure'])
+	else:
+		args = (p_set['n_steps'], p_set['dt'], p_set['pressure'])
+	n_steps, dt, custom_steps, pressure = simulation._parse_time_step_arguments(args)
+
+	return simulation._run_simulation(
+		mechanism, p_set['initial_mole_fractions'], n_steps, dt, custom_steps, pressure,
+		record_period=p_set.get('record_period', 1), rtol=p_set.get('rtol'), recording=p_set.get('recording'),
+		integrator_steps=p_set.get('integrator_steps', False), convergence=p_set.get('convergence'),
+		deadline=deadline, profiler=p_set.get('profiler'), sensitivity=p_set.get('sensitivity'))
@@ -1,5 +1,6 @@
 import unittest
 import os
+import numpy as np
 import numpy.testing as np_test
 import kineticsPy as kpy
 from . import util
@@ -34,6 +35,61 @@ class TestAnalysis(unittest.TestCase):
 			kpy.equilibrium_state(sim, time_steps=100)
 		self.assertTrue('Maximum relative difference' in str(ve.exception))
 
+	def test_batched_equilibrium_states(self):
+		sim_precise = util.water_cluster_simulation(rtol=1e-11)
+		sim_short = util.water_cluster_simulation(time_steps=500)
+
+		result = kpy.equilibrium_states([sim_precise, sim_short], time_steps=100, reltol=0.01)
+
+		n_species = len(sim_precise.species_names)
+		self.assertEqual(len(result), 2 * n_species)
+		self.assertEqual(list(result.columns),
+		                 ['trajectory', 'species', 'mean', 'min', 'max', 'relative_spread', 'converged'])
+
+		# the batched result has to be consistent with the single trajectory analysis:
+		precise = result[result['trajectory'] == 0].set_index('species')
+		np_test.assert_allclose(precise['mean'], kpy.equilibrium_state(sim_precise)[precise.index])
+		self.assertTrue(precise.loc['H3O+(H2O)4', 'converged'])
+
+		# the short simulation is not converged, which is flagged instead of raised:
+		short = result[result['trajectory'] == 1].set_index('species')
+		self.assertFalse(short['converged'].all())
+
+		# stacked arrays are also accepted:
+		stacked = np.stack([sim_precise.values[-200:], sim_short.values[-200:]])
+		result_stacked = kpy.equilibrium_states(stacked, time_steps=100, species_names=sim_precise.species_names)
+		np_test.assert_allclose(result_stacked['mean'], result['mean'])
+		np_test.assert_array_equal(result_stacked['converged'], result['converged'])
+
+		with self.assertRaises(ValueError):
+			kpy.equilibrium_states(stacked, time_steps=500)
+
+		# a trajectory shorter than the averaged time steps is rejected before its data is stacked:
+		with self.assertRaises(ValueError) as ve:
+			kpy.equilibrium_states([sim_precise, sim_short], time_steps=800)
+		self.assertTrue('Number of time steps to average' in str(ve.exception))
+
+	def test_equilibrium_state_composition(self):
+		sim_long = util.water_cluster_simulation(rtol=1e-11)
+		eq_state = kpy.equilibrium_state(sim_long)
+
+		composition = kpy.equilibrium_state_composition(sim_long)
+		self.assertEqual(list(composition.keys()), sim_long.species_names)
+		np_test.assert_array_equal(list(composition.values()), eq_state.values)
+		np_test.assert_array_equal(kpy.equilibrium_state_composition(sim_long, as_array=True), eq_state.values)
+
+		# the composition initializes a follow up simulation directly:
+		data_base_path = os.path.join('test_inputs')
+		sim_follow_up = kpy.cantera.simulate_isobar_adiabatic(
+			os.path.join(data_base_path, 'WaterCluster_RoomTemp.cti'), composition, 100, 2e-9, 100000)
+		# (negative concentrations from numerical noise are initialized with zero)
+		np_test.assert_allclose(sim_follow_up[0, :], eq_state.clip(lower=0), rtol=1e-5)
+
+		c_string = kpy.equilibrium_state_concentration_string(sim_long)
+		string_composition = dict(entry.split(':') for entry in c_string.split(','))
+		np_test.assert_allclose([float(string_composition[sp]) for sp in sim_long.species_names],
+		                        eq_state.values, rtol=1e-6)
+
 	def test_equilibrium_state_concentration_string(self):
 
 		sim_long = util.water_cluster_simulation(rtol=1e-11)
@@ -1,5 +1,7 @@
 import unittest
 import os
+import numpy as np
+import numpy.testing as np_test
 import matplotlib.pyplot as plt
 import kineticsPy as kpy
 from . import util
@@ -114,6 +116,141 @@ class TestVisualization(unittest.TestCase):
 		kpy.plot(sim_result, species_line_config_2, 100, normalized=True)
 		plt.savefig(os.path.join(self.result_base_path, 'synthetic_data_plot_customized_03.png'))
 
+	def test_decimated_plots(self):
+		n_timesteps = 1000000
+		times = np.linspace(0, 1, n_timesteps)
+		rng = np.random.default_rng(42)
+		data = np.vstack([np.sin(20 * times) + rng.normal(0, 0.1, n_timesteps),
+		                  np.exp(-5 * times)]).transpose()
+		data[123456, 0] = 10.0  # single spike has to survive the decimation
+		tra = kpy.base.Trajectory(['A', 'B'], times, data)
+
+		for log in ('none', 'time', 'both'):
+			fig = kpy.plot(tra, log=log)
+			lines = fig.axes[0].get_lines()
+			n_pixels = fig.axes[0].get_window_extent().width
+			for line, sp in zip(lines, ('A', 'B')):
+				x, y = line.get_data()
+				self.assertLessEqual(len(x), 4 * (n_pixels + 1) + 1)
+				self.assertTrue(np.all(np.diff(x) > 0))
+				self.assertAlmostEqual(np.max(y), np.max(data[:, tra.species_index(sp)]))
+				self.assertAlmostEqual(np.min(y), np.min(data[:, tra.species_index(sp)]))
+				self.assertEqual(x[0], times[0])
+				self.assertEqual(x[-1], times[-1])
+			plt.savefig(os.path.join(self.result_base_path, 'decimated_plot_' + log + '.png'))
+			plt.close(fig)
+
+		fig = kpy.plot(tra, 'A', decimate=100)
+		self.assertLessEqual(len(fig.axes[0].get_lines()[0].get_xdata()), 400)
+		plt.close(fig)
+
+		fig = kpy.plot(tra, 'A', (1000, 2000), decimate=False)
+		np_test.assert_array_equal(fig.axes[0].get_lines()[0].get_ydata(), data[1000:2000, 0])
+		plt.close(fig)
+
+	def test_normalized_plots(self):
+		sim_result = util.simple_synthetic_trajectory()
+
+		fig = kpy.plot(sim_result, ['Cl1', 'H2O'], normalized=True)
+		y_cl1, y_h2o = [line.get_ydata() for line in fig.axes[0].get_lines()]
+		self.assertAlmostEqual(max(np.max(y_cl1), np.max(y_h2o)), 1.0)
+		np_test.assert_allclose(y_h2o / y_cl1, sim_result.loc['H2O'] / sim_result.loc['Cl1'])
+		plt.close(fig)
+
+		fig = kpy.plot(sim_result, ['Cl1', 'H2O'], (10, 50), normalized='species')
+		for line, sp in zip(fig.axes[0].get_lines(), ('Cl1', 'H2O')):
+			self.assertAlmostEqual(np.max(line.get_ydata()), 1.0)
+			np_test.assert_allclose(line.get_ydata(), sim_result.loc[sp, 10:50] / np.max(sim_result.loc[sp, 10:50]))
+		self.assertEqual(fig.axes[0].get_ylabel(), 'normalized concentration')
+		plt.savefig(os.path.join(self.result_base_path, 'synthetic_data_plot_normalized_species.png'))
+		plt.close(fig)
+
+		with self.assertRaises(ValueError):
+			kpy.plot(sim_result, normalized='I am not a normalization')
+
+	def test_live_plot(self):
+		sim_result = util.water_cluster_simulation()
+		chunks = [sim_result[i:i + 1000] for i in range(0, 10000, 1000)]
+
+		live_plot = kpy.LivePlot(['H3O+(H2O)3', 'H3O+(H2O)4'], log='time', max_frame_rate=1e-6, decimate=False)
+		passed_chunks = list(live_plot.follow(
+			kpy.base.Trajectory(sim_result.species_names, chunk.index.values, chunk.values) for chunk in chunks))
+		self.assertEqual(len(passed_chunks), 10)
+		self.assertEqual(live_plot.number_of_samples, 10000)
+
+		# the frame rate cap allows only the first frame while chunks arrive, the final frame is drawn at the end:
+		self.assertEqual(live_plot.number_of_frames, 2)
+		line = live_plot.figure.axes[0].get_lines()[1]
+		np_test.assert_allclose(line.get_xdata(), sim_result.times)
+		np_test.assert_allclose(line.get_ydata(), sim_result.loc['H3O+(H2O)4'])
+		live_plot.figure.savefig(os.path.join(self.result_base_path, 'live_plot.png'))
+		plt.close(live_plot.figure)
+
+		live_plot = kpy.LivePlot(log='both')
+		live_plot.append(np.array([1.0, 2.0]), np.array([[1.0, 2.0], [3.0, 4.0]]), ['A', 'B'])
+		live_plot.append(np.array([3.0]), np.array([[2.0, 5.0]]), ['B', 'A'])
+		live_plot.redraw()
+		np_test.assert_allclose(live_plot.figure.axes[0].get_lines()[0].get_ydata(), [1.0, 3.0, 5.0])
+		plt.close(live_plot.figure)
+
+		with self.assertRaises(ValueError):
+			kpy.LivePlot(max_frame_rate=0)
+
+	def test_batch_plots(self):
+		trajectories = [util.simple_synthetic_trajectory() for i in range(4)]
+		for i, tra in enumerate(trajectories):
+			tra.values[:, 0] *= i + 1
+
+		n_figures = len(plt.get_fignums())
+		for max_workers in (1, 2):
+			file_names = [os.path.join(self.result_base_path, 'batch_plot_{}_{:02d}.png'.format(max_workers, i))
+			              for i in range(len(trajectories))]
+			for file_name in file_names:
+				if os.path.exists(file_name):
+					os.remove(file_name)
+
+			kpy.plot_batch(trajectories, file_names, ['Cl1', 'H2O'], log='concentration',
+			               titles=['run ' + str(i) for i in range(len(trajectories))], max_workers=max_workers)
+			for file_name in file_names:
+				self.assertTrue(os.path.isfile(file_name))
+
+		# batch plots are not registered in pyplot:
+		self.assertEqual(len(plt.get_fignums()), n_figures)
+
+		with self.assertRaises(ValueError):
+			kpy.plot_batch(trajectories, ['a.png'])
+		with self.assertRaises(ValueError):
+			kpy.plot_batch(trajectories[:1], [os.path.join(self.result_base_path, 'a.png')], 'I am not a species')
+
+	def test_batch_bar_plots(self):
+		trajectories = [util.simple_synthetic_trajectory() for i in range(3)]
+		for i, tra in enumerate(trajectories):
+			tra.values[:, 0] *= i + 1
+
+		n_figures = len(plt.get_fignums())
+		for max_workers in (1, 2):
+			average_files = [os.path.join(self.result_base_path, 'batch_average_plot_{}_{:02d}.png'.format(max_workers, i))
+			                 for i in range(len(trajectories))]
+			equilibrium_files = [
+				os.path.join(self.result_base_path, 'batch_equilibrium_plot_{}_{:02d}.png'.format(max_workers, i))
+				for i in range(len(trajectories))]
+			for file_name in average_files + equilibrium_files:
+				if os.path.exists(file_name):
+					os.remove(file_name)
+
+			kpy.plot_average_concentrations_batch(trajectories, average_files, time_steps=(10, 20), log=True,
+			                                      max_workers=max_workers)
+			kpy.plot_equilibrium_state_batch(trajectories, equilibrium_files, time_steps=10, reltol=1.0,
+			                                 titles=['run ' + str(i) for i in range(len(trajectories))],
+			                                 max_workers=max_workers)
+			for file_name in average_files + equilibrium_files:
+				self.assertTrue(os.path.isfile(file_name))
+
+		self.assertEqual(len(plt.get_fignums()), n_figures)
+
+		with self.assertRaises(ValueError):
+			kpy.plot_equilibrium_state_batch(trajectories, ['a.png'])
+
 	def test_equilibrium_state_plot(self):
 		sim_result = util.water_cluster_simulation()
 
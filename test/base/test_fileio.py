@@ -1,6 +1,17 @@
 import unittest
-import kineticsPy as kpy
 import os
+import tempfile
+import numpy as np
+import numpy.testing as np_test
+import kineticsPy as kpy
+
+
+def _is_memory_mapped(array):
+	while array is not None:
+		if isinstance(array, np.memmap):
+			return True
+		array = array.base
+	return False
 
 
 class TestFileIO(unittest.TestCase):
@@ -17,3 +28,82 @@ class TestFileIO(unittest.TestCase):
 		self.assertAlmostEqual(tra.times.tolist()[-1], 9.8e-5)
 		self.assertEqual(tra.loc['Cl_2'].iloc[4], 71)
 		self.assertEqual(tra.concentration_unit, 'simulated particles')
+
+	def test_selective_idsimf_rs_reading(self):
+		tra_full = kpy.read_idsimf_rs_result(self.rs_input)
+		tra = kpy.read_idsimf_rs_result(
+			self.rs_input, species=['Cl_3', 'Cl_2'], time_range=(1e-5, 2e-5), dtype=np.float32, chunk_size=7)
+
+		self.assertEqual(tra.species_names, ['Cl_3', 'Cl_2'])
+		self.assertEqual(tra.number_of_timesteps, 6)
+		self.assertEqual(tra.data.dtypes['Cl_2'], np.float32)
+		np_test.assert_allclose(tra.times, tra_full.times.iloc[5:11])
+		np_test.assert_array_equal(tra.loc['Cl_2'].values, tra_full.loc['Cl_2'].iloc[5:11].values)
+
+		with self.assertRaises(ValueError):
+			kpy.read_idsimf_rs_result(self.rs_input, species=['Cl_2', 'i am not a species'])
+
+	def test_chunked_idsimf_rs_reading(self):
+		tra_full = kpy.read_idsimf_rs_result(self.rs_input)
+		chunks = list(kpy.read_idsimf_rs_result_chunked(self.rs_input, chunk_size=20))
+
+		self.assertEqual([chunk.number_of_timesteps for chunk in chunks], [20, 20, 10])
+		tra = kpy.concatenate_trajectories(chunks)
+		np_test.assert_array_equal(tra.times, tra_full.times)
+		np_test.assert_array_equal(tra[:, :], tra_full[:, :])
+
+	def test_following_growing_idsimf_rs_result(self):
+		tra_full = kpy.read_idsimf_rs_result(self.rs_input)
+		with open(self.rs_input, 'r') as rs_file:
+			lines = rs_file.readlines()
+
+		with tempfile.TemporaryDirectory() as tmp_dir:
+			growing_file = os.path.join(tmp_dir, 'growing_concentrations.txt')
+			with open(growing_file, 'w') as f:
+				f.writelines(lines[:12])
+
+			chunks = kpy.follow_idsimf_rs_result(growing_file, species=['Cl_2', 'Cl_3'], poll_interval=0.01,
+			                                     timeout=0.1)
+			self.assertEqual(next(chunks).number_of_timesteps, 10)
+
+			# a partially written line is not read before it is complete:
+			with open(growing_file, 'a') as f:
+				f.writelines(lines[12:20])
+				f.write(lines[20][:5])
+			self.assertEqual(next(chunks).number_of_timesteps, 8)
+			with open(growing_file, 'a') as f:
+				f.write(lines[20][5:])
+				f.writelines(lines[21:])
+
+			rest = list(chunks)  # the generator stops after the timeout
+			tra = kpy.concatenate_trajectories(rest)
+			np_test.assert_allclose(tra.times, tra_full.times.iloc[18:])
+			np_test.assert_array_equal(tra.loc['Cl_3'].values, tra_full.loc['Cl_3'].iloc[18:].values)
+
+	def test_trajectory_store_writing_and_reading(self):
+		rs_tra = kpy.read_idsimf_rs_result(self.rs_input)
+		tra = kpy.Trajectory(rs_tra.species_names, rs_tra.times.values, rs_tra[:, :].values,
+		                     {'temperature': np.float64(298.0)}, concentration_unit=rs_tra.concentration_unit)
+
+		with tempfile.TemporaryDirectory() as tmp_dir:
+			store_path = os.path.join(tmp_dir, 'trajectory_store')
+			kpy.write_trajectory_store(tra, store_path)
+
+			for memory_mapped in (True, False):
+				with self.subTest(memory_mapped=memory_mapped):
+					stored_tra = kpy.read_trajectory_store(store_path, memory_mapped=memory_mapped)
+
+					self.assertEqual(stored_tra.species_names, tra.species_names)
+					self.assertEqual(stored_tra.number_of_timesteps, 50)
+					self.assertEqual(stored_tra.concentration_unit, 'simulated particles')
+					self.assertEqual(stored_tra.attributes['temperature'], 298.0)
+					np_test.assert_array_equal(stored_tra.times, tra.times)
+					np_test.assert_array_equal(stored_tra[:, :], tra[:, :])
+					self.assertEqual(stored_tra.loc['Cl_2'].iloc[4], 71)
+					self.assertEqual(_is_memory_mapped(stored_tra.loc['Cl_2'].values), memory_mapped)
+
+			# release the memory mapped file before the temporary directory is removed:
+			del stored_tra
+
+		with self.assertRaises(ValueError):
+			kpy.read_trajectory_store(os.path.join('test_inputs', 'i_am_not_a_store'))
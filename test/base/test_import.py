@@ -0,0 +1,54 @@
+import unittest
+import sys
+import json
+import subprocess
+
+
+def _run_import(statements):
+	"""
+	Runs import statements in a fresh interpreter and returns the loaded modules
+	"""
+	code = (
+		'import sys, json\n' +
+		statements + '\n'
+		'print(json.dumps({"modules": list(sys.modules.keys())}))\n')
+	result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+	return json.loads(result.stdout.splitlines()[-1])
+
+
+class TestImport(unittest.TestCase):
+
+	def test_lazy_subpackage_import(self):
+		base_import = _run_import('import kineticsPy')
+		self.assertNotIn('matplotlib', base_import['modules'])
+		self.assertNotIn('kineticsPy.analysis.visualization', base_import['modules'])
+		self.assertNotIn('kineticsPy.cantera', base_import['modules'])
+
+		full_import = _run_import('import kineticsPy\nkineticsPy.plot\nkineticsPy.cantera.simulate_isobar_adiabatic')
+		self.assertIn('matplotlib', full_import['modules'])
+		self.assertIn('kineticsPy.analysis.visualization', full_import['modules'])
+		self.assertIn('kineticsPy.cantera', full_import['modules'])
+
+		# a star import of the analysis package provides the plotting functions:
+		star_import = _run_import('from kineticsPy.analysis import *\nplot, plot_average_concentrations, '
+		                          'plot_equilibrium_state, equilibrium_state')
+		self.assertIn('kineticsPy.analysis.visualization', star_import['modules'])
+
+	def test_lazy_attributes(self):
+		import kineticsPy as kpy
+		import kineticsPy.analysis.visualization as vis
+
+		self.assertIs(kpy.plot, vis.plot)
+		self.assertIs(kpy.analysis.plot_batch, vis.plot_batch)
+		self.assertIs(kpy.analysis.visualization, vis)
+		self.assertIn('plot', dir(kpy))
+		self.assertIn('cantera', dir(kpy))
+
+		with self.assertRaises(AttributeError):
+			kpy.i_am_not_an_attribute
+		with self.assertRaises(AttributeError):
+			kpy.analysis.i_am_not_an_attribute
+
+		# the global matplotlib style is not changed by the plotting module:
+		import matplotlib
+		self.assertEqual(matplotlib.rcParams['axes.facecolor'], matplotlib.rcParamsDefault['axes.facecolor'])
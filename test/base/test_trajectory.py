@@ -2,6 +2,7 @@ import unittest
 import kineticsPy as kpy
 import pandas as pd
 import pandas.testing as pd_test
+import numpy as np
 import numpy.testing as np_test
 
 
@@ -66,8 +67,73 @@ class TestTrajectory(unittest.TestCase):
 		self.assertEqual(tra.loc['B'].loc[5.0], 200)
 		np_test.assert_array_equal(tra.loc[['B', 'H2O']].loc[5.0].values, [200,  19.6])
 
-		# slicing is possible:
+		# slicing is possible (the concentration data is one two dimensional array with a common data type):
 		pd_test.assert_series_equal(
 			tra.loc['A', 2:4],
-			pd.Series([14, 16], name='A', index=pd.Index([5.0, 7.5], name='Time')))
+			pd.Series([14.0, 16.0], name='A', index=pd.Index([5.0, 7.5], name='Time')))
 
+		# list of species with a single time step index gives the concentrations at that time step:
+		pd_test.assert_series_equal(
+			tra.loc[['B', 'H2O'], 4],
+			pd.Series([800, 18.5], name=10.0, index=['B', 'H2O']))
+
+		# lists of time steps and boolean masks select time series like slices:
+		pd_test.assert_series_equal(
+			tra.loc['A', [1, 2, 3]],
+			pd.Series([12.0, 14.0, 16.0], name='A', index=pd.Index([2.5, 5.0, 7.5], name='Time')))
+		pd_test.assert_frame_equal(
+			tra.loc[['A', 'B'], [1, 2]],
+			pd.DataFrame([[12.0, 100.0], [14.0, 200.0]], columns=['A', 'B'], index=pd.Index([2.5, 5.0], name='Time')))
+		mask = tra.time_values > 12.0
+		pd_test.assert_series_equal(
+			tra.loc['A', mask],
+			pd.Series([20.0, 22.0], name='A', index=pd.Index([15.0, 20.0], name='Time')))
+		pd_test.assert_frame_equal(
+			tra.loc[['A', 'B'], mask],
+			pd.DataFrame([[20.0, 1600.0], [22.0, 3200.0]], columns=['A', 'B'],
+			             index=pd.Index([15.0, 20.0], name='Time')))
+
+	def test_zero_copy_creation(self):
+		times = np.linspace(0, 1, 5)
+		data = np.arange(10.0).reshape((5, 2))
+		tra = kpy.Trajectory(["A", "B"], times, data)
+
+		# numpy arrays are taken over without copying, pandas objects are views on the data:
+		self.assertIs(tra.values, data)
+		self.assertIs(tra.time_values, times)
+		self.assertTrue(np.shares_memory(tra.data.values, data))
+		self.assertTrue(np.shares_memory(tra.loc['B'].values, data))
+		self.assertEqual(tra.species_index('B'), 1)
+
+		tra_copy = kpy.Trajectory(["A", "B"], times, data, copy=True)
+		self.assertFalse(np.shares_memory(tra_copy.values, data))
+
+		with self.assertRaises(ValueError):
+			kpy.Trajectory(["A", "B", "C"], times, data)
+
+		with self.assertRaises(ValueError):
+			kpy.Trajectory(["A", "B"], times[:-1], data)
+
+		# the one dimensional time series of a single species is accepted:
+		tra_single = kpy.Trajectory(["A"], times, data[:, 0])
+		self.assertEqual(tra_single.values.shape, (5, 1))
+		np_test.assert_array_equal(tra_single.loc['A'].values, data[:, 0])
+		with self.assertRaises(ValueError):
+			kpy.Trajectory(["A", "B"], times, data[:, 0])
+
+	def test_trajectory_concatenation(self):
+		species_names = ["A", "B"]
+		tra_1 = kpy.Trajectory(species_names, [0.0, 1.0], [[1, 2], [3, 4]], {'temperature': 298})
+		tra_2 = kpy.Trajectory(species_names, [2.0], [[5, 6]])
+
+		tra = kpy.concatenate_trajectories([tra_1, tra_2])
+		self.assertEqual(tra.number_of_timesteps, 3)
+		self.assertEqual(tra.attributes['temperature'], 298)
+		np_test.assert_array_equal(tra.times, [0.0, 1.0, 2.0])
+		np_test.assert_array_equal(tra.loc['B'], [2, 4, 6])
+
+		with self.assertRaises(ValueError):
+			kpy.concatenate_trajectories([tra_1, kpy.Trajectory(["A", "C"], [2.0], [[5, 6]])])
+
+		with self.assertRaises(ValueError):
+			kpy.concatenate_trajectories([])
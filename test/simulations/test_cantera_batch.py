@@ -0,0 +1,45 @@
+import unittest
+import os
+import numpy as np
+import numpy.testing as np_test
+import kineticsPy.cantera.simulation as sim
+import kineticsPy.cantera.batch as batch
+
+
+class TestCanteraBatch(unittest.TestCase):
+
+	@classmethod
+	def setUpClass(cls):
+		data_base_path = os.path.join('test_inputs')
+		cls.water_cluster_input = os.path.join(data_base_path, 'WaterCluster_RoomTemp.cti')
+		cls.mole_fractions = ['H2O:{:e}, N2:2.54e+17, H3O+:1e+10'.format(h2o) for h2o in (1e14, 2.5e14, 5e14)]
+
+	def test_batched_simulation(self):
+		results = batch.simulate_isobar_adiabatic_batch(
+			self.water_cluster_input, self.mole_fractions, 1000, 2e-9, 100000, record_period=10, batch_size=2)
+		self.assertEqual(len(results), 3)
+
+		for mole_fractions, result in zip(self.mole_fractions, results):
+			reference = sim.simulate_isobar_adiabatic(
+				self.water_cluster_input, mole_fractions, 1000, 2e-9, 100000, record_period=10)
+			self.assertEqual(result.species_names, reference.species_names)
+			np_test.assert_allclose(result.time_values, reference.time_values)
+			# results agree within the solver tolerances, relative to the maximum concentration of a species:
+			scale = np.max(np.abs(reference.values), axis=0) + 1.0
+			np_test.assert_allclose(result.values / scale, reference.values / scale, atol=1e-5)
+
+	def test_custom_steps(self):
+		custom_steps = np.geomspace(1e-9, 1e-5, 50)
+		results = batch.simulate_isobar_adiabatic_batch(
+			self.water_cluster_input, self.mole_fractions, custom_steps, 100000)
+		np_test.assert_allclose(results[2].time_values, custom_steps)
+
+		# a single configuration is simulated as one case:
+		results = batch.simulate_isobar_adiabatic_batch(
+			self.water_cluster_input, self.mole_fractions[2], custom_steps, 100000)
+		self.assertEqual(len(results), 1)
+		np_test.assert_allclose(results[0].time_values, custom_steps)
+
+		with self.assertRaises(ValueError):
+			batch.simulate_isobar_adiabatic_batch(
+				self.water_cluster_input, self.mole_fractions, 1000, 2e-9, 100000, batch_size=0)
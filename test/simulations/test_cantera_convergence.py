@@ -0,0 +1,80 @@
+import unittest
+import numpy.testing as np_test
+import numpy as np
+import os
+import kineticsPy.cantera.simulation as sim
+import kineticsPy.cantera.convergence as conv
+
+
+class TestCanteraConvergence(unittest.TestCase):
+
+	@classmethod
+	def setUpClass(cls):
+		data_base_path = os.path.join('test_inputs')
+		cls.water_cluster_input = os.path.join(data_base_path, 'WaterCluster_RoomTemp.cti')
+		cls.reference = sim.simulate_isobar_adiabatic(
+			cls.water_cluster_input, 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10', 10000, 2e-9, 100000)
+
+	def test_convergence_monitor(self):
+		monitor = conv.ConvergenceMonitor(window=10, reltol=0.01, check_period=1)
+		monitor.reset(2)
+
+		# a decaying signal converges when the fluctuation in the window drops below the tolerance:
+		times = np.arange(200)
+		for t in times:
+			converged = monitor.update(t, np.array([1.0 + np.exp(-0.1 * t), 2.0]))
+			if converged:
+				break
+
+		self.assertTrue(monitor.converged)
+		self.assertEqual(monitor.converged_time, 50)
+		self.assertEqual(monitor.number_of_samples, 51)
+		np_test.assert_allclose(monitor.mean, [1.0 + np.mean(np.exp(-0.1 * np.arange(41, 51))), 2.0])
+
+		# the running mean must not keep the rounding errors of a large transient which left the window:
+		monitor = conv.ConvergenceMonitor(window=10, stop=False, check_period=10)
+		monitor.reset(1)
+		for t in range(100):
+			monitor.update(t, np.array([1e20 if t < 10 else 1.0]))
+		np_test.assert_allclose(monitor.mean, [1.0])
+
+		with self.assertRaises(ValueError):
+			conv.ConvergenceMonitor(window=1)
+		with self.assertRaises(ValueError):
+			conv.ConvergenceMonitor(check_period=0)
+
+	def test_simulation_stop_at_convergence(self):
+		monitor = conv.ConvergenceMonitor(window=100, reltol=0.01)
+		sim_result = sim.simulate_isobar_adiabatic(
+			self.water_cluster_input, 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10', 10000, 2e-9, 100000,
+			convergence=monitor)
+
+		self.assertTrue(monitor.converged)
+		self.assertLess(sim_result.number_of_timesteps, self.reference.number_of_timesteps)
+		self.assertAlmostEqual(sim_result.attributes['converged_time'], sim_result.times.iloc[-1])
+
+		n_ts = sim_result.number_of_timesteps
+		np_test.assert_allclose(sim_result[:, :], self.reference[:n_ts, :], rtol=1e-6)
+
+		# the converged state is the equilibrium state of the full trajectory:
+		np_test.assert_allclose(monitor.mean, self.reference[-1, :], rtol=0.01, atol=1.0)
+
+	def test_simulation_without_stop(self):
+		monitor = conv.ConvergenceMonitor(window=100, reltol=0.01, stop=False)
+		sim_result = sim.simulate_isobar_adiabatic(
+			self.water_cluster_input, 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10', 10000, 2e-9, 100000,
+			convergence=monitor)
+
+		self.assertEqual(sim_result.number_of_timesteps, self.reference.number_of_timesteps)
+		self.assertIsNotNone(sim_result.attributes['converged_time'])
+
+	def test_integrator_steps_stop_at_convergence(self):
+		# trace species fluctuate around zero with the variable solver time steps:
+		monitor = conv.ConvergenceMonitor(window=10, reltol=0.01, atol=1e4, check_period=1)
+		sim_result = sim.simulate_isobar_adiabatic(
+			self.water_cluster_input, 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10', 10000, 2e-9, 100000,
+			integrator_steps=True, convergence=monitor)
+
+		self.assertTrue(monitor.converged)
+		self.assertLess(sim_result.number_of_timesteps, self.reference.number_of_timesteps)
+		self.assertLessEqual(sim_result.times.iloc[-1], sim_result.attributes['converged_time'])
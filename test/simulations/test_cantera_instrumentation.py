@@ -0,0 +1,69 @@
+import unittest
+import os
+import numpy.testing as np_test
+import kineticsPy.cantera.simulation as sim
+import kineticsPy.cantera.instrumentation as instr
+from kineticsPy.base.fileio import write_trajectory_store, read_trajectory_store
+
+
+class TestCanteraInstrumentation(unittest.TestCase):
+
+	@classmethod
+	def setUpClass(cls):
+		data_base_path = os.path.join('test_inputs')
+		cls.water_cluster_input = os.path.join(data_base_path, 'WaterCluster_RoomTemp.cti')
+		cls.initial_mole_fractions = 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10'
+		cls.result_path = os.path.join('test_results')
+		cls.reference = sim.simulate_isobar_adiabatic(
+			cls.water_cluster_input, cls.initial_mole_fractions, 1000, 2e-9, 100000, record_period=10)
+
+	def test_profiled_simulation(self):
+		callback_calls = []
+		profiler = instr.SimulationProfiler()
+		profiler.add_callback(lambda step, time, prof: callback_calls.append((step, prof.counters['steps'])), 250)
+
+		result = sim.simulate_isobar_adiabatic(
+			self.water_cluster_input, self.initial_mole_fractions, 1000, 2e-9, 100000, record_period=10,
+			profiler=profiler)
+
+		# the profiler does not change the simulation result:
+		np_test.assert_allclose(result.data, self.reference.data)
+
+		profile = result.attributes['profile']
+		self.assertEqual(profile['counters'], {'steps': 1000, 'recorded_samples': 100, 'callback_calls': 4})
+		self.assertEqual(callback_calls, [(0, 1), (250, 251), (500, 501), (750, 751)])
+
+		timers = profile['timers']
+		self.assertGreater(timers['integration'], 0.0)
+		self.assertGreater(timers['extraction'], 0.0)
+		self.assertAlmostEqual(sum(timers.values()), profile['total_time'], places=6)
+		if profile['solver_stats'] is not None:
+			self.assertGreaterEqual(profile['solver_stats']['rhs_evals'], profile['solver_stats']['steps'])
+
+		# the statistics are stored with the trajectory:
+		store_path = os.path.join(self.result_path, 'profiled_trajectory')
+		write_trajectory_store(result, store_path)
+		self.assertEqual(read_trajectory_store(store_path).attributes['profile']['counters'], profile['counters'])
+
+	def test_profiled_integrator_steps(self):
+		profiler = instr.SimulationProfiler()
+		result = sim.simulate_isobar_adiabatic(
+			self.water_cluster_input, self.initial_mole_fractions, 1000, 2e-9, 100000, record_period=10,
+			integrator_steps=True, profiler=profiler)
+
+		self.assertEqual(profiler.counters['recorded_samples'], 100)
+		self.assertGreater(profiler.counters['steps'], 0)
+		self.assertEqual(result.attributes['profile']['counters'], profiler.counters)
+
+	def test_profiled_chunked_simulation(self):
+		profiler = instr.SimulationProfiler()
+		chunks = list(sim.simulate_isobar_adiabatic_chunked(
+			self.water_cluster_input, self.initial_mole_fractions, 1000, 2e-9, 100000, chunk_size=300,
+			profiler=profiler))
+
+		self.assertEqual(len(chunks), 4)
+		self.assertEqual(chunks[0].attributes['profile']['counters']['recorded_samples'], 300)
+		self.assertEqual(chunks[-1].attributes['profile']['counters']['recorded_samples'], 1000)
+
+		with self.assertRaises(ValueError):
+			profiler.add_callback(print, 0)
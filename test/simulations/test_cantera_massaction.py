@@ -0,0 +1,79 @@
+import unittest
+import os
+import numpy as np
+import numpy.testing as np_test
+import kineticsPy.cantera.simulation as sim
+import kineticsPy.cantera.massaction as ma
+from kineticsPy.cantera.mechanism import load_mechanism
+
+
+class TestCanteraMassAction(unittest.TestCase):
+
+	@classmethod
+	def setUpClass(cls):
+		data_base_path = os.path.join('test_inputs')
+		cls.water_cluster_input = os.path.join(data_base_path, 'WaterCluster_RoomTemp.cti')
+		cls.initial_mole_fractions = 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10'
+		cls.reference = sim.simulate_isochoric_isothermal(
+			cls.water_cluster_input, cls.initial_mole_fractions, 1000, 2e-9, 100000, record_period=10)
+
+	def test_mass_action_model(self):
+		model = ma.MassActionModel(load_mechanism(self.water_cluster_input))
+		self.assertEqual(model.n_directions, 8)
+		self.assertEqual(model.stoichiometry.shape, (7, 8))
+		self.assertAlmostEqual(model.rate_constants[0] / 6.98e-29, 1.0, places=3)
+
+		# the analytic Jacobian has to match a finite difference of the production rates:
+		concentrations = np.array([[2.4e19, 2.4e16, 1e11, 2e11, 3e11, 4e11, 5e11],
+		                           [2.4e19, 1.2e16, 5e11, 4e11, 3e11, 2e11, 1e11]])
+		jacobian = model.jacobian(concentrations).toarray()
+		self.assertEqual(jacobian.shape, (14, 14))
+		np_test.assert_array_equal(jacobian[:7, 7:], 0.0)
+
+		rates = model.production_rates(concentrations).ravel()
+		fd_jacobian = np.zeros_like(jacobian)
+		for i, c in enumerate(concentrations.ravel()):
+			perturbed = concentrations.ravel().copy()
+			perturbed[i] += c * 1e-7
+			fd_jacobian[:, i] = (model.production_rates(perturbed.reshape(2, 7)).ravel() - rates) / (c * 1e-7)
+		np_test.assert_allclose(jacobian, fd_jacobian, rtol=1e-4, atol=1e-6 * np.max(np.abs(jacobian)))
+
+	def test_mass_action_simulation(self):
+		for method in ('BDF', 'LSODA'):
+			result = ma.simulate_mass_action(
+				self.water_cluster_input, self.initial_mole_fractions, 1000, 2e-9, 100000, record_period=10,
+				method=method)
+
+			self.assertEqual(result.species_names, self.reference.species_names)
+			np_test.assert_allclose(result.times, self.reference.times)
+			np_test.assert_allclose(result.values, self.reference.values, rtol=1e-4, atol=1e5)
+
+		with self.assertRaises(ValueError):
+			ma.simulate_mass_action(
+				self.water_cluster_input, self.initial_mole_fractions, 1000, 2e-9, 100000, method='RK45')
+
+	def test_mass_action_batch(self):
+		multipliers = np.ones((50, 8))
+		multipliers[:, 0] = np.linspace(0.5, 2.0, 50)
+		results = ma.simulate_mass_action_batch(
+			self.water_cluster_input, self.initial_mole_fractions, 1000, 2e-9, 100000, record_period=10,
+			rate_multipliers=multipliers)
+
+		self.assertEqual(len(results), 50)
+		single = ma.simulate_mass_action(
+			self.water_cluster_input, self.initial_mole_fractions, 1000, 2e-9, 100000, record_period=10,
+			rate_multipliers=multipliers[-1])
+		np_test.assert_allclose(results[-1].values, single.values, rtol=1e-4, atol=1e5)
+		self.assertLess(results[-1].loc['H3O+', 1], results[0].loc['H3O+', 1])
+
+		mole_fractions = ['H2O:{:e}, N2:2.54e+17, H3O+:1e+10'.format(h2o) for h2o in (1e14, 2.5e14)]
+		results = ma.simulate_mass_action_batch(
+			self.water_cluster_input, mole_fractions, 1000, 2e-9, 100000, record_period=10)
+		np_test.assert_allclose(results[1].values, self.reference.values, rtol=1e-4, atol=1e5)
+
+		with self.assertRaises(ValueError):
+			ma.simulate_mass_action_batch(
+				self.water_cluster_input, mole_fractions, 1000, 2e-9, 100000, rate_multipliers=multipliers)
+		with self.assertRaises(ValueError):
+			ma.simulate_mass_action_batch(
+				self.water_cluster_input, mole_fractions, 1000, 2e-9, 100000, rate_multipliers=np.ones((2, 3)))
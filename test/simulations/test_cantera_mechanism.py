@@ -0,0 +1,82 @@
+import unittest
+import numpy.testing as np_test
+import os
+import shutil
+import tempfile
+import kineticsPy.cantera.simulation as sim
+import kineticsPy.cantera.mechanism as mech
+
+
+class TestCanteraMechanism(unittest.TestCase):
+
+	@classmethod
+	def setUpClass(cls):
+		data_base_path = os.path.join('test_inputs')
+		cls.water_cluster_input = os.path.join(data_base_path, 'WaterCluster_RoomTemp.cti')
+
+	def test_mechanism_reset_and_clone(self):
+		mechanism = mech.Mechanism(self.water_cluster_input)
+		self.assertEqual(
+			mechanism.species_names,
+			['N2', 'H2O', 'H3O+', 'H3O+(H2O)', 'H3O+(H2O)2', 'H3O+(H2O)3', 'H3O+(H2O)4'])
+
+		sol = mechanism.reset(2e5, 'H2O:1.0, N2:1.0')
+		self.assertAlmostEqual(sol.P, 2e5)
+		self.assertAlmostEqual(sol.T, mechanism.initial_temperature)
+		np_test.assert_allclose(sol['N2', 'H2O'].X, [0.5, 0.5])
+
+		sol.TPX = 500.0, 1e4, 'N2:1.0'
+		sol = mechanism.reset()
+		self.assertAlmostEqual(sol.T, mechanism.initial_temperature)
+		self.assertAlmostEqual(sol.P, 100000)
+
+		clone = mechanism.clone()
+		self.assertIsNot(clone, mechanism.solution)
+		self.assertEqual(clone.species_names, mechanism.species_names)
+		self.assertEqual(clone.n_reactions, mechanism.solution.n_reactions)
+
+	def test_mechanism_cache(self):
+		cache = mech.MechanismCache(max_size=2)
+		m1 = cache.get(self.water_cluster_input)
+		m2 = cache.get(self.water_cluster_input)
+		self.assertIs(m1, m2)
+		self.assertEqual((cache.hits, cache.misses), (1, 1))
+		self.assertTrue(self.water_cluster_input in cache)
+
+		with tempfile.TemporaryDirectory() as tmp_dir:
+			copies = [os.path.join(tmp_dir, 'copy_' + str(i) + '.cti') for i in range(2)]
+			for copy in copies:
+				shutil.copy(self.water_cluster_input, copy)
+
+			# least recently used mechanism is evicted:
+			cache.get(copies[0])
+			cache.get(copies[1])
+			self.assertEqual(len(cache), 2)
+			self.assertFalse(self.water_cluster_input in cache)
+
+			# modified input files are parsed again:
+			with open(copies[1], 'a') as f:
+				f.write('\n# modified\n')
+			os.utime(copies[1], ns=(0, 0))
+			self.assertFalse(copies[1] in cache)
+			self.assertIsNot(cache.get(copies[1]), m1)
+			self.assertEqual(cache.misses, 4)
+
+		with self.assertRaises(ValueError):
+			mech.MechanismCache(max_size=0)
+
+	def test_cached_simulations_are_reproducible(self):
+		cache = mech.MechanismCache()
+		results = [
+			sim.simulate_isobar_adiabatic(
+				self.water_cluster_input, 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10', 1000, 2e-9, 100000,
+				mechanism_cache=cache)
+			for i in range(2)]
+		uncached_result = sim.simulate_isobar_adiabatic(
+			self.water_cluster_input, 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10', 1000, 2e-9, 100000,
+			mechanism_cache=False)
+
+		self.assertEqual(cache.misses, 1)
+		self.assertEqual(cache.hits, 1)
+		np_test.assert_allclose(results[0][:, :], results[1][:, :])
+		np_test.assert_allclose(results[0][:, :], uncached_result[:, :])
@@ -0,0 +1,60 @@
+import unittest
+import numpy.testing as np_test
+import os
+import kineticsPy.cantera.simulation as sim
+import kineticsPy.cantera.pipeline as pipe
+import kineticsPy.cantera.convergence as conv
+
+
+class TestCanteraPipeline(unittest.TestCase):
+
+	@classmethod
+	def setUpClass(cls):
+		data_base_path = os.path.join('test_inputs')
+		cls.water_cluster_input = os.path.join(data_base_path, 'WaterCluster_RoomTemp.cti')
+
+	def test_pipeline_continues_previous_stage(self):
+		reference = sim.simulate_isobar_adiabatic(
+			self.water_cluster_input, 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10', 2000, 2e-9, 100000)
+
+		stages = [pipe.SimulationStage(1000, 2e-9, pressure=100000), pipe.SimulationStage(1000, 2e-9)]
+		sim_result = pipe.simulate_isobar_adiabatic_pipeline(
+			self.water_cluster_input, 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10', stages)
+
+		self.assertEqual(sim_result.number_of_timesteps, 2000)
+		np_test.assert_allclose(sim_result.attributes['stage_start_times'], [0.0, 999 * 2e-9])
+		self.assertEqual(sim_result.attributes['stage_start_indices'], [0, 1000])
+		np_test.assert_allclose(sim_result.attributes['stage_pressures'][0], 100000)
+
+		# the first stage is the beginning of the reference simulation:
+		np_test.assert_allclose(sim_result[:1000, :], reference[:1000, :], rtol=1e-6)
+
+		# the second stage starts exactly with the final state of the first stage
+		# (trace species close to zero are affected by the restart of the solver):
+		np_test.assert_allclose(sim_result.times.iloc[1000], sim_result.times.iloc[999])
+		np_test.assert_allclose(sim_result[1000, :], sim_result[999, :], rtol=1e-12)
+		np_test.assert_allclose(sim_result[1000:, :], reference[999:1999, :], rtol=1e-4, atol=100.0)
+
+	def test_pipeline_with_changed_conditions(self):
+		stages = [
+			pipe.SimulationStage(10000, 2e-9, pressure=100000, convergence=conv.ConvergenceMonitor(window=100)),
+			pipe.SimulationStage(1000, 2e-9, pressure=200000, temperature=350)]
+		sim_result = pipe.simulate_isobar_adiabatic_pipeline(
+			self.water_cluster_input, 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10', stages)
+
+		n_first_stage = sim_result.attributes['stage_start_indices'][1]
+		self.assertLess(n_first_stage, 10000)
+		self.assertEqual(sim_result.number_of_timesteps, n_first_stage + 1000)
+		np_test.assert_allclose(sim_result.attributes['stage_pressures'], [100000, 200000])
+		np_test.assert_allclose(sim_result.attributes['stage_temperatures'][1], 350)
+
+		# doubling the pressure and increasing the temperature changes the number densities:
+		np_test.assert_allclose(
+			sim_result.loc['N2'].iloc[n_first_stage] / sim_result.loc['N2'].iloc[n_first_stage - 1],
+			2.0 * sim_result.attributes['stage_temperatures'][0] / 350, rtol=1e-3)
+
+		with self.assertRaises(ValueError):
+			pipe.simulate_isobar_adiabatic_pipeline(
+				self.water_cluster_input, 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10', [])
+		with self.assertRaises(ValueError):
+			pipe.SimulationStage(1000, 2e-9, 100000)
@@ -0,0 +1,94 @@
+import unittest
+import numpy.testing as np_test
+import numpy as np
+import os
+import kineticsPy.cantera.simulation as sim
+import kineticsPy.cantera.recording as rec
+
+
+class TestCanteraRecording(unittest.TestCase):
+
+	@classmethod
+	def setUpClass(cls):
+		data_base_path = os.path.join('test_inputs')
+		cls.water_cluster_input = os.path.join(data_base_path, 'WaterCluster_RoomTemp.cti')
+		cls.reference = sim.simulate_isobar_adiabatic(
+			cls.water_cluster_input, 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10', 10000, 2e-9, 100000)
+
+	def test_periodic_recording(self):
+		sim_result = sim.simulate_isobar_adiabatic(
+			self.water_cluster_input, 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10', 10000, 2e-9, 100000,
+			recording=rec.PeriodicRecording(7))
+
+		self.assertEqual(sim_result.number_of_timesteps, 1429)
+		np_test.assert_allclose(sim_result.times, self.reference.times[::7])
+
+		with self.assertRaises(ValueError):
+			rec.PeriodicRecording(0)
+
+	def test_periodic_recording_subclass(self):
+		class FirstStepsRecording(rec.PeriodicRecording):
+			def record(self, step, time, concentrations):
+				return step < 5 or super().record(step, time, concentrations)
+
+		sim_result = sim.simulate_isobar_adiabatic(
+			self.water_cluster_input, 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10', 10000, 2e-9, 100000,
+			recording=FirstStepsRecording(1000))
+
+		# the record decision of the subclass has to be used instead of the plain recording period:
+		self.assertEqual(sim_result.number_of_timesteps, 14)
+		recorded_steps = [0, 1, 2, 3, 4] + list(range(1000, 10000, 1000))
+		np_test.assert_allclose(sim_result.times, self.reference.times[recorded_steps])
+
+	def test_change_threshold_recording(self):
+		sim_result = sim.simulate_isobar_adiabatic(
+			self.water_cluster_input, 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10', 10000, 2e-9, 100000,
+			recording=rec.ChangeThresholdRecording(rtol=0.01, atol=1.0))
+
+		# the trajectory converges to an equilibrium, far less samples are recorded:
+		self.assertLess(sim_result.number_of_timesteps, 1000)
+		self.assertAlmostEqual(sim_result.times.iloc[0], 0.0)
+		self.assertAlmostEqual(sim_result.times.iloc[-1], self.reference.times.iloc[-1])
+
+		# the recorded samples are samples of the full trajectory:
+		recorded_steps = np.round(sim_result.times.values / 2e-9).astype(int)
+		np_test.assert_allclose(sim_result[:, :], self.reference[recorded_steps, :], rtol=1e-6)
+
+		# no species changed by more than the thresholds between two recorded samples:
+		dat = self.reference[:, :].values
+		for i in range(len(recorded_steps) - 1):
+			segment = dat[recorded_steps[i]:recorded_steps[i + 1]]
+			self.assertTrue(np.all(np.abs(segment - segment[0]) <= 1.0 + 0.01 * np.abs(segment[0])))
+
+		with self.assertRaises(ValueError):
+			rec.ChangeThresholdRecording(rtol=-1.0)
+
+	def test_change_threshold_recording_with_max_period(self):
+		sim_result = sim.simulate_isobar_adiabatic(
+			self.water_cluster_input, 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10', 10000, 2e-9, 100000,
+			recording=rec.ChangeThresholdRecording(rtol=1e3, atol=1e30, max_period=1000))
+
+		self.assertEqual(sim_result.number_of_timesteps, 11)
+
+	def test_log_time_recording(self):
+		times = np.linspace(0, 1e-3, 100001)
+		sim_result = sim.simulate_isobar_adiabatic(
+			self.water_cluster_input, 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10', times, 100000,
+			recording=rec.LogTimeRecording(samples_per_decade=10))
+
+		recorded_times = sim_result.times.values
+		self.assertEqual(recorded_times[0], 0.0)
+		self.assertEqual(recorded_times[1], times[1])
+		self.assertEqual(recorded_times[-1], times[-1])
+
+		# five decades with ten samples per decade:
+		self.assertLessEqual(len(recorded_times), 53)
+		self.assertTrue(np.all(recorded_times[2:-1] / recorded_times[1:-2] >= 10.0 ** 0.1))
+
+	def test_adaptive_chunked_recording(self):
+		chunks = list(sim.simulate_isobar_adiabatic_chunked(
+			self.water_cluster_input, 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10', 10000, 2e-9, 100000,
+			chunk_size=10, recording=rec.ChangeThresholdRecording(rtol=0.01)))
+
+		self.assertGreater(len(chunks), 1)
+		self.assertTrue(all(chunk.number_of_timesteps <= 10 for chunk in chunks))
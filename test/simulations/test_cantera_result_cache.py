@@ -0,0 +1,107 @@
+import unittest
+import os
+import json
+import shutil
+import numpy as np
+import numpy.testing as np_test
+import kineticsPy.cantera.simulation as sim
+import kineticsPy.cantera.result_cache as rc
+import kineticsPy.cantera.convergence as conv
+
+
+def _is_memory_mapped(array):
+	while array is not None:
+		if isinstance(array, np.memmap):
+			return True
+		array = array.base
+	return False
+
+
+class TestCanteraResultCache(unittest.TestCase):
+
+	@classmethod
+	def setUpClass(cls):
+		data_base_path = os.path.join('test_inputs')
+		cls.water_cluster_input = os.path.join(data_base_path, 'WaterCluster_RoomTemp.cti')
+		cls.initial_mole_fractions = 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10'
+		cls.cache_dir = os.path.join('test_results', 'result_cache')
+
+	def setUp(self):
+		shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+	def test_cached_simulation(self):
+		cache = rc.ResultCache(self.cache_dir)
+		result = sim.simulate_isobar_adiabatic(
+			self.water_cluster_input, self.initial_mole_fractions, 1000, 2e-9, 100000, result_cache=cache)
+		self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 1, 1))
+
+		cached_result = sim.simulate_isobar_adiabatic(
+			self.water_cluster_input, self.initial_mole_fractions, 1000, 2e-9, 100000, result_cache=cache)
+		self.assertEqual((cache.hits, cache.misses), (1, 1))
+		self.assertTrue(_is_memory_mapped(cached_result.values))
+		np_test.assert_array_equal(cached_result.values, result.values)
+		np_test.assert_array_equal(cached_result.time_values, result.time_values)
+		self.assertEqual(cached_result.attributes, {'pressure': 100000})
+
+		# changed simulation parameters are new cache entries:
+		sim.simulate_isobar_adiabatic(
+			self.water_cluster_input, self.initial_mole_fractions, 1000, 2e-9, 100000, rtol=1e-10,
+			result_cache=cache)
+		sim.simulate_isobar_adiabatic(
+			self.water_cluster_input, self.initial_mole_fractions, np.linspace(0, 1e-6, 100), 100000,
+			result_cache=cache)
+		self.assertEqual((cache.hits, cache.misses, len(cache)), (1, 3, 3))
+
+		# numpy scalar parameters give the same cache key as plain numbers:
+		sim.simulate_isobar_adiabatic(
+			self.water_cluster_input, self.initial_mole_fractions, np.int64(1000), np.float64(2e-9),
+			np.float64(100000), record_period=np.int64(1), rtol=np.float64(1e-10), result_cache=cache)
+		self.assertEqual((cache.hits, cache.misses, len(cache)), (2, 3, 3))
+
+		with self.assertRaises(ValueError):
+			sim.simulate_isobar_adiabatic(
+				self.water_cluster_input, self.initial_mole_fractions, 1000, 2e-9, 100000, result_cache=cache,
+				convergence=conv.ConvergenceMonitor())
+
+	def test_lru_eviction(self):
+		cache = rc.ResultCache(self.cache_dir)
+		rtols = (1e-9, 1e-10, 1e-11)
+		keys = [cache.key(self.water_cluster_input, self.initial_mole_fractions, 100, 2e-9, None, 100000, rtol=rtol)
+		        for rtol in rtols]
+		self.assertEqual(len(set(keys)), 3)
+
+		for key, rtol in zip(keys[:2], rtols):
+			cache.put(key, sim.simulate_isobar_adiabatic(
+				self.water_cluster_input, self.initial_mole_fractions, 100, 2e-9, 100000, rtol=rtol))
+		cache_size = cache.size
+
+		# the first entry is used again, the second entry is the least recently used entry:
+		os.utime(os.path.join(self.cache_dir, keys[1]), ns=(0, 0))
+		self.assertIsNotNone(cache.get(keys[0]))
+
+		# the cache is limited to two entries of the same size:
+		small_cache = rc.ResultCache(self.cache_dir, max_size=cache_size)
+		small_cache.put(keys[2], sim.simulate_isobar_adiabatic(
+			self.water_cluster_input, self.initial_mole_fractions, 100, 2e-9, 100000, rtol=rtols[2]))
+		self.assertIn(keys[0], small_cache)
+		self.assertNotIn(keys[1], small_cache)
+		self.assertIn(keys[2], small_cache)
+		self.assertLessEqual(small_cache.size, cache_size)
+
+	def test_cantera_version_invalidation(self):
+		cache = rc.ResultCache(self.cache_dir)
+		sim.simulate_isobar_adiabatic(
+			self.water_cluster_input, self.initial_mole_fractions, 100, 2e-9, 100000, result_cache=cache)
+		self.assertEqual(len(rc.ResultCache(self.cache_dir)), 1)
+
+		info_path = os.path.join(self.cache_dir, 'cache.json')
+		with open(info_path, 'r') as info_file:
+			info = json.load(info_file)
+		info['cantera_version'] = '2.4.0'
+		with open(info_path, 'w') as info_file:
+			json.dump(info, info_file)
+
+		self.assertEqual(len(rc.ResultCache(self.cache_dir)), 0)
+
+		with self.assertRaises(ValueError):
+			rc.ResultCache('test_inputs')
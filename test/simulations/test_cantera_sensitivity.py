@@ -0,0 +1,66 @@
+import unittest
+import os
+import numpy as np
+import numpy.testing as np_test
+import kineticsPy.cantera.simulation as sim
+import kineticsPy.cantera.sensitivity as sens
+from kineticsPy.cantera.mechanism import MechanismCache
+
+
+class TestCanteraSensitivity(unittest.TestCase):
+
+	@classmethod
+	def setUpClass(cls):
+		data_base_path = os.path.join('test_inputs')
+		cls.water_cluster_input = os.path.join(data_base_path, 'WaterCluster_RoomTemp.cti')
+		cls.initial_mole_fractions = 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10'
+		cls.reference = sim.simulate_isobar_adiabatic(
+			cls.water_cluster_input, cls.initial_mole_fractions, 1000, 2e-9, 100000, record_period=10)
+
+	def test_sensitivity_simulation(self):
+		result = sim.simulate_isobar_adiabatic(
+			self.water_cluster_input, self.initial_mole_fractions, 1000, 2e-9, 100000, record_period=10,
+			sensitivity=sens.SensitivityAnalysis(rtol=1e-8, atol=1e-10))
+
+		self.assertIsInstance(result, sens.SensitivityTrajectory)
+		np_test.assert_allclose(result.values, self.reference.values, rtol=1e-6)
+		self.assertEqual(result.sensitivities.shape, (100, 7, 8))
+		self.assertEqual(result.sensitivity_species, result.species_names)
+		self.assertEqual(result.sensitivity_parameters[0], 'H2O + H3O+ + N2 => H3O+(H2O) + N2')
+
+		# compare with a finite difference of a simulation with perturbed rate constant:
+		perturbation = 1.01
+		cache = MechanismCache()
+		cache.get(self.water_cluster_input).solution.set_multiplier(perturbation, 0)
+		perturbed = sim.simulate_isobar_adiabatic(
+			self.water_cluster_input, self.initial_mole_fractions, 1000, 2e-9, 100000, record_period=10,
+			mechanism_cache=cache)
+		fd_sensitivity = np.log(perturbed.loc['H3O+', 5] / self.reference.loc['H3O+', 5]) / np.log(perturbation)
+		self.assertAlmostEqual(result.sensitivity('H3O+', 0).iloc[5], fd_sensitivity, delta=0.02*abs(fd_sensitivity))
+
+		table = result.sensitivity_table()
+		self.assertEqual(table.shape, (7, 8))
+		self.assertEqual(table.loc['H3O+'].iloc[0], result.sensitivity('H3O+', 0).iloc[-1])
+
+		with self.assertRaises(ValueError):
+			result.sensitivity('H3O+', 'A => B')
+
+	def test_selected_reactions_and_species(self):
+		analysis = sens.SensitivityAnalysis(
+			reactions=['H2O + H3O+ + N2 => H3O+(H2O) + N2', 3], species=['H3O+', 'H3O+(H2O)'])
+		chunks = list(sim.simulate_isobar_adiabatic_chunked(
+			self.water_cluster_input, self.initial_mole_fractions, 1000, 2e-9, 100000, chunk_size=300,
+			sensitivity=analysis))
+
+		self.assertEqual([chunk.sensitivities.shape for chunk in chunks],
+		                 [(300, 2, 2), (300, 2, 2), (300, 2, 2), (100, 2, 2)])
+		self.assertEqual(chunks[0].sensitivity_species, ['H3O+', 'H3O+(H2O)'])
+
+		with self.assertRaises(ValueError):
+			sim.simulate_isobar_adiabatic(
+				self.water_cluster_input, self.initial_mole_fractions, 1000, 2e-9, 100000,
+				sensitivity=sens.SensitivityAnalysis(reactions=[100]))
+		with self.assertRaises(ValueError):
+			sim.simulate_isobar_adiabatic(
+				self.water_cluster_input, self.initial_mole_fractions, 1000, 2e-9, 100000, integrator_steps=True,
+				sensitivity=sens.SensitivityAnalysis())
@@ -2,6 +2,7 @@ import unittest
 import numpy.testing as np_test
 import numpy as np
 import os
+import kineticsPy as kpy
 import kineticsPy.cantera.simulation as sim
 
 
@@ -111,4 +112,85 @@ class TestCanteraAnalysis(unittest.TestCase):
 					sim_result[999, 4:],
 					np.array([1.304673e+07, 8.699823e+10, 8.684450e+11], dtype='float64'),
 					rtol=1e-6
-				)
\ No newline at end of file
+				)
+
+	def test_chunked_isobar_adiabatic_simulation(self):
+		reference = sim.simulate_isobar_adiabatic(
+			self.water_cluster_input,
+			'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10',
+			10000, 2e-7, 100000, record_period=7)
+
+		chunks = list(sim.simulate_isobar_adiabatic_chunked(
+			self.water_cluster_input,
+			'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10',
+			10000, 2e-7, 100000, record_period=7, chunk_size=500))
+
+		# 1429 recorded time steps in chunks of 500:
+		self.assertEqual([chunk.number_of_timesteps for chunk in chunks], [500, 500, 429])
+		self.assertEqual(chunks[0].attributes['pressure'], 100000)
+
+		sim_result = kpy.concatenate_trajectories(chunks)
+		self.assertEqual(sim_result.species_names, reference.species_names)
+		np_test.assert_allclose(sim_result.times, reference.times)
+		np_test.assert_allclose(sim_result[:, :], reference[:, :], rtol=1e-6)
+
+		with self.assertRaises(ValueError):
+			sim.simulate_isobar_adiabatic_chunked(
+				self.water_cluster_input, 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10',
+				10000, 2e-7, 100000, chunk_size=0)
+
+	def test_isobar_adiabatic_simulation_with_integrator_steps(self):
+		reference = sim.simulate_isobar_adiabatic(
+			self.water_cluster_input,
+			'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10',
+			10000, 2e-9, 100000, record_period=7)
+
+		sim_result = sim.simulate_isobar_adiabatic(
+			self.water_cluster_input,
+			'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10',
+			10000, 2e-9, 100000, record_period=7, integrator_steps=True)
+
+		self.assertEqual(sim_result.species_names, reference.species_names)
+		np_test.assert_allclose(sim_result.times, reference.times)
+		np_test.assert_allclose(sim_result[0, :], reference[0, :])
+
+		# interpolated concentrations deviate slightly from the directly calculated concentrations:
+		max_concentrations = reference[:, :].max(axis=0).values
+		np_test.assert_allclose(
+			sim_result[:, :].values / max_concentrations, reference[:, :].values / max_concentrations, atol=1e-3)
+
+	def test_isobar_adiabatic_simulation_progress_reporting(self):
+		reports = []
+		sim.simulate_isobar_adiabatic(
+			self.water_cluster_input,
+			'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10',
+			10000, 2e-7, 100000,
+			progress=lambda step, n_steps, time: reports.append((step, n_steps, time)),
+			progress_period=3000)
+
+		self.assertEqual([r[0] for r in reports], [0, 3000, 6000, 9000])
+		self.assertTrue(all(r[1] == 10000 for r in reports))
+		self.assertAlmostEqual(reports[-1][2], 9000 * 2e-7)
+
+	def test_isothermal_and_isochoric_simulations(self):
+		reference = sim.simulate_isobar_adiabatic(
+			self.water_cluster_input, 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10', 1000, 2e-9, 100000, record_period=10)
+		max_concentrations = reference[:, :].max(axis=0).values
+
+		# the temperature change of the water cluster system is negligible, all reactor modes give the same result:
+		for simulation_function in (sim.simulate_isobar_isothermal, sim.simulate_isochoric_adiabatic,
+		                            sim.simulate_isochoric_isothermal):
+			with self.subTest(simulation_function=simulation_function.__name__):
+				sim_result = simulation_function(
+					self.water_cluster_input, 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10', 1000, 2e-9, 100000,
+					record_period=10)
+				self.assertEqual(sim_result.species_names, reference.species_names)
+				np_test.assert_allclose(sim_result.times, reference.times)
+				np_test.assert_allclose(
+					sim_result[:, :].values / max_concentrations, reference[:, :].values / max_concentrations,
+					atol=1e-5)
+
+		with self.assertRaises(ValueError):
+			sim._run_simulation(
+				kpy.cantera.load_mechanism(self.water_cluster_input), 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10',
+				10, 2e-9, None, 100000, reactor_mode='isenthalpic')
@@ -0,0 +1,78 @@
+import unittest
+import numpy.testing as np_test
+import numpy as np
+import os
+import kineticsPy.cantera.simulation as sim
+import kineticsPy.cantera.sweep as sweep
+
+
+class TestCanteraSweep(unittest.TestCase):
+
+	@classmethod
+	def setUpClass(cls):
+		data_base_path = os.path.join('test_inputs')
+		cls.water_cluster_input = os.path.join(data_base_path, 'WaterCluster_RoomTemp.cti')
+		cls.initial_mole_fractions = 'H2O:2.5e+14, N2:2.54e+17, H3O+:1e+10'
+
+	def test_parameter_grid(self):
+		grid = sweep.parameter_grid(pressure=[1e4, 1e5], rtol=(1e-9, 1e-11), initial_mole_fractions='H2O:1.0')
+
+		self.assertEqual(len(grid), 4)
+		self.assertEqual(grid[0], {'pressure': 1e4, 'rtol': 1e-9, 'initial_mole_fractions': 'H2O:1.0'})
+		self.assertEqual(grid[3], {'pressure': 1e5, 'rtol': 1e-11, 'initial_mole_fractions': 'H2O:1.0'})
+
+	def test_sweep_reproduces_serial_simulations(self):
+		pressures = [5e4, 1e5, 2e5]
+		result = sweep.simulate_isobar_adiabatic_sweep(
+			self.water_cluster_input,
+			sweep.parameter_grid(pressure=pressures),
+			max_workers=2,
+			initial_mole_fractions=self.initial_mole_fractions, n_steps=1000, dt=2e-9)
+
+		self.assertEqual(len(result), 3)
+		self.assertEqual(result.succeeded, [0, 1, 2])
+		self.assertEqual(result.failed, [])
+
+		for pressure, tra in zip(pressures, result):
+			serial_result = sim.simulate_isobar_adiabatic(
+				self.water_cluster_input, self.initial_mole_fractions, 1000, 2e-9, pressure)
+
+			self.assertEqual(tra.attributes['pressure'], pressure)
+			self.assertEqual(tra.species_names, serial_result.species_names)
+			np_test.assert_allclose(tra[:, :], serial_result[:, :], rtol=1e-6)
+
+	def test_sweep_with_custom_steps(self):
+		times = np.linspace(0, 1e-5, 100)
+		result = sweep.simulate_isobar_adiabatic_sweep(
+			self.water_cluster_input,
+			[{'custom_steps': times}],
+			initial_mole_fractions=self.initial_mole_fractions, pressure=1e5)
+
+		np_test.assert_allclose(result[0].times, times)
+
+	def test_sweep_with_failing_runs(self):
+		parameter_sets = [
+			{'n_steps': 100, 'dt': 2e-9},
+			{'n_steps': 100},  # missing time step length
+			{'n_steps': 1000000000, 'dt': 2e-9, 'record_period': 1000},  # far too long for timeout
+			{'n_steps': 100, 'dt': 2e-9, 'presure': 1e4},  # misspelled parameter name
+			{'n_steps': 100, 'dt': 2e-9, 'progress_period': 10}  # no progress reporting in sweeps
+		]
+		result = sweep.simulate_isobar_adiabatic_sweep(
+			self.water_cluster_input, parameter_sets, max_workers=2, timeout=5.0,
+			initial_mole_fractions=self.initial_mole_fractions, pressure=1e5)
+
+		self.assertEqual(result.succeeded, [0])
+		self.assertEqual(result.failed, [1, 2, 3, 4])
+		self.assertEqual(result[0].number_of_timesteps, 100)
+		self.assertIsNone(result[1])
+		self.assertIsInstance(result.errors[1], ValueError)
+		self.assertTrue('dt' in str(result.errors[1]))
+		self.assertIsInstance(result.errors[2], TimeoutError)
+		self.assertIsInstance(result.errors[3], ValueError)
+		self.assertTrue('presure' in str(result.errors[3]))
+		self.assertIsInstance(result.errors[4], ValueError)
+
+	def test_sweep_with_invalid_input_file(self):
+		with self.assertRaises(ValueError):
+			sweep.simulate_isobar_adiabatic_sweep('i_am_not_existing.cti', [{}])